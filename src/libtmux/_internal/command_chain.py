@@ -0,0 +1,190 @@
+"""Run many tmux commands in as few invocations as possible.
+
+Note
+----
+This is an internal API not covered by versioning policy.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import typing as t
+import uuid
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from libtmux.common import CmdMixin
+
+#: Bytes of arguments per invocation. The tmux client sends its arguments to
+#: the server in one message and refuses ("command too long") when they pass
+#: about 16 KiB, far below the operating system's ``ARG_MAX``.
+MAX_COMMAND_BYTES = 16000
+
+
+@dataclasses.dataclass
+class CommandResult:
+    """Outcome of one command run by :func:`run_chain`."""
+
+    args: tuple[str, ...]
+    """The command and its arguments."""
+    stdout: list[str]
+    """Lines the command printed."""
+    stderr: list[str]
+    """tmux's error, empty when the command succeeded."""
+
+    @property
+    def ok(self) -> bool:
+        """True if the command succeeded."""
+        return not self.stderr
+
+
+def command_size(args: Sequence[str]) -> int:
+    """Return the bytes *args* take in a tmux command message.
+
+    Examples
+    --------
+    >>> command_size(["send-keys", "-t", "%1", "ls"])
+    19
+    """
+    return sum(len(arg.encode()) + 1 for arg in args)
+
+
+def chain_arg(arg: str) -> str:
+    r"""Escape a trailing ``;``, which tmux would read as a command separator.
+
+    Examples
+    --------
+    >>> chain_arg(";")
+    '\\;'
+    >>> chain_arg("C-a")
+    'C-a'
+    """
+    return arg[:-1] + "\\;" if arg.endswith(";") else arg
+
+
+def chain_target(obj: CmdMixin) -> tuple[CmdMixin, tuple[str, ...]]:
+    """Return what to run a chain on for *obj*, and the target to add.
+
+    A :class:`~libtmux.Session`, :class:`~libtmux.Window` or
+    :class:`~libtmux.Pane` targets itself by adding ``-t`` to the command
+    it runs -- only the first one of a sequence -- so chained commands on
+    its behalf run on its server and carry ``-t`` each.
+
+    Examples
+    --------
+    >>> chain_target(server) == (server, ())
+    True
+    >>> chain_target(pane) == (server, ("-t", pane.pane_id))
+    True
+    """
+    server: CmdMixin | None = getattr(obj, "server", None)
+    if server is None:
+        return obj, ()
+    return server, ("-t", str(getattr(obj, "id", "")))
+
+
+def run_chain(
+    server: CmdMixin,
+    commands: Iterable[Sequence[str | int]],
+    *,
+    max_bytes: int = MAX_COMMAND_BYTES,
+) -> list[CommandResult]:
+    """Run *commands* on *server*, joined with ``;``, and return each outcome.
+
+    Commands are packed into as few tmux invocations as *max_bytes* allows.
+    Each is followed by a ``display-message`` marker, which splits the
+    output back into per-command results and shows how far tmux got: tmux
+    stops a sequence at its first failing command, so that command is
+    given the error and the commands after it are sent again in the next
+    invocation. A sequence tmux rejects before running anything (an
+    unknown command or flag) is retried one command at a time, so the
+    error lands on the command that caused it.
+
+    Parameters
+    ----------
+    server : :class:`~libtmux.Server`
+        Server to run on, or any object with tmux's ``cmd``.
+    commands : iterable of sequences
+        Commands, each a tmux command name followed by its arguments. An
+        argument ending in ``;`` must be escaped with :func:`chain_arg`.
+    max_bytes : int, optional
+        Argument bytes per invocation. A command larger than this is sent
+        alone.
+
+    Returns
+    -------
+    list of :class:`CommandResult`
+        One per command, in order.
+
+    Examples
+    --------
+    >>> results = run_chain(server, [
+    ...     ["display-message", "-p", "one"],
+    ...     ["send-keys", "-t", "%999999", "lost"],
+    ...     ["display-message", "-p", "three"],
+    ... ])
+    >>> [(result.ok, result.stdout) for result in results]
+    [(True, ['one']), (False, []), (True, ['three'])]
+    >>> results[1].stderr
+    ["can't find pane: %999999"]
+    """
+    queue = [tuple(str(arg) for arg in command) for command in commands]
+    results: list[CommandResult | None] = [None] * len(queue)
+    token = f"libtmux-chain-{uuid.uuid4().hex}"
+    position = 0
+    while position < len(queue):
+        end = position
+        size = command_size(("display-message", "-p", f"{token}:start"))
+        while end < len(queue):
+            size += command_size(queue[end]) + command_size(
+                (";", "display-message", "-p", f"{token}:{end}", ";"),
+            )
+            if size > max_bytes and end > position:
+                break
+            end += 1
+        position = _run(server, queue, position, end, token, results)
+    return t.cast("list[CommandResult]", results)
+
+
+def _run(
+    server: CmdMixin,
+    queue: list[tuple[str, ...]],
+    start: int,
+    end: int,
+    token: str,
+    results: list[CommandResult | None],
+) -> int:
+    """Run ``queue[start:end]`` as one sequence; return the next position."""
+    argv: list[str] = ["display-message", "-p", f"{token}:start"]
+    for index in range(start, end):
+        argv += [";", *queue[index], ";", "display-message", "-p", f"{token}:{index}"]
+    proc = server.cmd(*argv)
+
+    started = False
+    done = start
+    output: list[str] = []
+    for line in proc.stdout:
+        if line.startswith(f"{token}:"):
+            mark = line[len(token) + 1 :]
+            if mark == "start":
+                started = True
+            else:
+                results[done] = CommandResult(queue[done], output, [])
+                done = int(mark) + 1
+            output = []
+        else:
+            output.append(line)
+    if done == end:
+        return end
+
+    if not started and end - start > 1:
+        # tmux rejected the whole sequence while parsing it; find the
+        # culprit by running the commands one at a time.
+        for index in range(start, end):
+            _run(server, queue, index, index + 1, token, results)
+        return end
+
+    stderr = proc.stderr or [f"{queue[done][0]}: no result from tmux"]
+    results[done] = CommandResult(queue[done], output, stderr)
+    return done + 1
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import io
 import typing as t
 from dataclasses import dataclass, field
 
@@ -1099,10 +1098,10 @@ class Hooks(
 
         The parsing pipeline:
 
-        1. ``parse_options_to_dict()`` - Parse "key value" lines into dict
-        2. ``explode_arrays(force_array=True)`` - Extract array indices into SparseArray
-        3. ``explode_complex()`` - Handle complex option types
-        4. Rename keys: ``session-renamed`` → ``session_renamed``
+        1. ``parse_options(force_array=True)`` - Parse "key value" lines, storing
+           array indices into SparseArray as they are read
+        2. ``explode_complex()`` - Handle complex option types
+        3. Rename keys: ``session-renamed`` → ``session_renamed``
 
         Parameters
         ----------
@@ -1143,20 +1142,9 @@ class Hooks(
         >>> hooks_empty.session_renamed.as_list()
         []
         """
-        from libtmux.options import (
-            explode_arrays,
-            explode_complex,
-            parse_options_to_dict,
-        )
-
-        output_exploded = explode_complex(
-            explode_arrays(
-                parse_options_to_dict(
-                    io.StringIO("\n".join(value)),
-                ),
-                force_array=True,
-            ),
-        )
+        from libtmux.options import explode_complex, parse_options
+
+        output_exploded = explode_complex(parse_options(value, force_array=True))
 
         assert is_sparse_array_list(output_exploded)
 
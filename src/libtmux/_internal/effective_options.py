@@ -0,0 +1,135 @@
+"""A pane's options across every scope, read in one tmux call.
+
+Note
+----
+This is an internal API not covered by versioning policy.
+"""
+
+from __future__ import annotations
+
+import functools
+import typing as t
+from collections.abc import Mapping
+
+from libtmux._internal.command_chain import run_chain
+from libtmux._internal.constants import Options
+from libtmux.constants import OptionScope
+from libtmux.options import (
+    convert_values,
+    explode_complex,
+    parse_options,
+    raise_option_errors,
+)
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from libtmux.pane import Pane
+
+
+class OptionSource(t.NamedTuple):
+    """Where a value in :class:`EffectiveOptions` was set.
+
+    *global_* is True for the global session and window tables
+    (``set-option -g`` / ``-gw``), which sessions and windows inherit from.
+    """
+
+    scope: OptionScope
+    global_: bool
+
+
+class EffectiveOptions(Mapping[str, t.Any]):
+    """The options in effect for a pane, and where each one was set.
+
+    A snapshot: values are those tmux held when it was taken, and the
+    :attr:`typed` view is built once. Take a new one with
+    :meth:`libtmux.Pane.effective_options` to see later changes.
+
+    Values resolve the way tmux looks them up for a pane: pane, window,
+    global window, session, global session, then server options. Array
+    options are taken whole from the nearest scope that sets them.
+    """
+
+    def __init__(self, layers: Mapping[OptionSource, Mapping[str, t.Any]]) -> None:
+        """Merge *layers*, given from the most distant scope to the nearest."""
+        self._values: dict[str, t.Any] = {}
+        self._sources: dict[str, OptionSource] = {}
+        for source, options in layers.items():
+            for option, value in options.items():
+                self._values[option] = value
+                self._sources[option] = source
+
+    def __getitem__(self, option: str) -> t.Any:
+        """Return the value in effect for *option*."""
+        return self._values[option]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the option names."""
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        """Return the number of options."""
+        return len(self._values)
+
+    def source(self, option: str) -> OptionSource:
+        """Return where the value in effect for *option* was set.
+
+        Raises
+        ------
+        :exc:`KeyError`
+            If no scope sets *option*.
+        """
+        return self._sources[option]
+
+    @functools.cached_property
+    def typed(self) -> Options:
+        """The values as an :class:`~libtmux._internal.constants.Options`."""
+        return Options(**self._values)
+
+    def __repr__(self) -> str:
+        """Represent the snapshot by its size."""
+        return f"{self.__class__.__name__}({len(self)} options)"
+
+
+def effective_options(pane: Pane) -> EffectiveOptions:
+    """Read every scope's options for *pane* in one chain and merge them."""
+    layers: dict[OptionSource, list[str]] = {
+        OptionSource(OptionScope.Server, False): ["show-options", "-s"],
+        OptionSource(OptionScope.Session, True): ["show-options", "-g"],
+        OptionSource(OptionScope.Session, False): [
+            "show-options",
+            "-t",
+            str(pane.session_id),
+        ],
+        OptionSource(OptionScope.Window, True): ["show-options", "-gw"],
+        OptionSource(OptionScope.Window, False): [
+            "show-options",
+            "-w",
+            "-t",
+            str(pane.window_id),
+        ],
+        OptionSource(OptionScope.Pane, False): [
+            "show-options",
+            "-p",
+            "-t",
+            str(pane.pane_id),
+        ],
+    }
+    results = run_chain(pane.server, list(layers.values()))
+    raise_option_errors(
+        [
+            f"{'global ' if source.global_ else ''}{source.scope.name.lower()}"
+            for source in layers
+        ],
+        results,
+        "show-options",
+    )
+    return EffectiveOptions(
+        {
+            source: t.cast(
+                "dict[str, t.Any]",
+                convert_values(explode_complex(parse_options(result.stdout))),
+            )
+            for source, result in zip(layers, results, strict=True)
+        },
+    )
@@ -0,0 +1,148 @@
+"""Many format strings evaluated against many tmux objects in one call.
+
+Note
+----
+This is an internal API not covered by versioning policy.
+"""
+
+from __future__ import annotations
+
+import typing as t
+import uuid
+
+from libtmux import exc
+from libtmux._internal.command_chain import chain_arg, run_chain
+
+if t.TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from libtmux.common import CmdMixin
+
+#: The listing that expands formats for each kind of object, by the first
+#: character of its ID.
+LIST_COMMANDS: dict[str, tuple[str, ...]] = {
+    "$": ("list-sessions",),
+    "@": ("list-windows", "-a"),
+    "%": ("list-panes", "-a"),
+}
+
+#: The format giving each kind of object's ID.
+_ID_FORMATS = {"$": "session_id", "@": "window_id", "%": "pane_id"}
+
+#: tmux's word for each kind of object, as in its "can't find" errors.
+_KINDS = {"$": "session", "@": "window", "%": "pane"}
+
+
+def evaluate_formats(
+    server: CmdMixin,
+    targets: Sequence[str] | None,
+    formats: Mapping[str, str],
+) -> dict[str, dict[str, str]]:
+    """Expand *formats* for each of *targets*, by ID, in one tmux invocation.
+
+    Every kind of object among *targets* is listed once, with a ``-F``
+    template holding all of *formats*. Each record and field starts with a
+    token unique to the call, so values may hold any text, newlines
+    included. All listings go out as one chained sequence (see
+    :func:`~libtmux._internal.command_chain.run_chain`).
+
+    Parameters
+    ----------
+    server : :class:`~libtmux.Server`
+        Server to run on.
+    targets : sequence of str, optional
+        Session (``$``), window (``@``) and pane (``%``) IDs. Default:
+        every pane.
+    formats : dict
+        tmux format strings by the name to return them under.
+
+    Returns
+    -------
+    dict
+        The expanded formats by name, for each target ID in the order
+        given.
+
+    Raises
+    ------
+    :exc:`~libtmux.exc.BatchError`
+        Listing, by target ID (or listing command), what could not be
+        evaluated.
+
+    Examples
+    --------
+    >>> values = evaluate_formats(
+    ...     server,
+    ...     [pane.pane_id, window.window_id],
+    ...     {"where": "#{session_name}:#{window_index}", "size": "#{pane_width}"},
+    ... )
+    >>> values[window.window_id]["where"] == f"{session.name}:{window.index}"
+    True
+    >>> values[pane.pane_id]["size"] == str(pane.pane_width)
+    True
+    """
+    names = list(formats)
+    kinds = dict.fromkeys(
+        ["%"] if targets is None else [target[:1] for target in targets],
+    )
+    token = f"libtmux-format-{uuid.uuid4().hex}:"
+    listed = [kind for kind in kinds if kind in LIST_COMMANDS]
+    results = run_chain(
+        server,
+        [
+            [
+                *LIST_COMMANDS[kind],
+                "-F",
+                chain_arg(
+                    f"{token}#{{{_ID_FORMATS[kind]}}}"
+                    + "".join(token + formats[name] for name in names),
+                ),
+            ]
+            for kind in listed
+        ],
+    )
+
+    found: dict[str, dict[str, str]] = {}
+    errors: dict[str, str] = {}
+    for result in results:
+        if not result.ok:
+            errors[result.args[0]] = "\n".join(result.stderr)
+            continue
+        for record in _records(result.stdout, token):
+            object_id, *values = record.split(token)[1:]
+            found[object_id] = dict(zip(names, values, strict=True))
+
+    if targets is None:
+        evaluated = found
+    else:
+        evaluated = {}
+        for target in targets:
+            if target in found:
+                evaluated[target] = found[target]
+            elif target[:1] in _KINDS:
+                if LIST_COMMANDS[target[:1]][0] not in errors:
+                    errors[target] = f"can't find {_KINDS[target[:1]]}: {target}"
+            else:
+                errors[target] = "not a session, window or pane ID"
+    if errors:
+        raise exc.BatchError(errors, subcommand="evaluate-formats")
+    return evaluated
+
+
+def _records(lines: Sequence[str], token: str) -> list[str]:
+    r"""Join output *lines* into records, each starting with *token*.
+
+    A line that does not start with *token* continues a value that held a
+    newline.
+
+    Examples
+    --------
+    >>> _records(["t:%1t:a", "t:%2t:b", "c"], "t:")
+    ['t:%1t:a', 't:%2t:b\nc']
+    """
+    records: list[str] = []
+    for line in lines:
+        if line.startswith(token) or not records:
+            records.append(line)
+        else:
+            records[-1] += "\n" + line
+    return records
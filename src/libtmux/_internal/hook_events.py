@@ -0,0 +1,272 @@
+"""Python callbacks for tmux hooks, delivered through a FIFO.
+
+Note
+----
+This is an internal API not covered by versioning policy.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pathlib
+import shutil
+import tempfile
+import threading
+import typing as t
+import uuid
+
+from libtmux._internal.command_chain import run_chain
+from libtmux.options import parse_options_to_dict, raise_option_errors
+
+if t.TYPE_CHECKING:
+    import types
+    from collections.abc import Callable, Sequence
+
+    from typing_extensions import Self
+
+    from libtmux.server import Server
+
+logger = logging.getLogger(__name__)
+
+#: Formats every :class:`HookEvent` carries: the hook's name, the client,
+#: session, window and pane a notification hook fired for (empty when not
+#: relevant, and for ``after-*`` hooks), and the IDs of the hook's target.
+EVENT_FORMATS = (
+    "hook",
+    "hook_client",
+    "hook_session",
+    "hook_window",
+    "hook_pane",
+    "session_id",
+    "window_id",
+    "pane_id",
+)
+
+#: Separates the fields of an event line; tmux's ``q`` modifier does not
+#: escape it, but it cannot appear in the formats events carry in practice.
+_SEPARATOR = "\x1f"
+
+#: Bytes requested per :func:`os.read` on the FIFO.
+_READ_SIZE = 65536
+
+
+class HookEvent(t.NamedTuple):
+    """A tmux hook that fired, as passed to a :meth:`libtmux.Server.on` callback."""
+
+    name: str
+    """The hook subscribed to, e.g. ``"pane-exited"``."""
+    context: dict[str, str]
+    """Each requested format, expanded when the hook ran."""
+
+
+class HookSubscription:
+    """A callback registered with :meth:`libtmux.Server.on`.
+
+    :meth:`cancel`, or leaving a ``with`` block, removes the tmux hook that
+    delivers its events.
+    """
+
+    def __init__(
+        self,
+        bus: HookBus,
+        event: str,
+        callback: Callable[[HookEvent], object],
+        formats: Sequence[str],
+        token: str,
+    ) -> None:
+        self._bus = bus
+        self.event = event
+        self.callback = callback
+        self.formats = tuple(formats)
+        self.token = token
+        self.index: int | None = None
+
+    @property
+    def active(self) -> bool:
+        """True until the subscription is cancelled."""
+        return self._bus.is_subscribed(self)
+
+    def cancel(self) -> None:
+        """Remove the hook and stop calling the callback. Safe to repeat."""
+        self._bus.unsubscribe(self)
+
+    def __enter__(self) -> Self:
+        """Return the subscription."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_tb: types.TracebackType | None,
+    ) -> None:
+        """Cancel the subscription."""
+        self.cancel()
+
+    def __repr__(self) -> str:
+        """Represent the subscription by its hook."""
+        return f"{self.__class__.__name__}({self.event!r}, index={self.index})"
+
+
+class HookBus:
+    """Dispatch one server's tmux hooks to Python callbacks.
+
+    Each subscription appends a global hook running ``run-shell -b``, which
+    writes one line -- a token naming the subscription, then the requested
+    formats quoted with ``#{q:...}`` -- into a FIFO this process owns. A
+    daemon thread blocks reading the FIFO and calls the callbacks, so an
+    idle subscription costs no process and no polling. The FIFO and thread
+    exist only while there are subscriptions.
+
+    Callbacks run on that thread, one at a time, in the order tmux ran the
+    hooks. An exception in a callback is logged and does not stop others.
+    """
+
+    def __init__(self, server: Server) -> None:
+        self.server = server
+        self._lock = threading.Lock()
+        self._subscriptions: dict[str, HookSubscription] = {}
+        self._path: pathlib.Path | None = None
+        self._fd = -1
+
+    def subscribe(
+        self,
+        event: str,
+        callback: Callable[[HookEvent], object],
+        formats: Sequence[str] = (),
+    ) -> HookSubscription:
+        """Append a hook for *event* that calls *callback* with *formats*.
+
+        Raises
+        ------
+        :exc:`~libtmux.exc.OptionBatchError`
+            If tmux rejects the hook, for instance an unknown hook name.
+        """
+        names = [
+            *EVENT_FORMATS,
+            *(name for name in formats if name not in EVENT_FORMATS),
+        ]
+        with self._lock:
+            self._start()
+            subscription = HookSubscription(
+                self, event, callback, names, uuid.uuid4().hex
+            )
+            self._subscriptions[subscription.token] = subscription
+            try:
+                results = run_chain(
+                    self.server,
+                    [
+                        ["set-hook", "-ga", event, self._command(subscription)],
+                        ["show-hooks", "-g", event],
+                    ],
+                )
+                raise_option_errors([event, event], results, "set-hook")
+            except BaseException:
+                self._forget(subscription)
+                raise
+            finally:
+                self.server._note_option_write()
+            for key, value in parse_options_to_dict(results[1].stdout).items():
+                if value is not None and subscription.token in value:
+                    subscription.index = int(key[key.index("[") + 1 : -1])
+        return subscription
+
+    def is_subscribed(self, subscription: HookSubscription) -> bool:
+        """Return whether *subscription* is still registered."""
+        return self._subscriptions.get(subscription.token) is subscription
+
+    def unsubscribe(self, subscription: HookSubscription) -> None:
+        """Remove *subscription*'s hook; stop the reader after the last one."""
+        with self._lock:
+            if not self.is_subscribed(subscription):
+                return
+            self._forget(subscription)
+        if subscription.index is not None:
+            # The server may be gone, or the hook unset by someone else.
+            self.server.cmd(
+                "set-hook",
+                "-gu",
+                f"{subscription.event}[{subscription.index}]",
+            )
+            self.server._note_option_write()
+
+    def _command(self, subscription: HookSubscription) -> str:
+        """Return the tmux command that reports *subscription*'s event."""
+        assert self._path is not None
+        pattern = "%s" + r"\037%s" * len(subscription.formats) + r"\n"
+        fields = " ".join(f"x#{{q:{name}}}" for name in subscription.formats)
+        shell = (
+            f'[ -p "{self._path}" ] && '
+            f'printf "{pattern}" {subscription.token} {fields} > "{self._path}"'
+        )
+        return f"run-shell -b '{shell}'"
+
+    def _start(self) -> None:
+        """Create the FIFO and its reader; the caller holds the lock."""
+        if self._path is not None:
+            return
+        directory = pathlib.Path(tempfile.mkdtemp(prefix="libtmux-hooks-"))
+        path = directory / "events"
+        try:
+            os.mkfifo(path, 0o600)
+            # Read and write: the FIFO never reports end-of-file between
+            # events, and writing to it wakes the reader to stop.
+            fd = os.open(path, os.O_RDWR)
+        except BaseException:
+            shutil.rmtree(directory, ignore_errors=True)
+            raise
+        self._path, self._fd = path, fd
+        threading.Thread(
+            target=self._run,
+            args=(fd, directory),
+            name="libtmux-hooks",
+            daemon=True,
+        ).start()
+
+    def _forget(self, subscription: HookSubscription) -> None:
+        """Drop *subscription*; the caller holds the lock."""
+        del self._subscriptions[subscription.token]
+        if not self._subscriptions and self._path is not None:
+            # An empty line tells the reader to close the FIFO and exit.
+            os.write(self._fd, b"\n")
+            self._path, self._fd = None, -1
+
+    def _run(self, fd: int, directory: pathlib.Path) -> None:
+        """Read event lines from *fd* and dispatch them until told to stop."""
+        pending = b""
+        try:
+            while True:
+                pending += os.read(fd, _READ_SIZE)
+                *lines, pending = pending.split(b"\n")
+                for line in lines:
+                    if not line:
+                        return
+                    self._dispatch(line.decode(errors="replace"))
+        finally:
+            os.close(fd)
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def _dispatch(self, line: str) -> None:
+        """Call the callback an event line is addressed to."""
+        token, *values = line.split(_SEPARATOR)
+        subscription = self._subscriptions.get(token)
+        if subscription is None:
+            return
+        event = HookEvent(
+            subscription.event,
+            dict(
+                zip(
+                    subscription.formats,
+                    (value[1:] for value in values),
+                    strict=False,
+                ),
+            ),
+        )
+        try:
+            subscription.callback(event)
+        except Exception:
+            logger.exception(
+                "hook callback failed",
+                extra={"tmux_hook": subscription.event},
+            )
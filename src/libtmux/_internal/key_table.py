@@ -0,0 +1,134 @@
+"""Key bindings parsed from ``list-keys``, indexed by table and key.
+
+Note
+----
+This is an internal API not covered by versioning policy.
+"""
+
+from __future__ import annotations
+
+import re
+import typing as t
+from collections.abc import Mapping
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+#: One line of ``list-keys``: the key is escaped (``\;``) or quoted
+#: (``"M-{"``), and the command is the rest of the line, in tmux syntax.
+_BINDING = re.compile(
+    r"""bind-key\s+(?P<repeat>-r\s+)?-T\s+(?P<table>\S+)\s+"""
+    r"""(?P<key>"(?:[^"\\]|\\.)*"|'[^']*'|(?:\\.|\S)+)\s+(?P<command>.*)""",
+)
+
+#: A backslash escape in a key.
+_KEY_ESCAPE = re.compile(r"\\(.)")
+
+#: A quoted string, or a ``\;`` standing alone: ``list-keys`` escapes the
+#: separators of a command sequence, as the arguments of ``bind-key``.
+_ESCAPED_SEPARATOR = re.compile(
+    r"""(?P<quoted>"(?:[^"\\]|\\.)*"|'[^']*')|(?<!\S)\\;(?!\S)""",
+)
+
+
+class KeyBinding(t.NamedTuple):
+    """A key bound in a tmux key table."""
+
+    table: str
+    key: str
+    command: str
+    """The command, in tmux syntax, as :meth:`libtmux.Server.bind_key` takes it."""
+    repeat: bool = False
+
+
+class KeyTable(Mapping[tuple[str, str], KeyBinding]):
+    r"""A server's key bindings by ``(table, key)``.
+
+    Parsed once from ``list-keys``; :meth:`libtmux.Server.key_table` keeps
+    one until libtmux binds or unbinds a key.
+
+    Examples
+    --------
+    >>> keys = KeyTable.parse([
+    ...     r'bind-key    -T prefix       \;                   last-pane',
+    ...     'bind-key -r -T prefix       Up                   select-pane -U',
+    ...     'bind-key    -T copy-mode    "M-{"     send-keys -X previous-paragraph',
+    ... ])
+    >>> keys["prefix", ";"].command
+    'last-pane'
+    >>> KeyTable.parse([
+    ...     r'bind-key -T root MouseDown1Pane select-pane -t = \; send-keys -M',
+    ... ])["root", "MouseDown1Pane"].command
+    'select-pane -t = ; send-keys -M'
+    >>> keys["prefix", "Up"].repeat
+    True
+    >>> keys.tables
+    ['prefix', 'copy-mode']
+    >>> list(keys.table("copy-mode"))
+    ['M-{']
+    """
+
+    def __init__(self, bindings: Iterable[KeyBinding]) -> None:
+        self._tables: dict[str, dict[str, KeyBinding]] = {}
+        for binding in bindings:
+            self._tables.setdefault(binding.table, {})[binding.key] = binding
+
+    @classmethod
+    def parse(cls, lines: Iterable[str]) -> KeyTable:
+        """Parse ``list-keys`` output; lines not describing a binding are skipped."""
+        bindings: list[KeyBinding] = []
+        for line in lines:
+            match = _BINDING.fullmatch(line)
+            if match is None:
+                continue
+            bindings.append(
+                KeyBinding(
+                    match["table"],
+                    _unescape_key(match["key"]),
+                    _ESCAPED_SEPARATOR.sub(_unescape_separator, match["command"]),
+                    match["repeat"] is not None,
+                ),
+            )
+        return cls(bindings)
+
+    @property
+    def tables(self) -> list[str]:
+        """Names of the tables with bindings, in ``list-keys`` order."""
+        return list(self._tables)
+
+    def table(self, name: str) -> dict[str, KeyBinding]:
+        """Return the bindings of table *name* by key; empty if it has none."""
+        return dict(self._tables.get(name, {}))
+
+    def __getitem__(self, table_key: tuple[str, str]) -> KeyBinding:
+        """Return the binding of ``(table, key)``."""
+        table, key = table_key
+        return self._tables[table][key]
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        """Iterate over ``(table, key)`` pairs."""
+        for table, bindings in self._tables.items():
+            for key in bindings:
+                yield table, key
+
+    def __len__(self) -> int:
+        """Return the number of bindings."""
+        return sum(len(bindings) for bindings in self._tables.values())
+
+    def __repr__(self) -> str:
+        """Represent the table by its size."""
+        return f"{self.__class__.__name__}({len(self)} bindings)"
+
+
+def _unescape_key(key: str) -> str:
+    """Return a key as ``list-keys`` printed it, without its quoting."""
+    if key[:1] == "'":
+        return key[1:-1]
+    if key[:1] == '"':
+        key = key[1:-1]
+    return _KEY_ESCAPE.sub(r"\1", key)
+
+
+def _unescape_separator(match: re.Match[str]) -> str:
+    r"""Keep a quoted string; turn a ``\;`` separator into ``;``."""
+    return match["quoted"] or ";"
@@ -0,0 +1,114 @@
+"""Opt-in memoization of ``show-options`` and ``show-hooks`` reads.
+
+Note
+----
+This is an internal API not covered by versioning policy.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+from libtmux.common import CmdMixin
+
+if t.TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from libtmux.common import tmux_cmd
+
+#: Control-mode lines that frame command replies or carry pane output
+#: rather than report a change to the server.
+_NOT_CHANGES = ("%begin", "%end", "%error", "%output", "%extended-output")
+
+
+class OptionCacheMixin(CmdMixin):
+    """Serve repeated option and hook reads of one object from memory.
+
+    Off until :meth:`cache_options` is called on the object. Writes made
+    through libtmux -- :meth:`~libtmux.options.OptionsMixin.set_option`,
+    :meth:`~libtmux.hooks.HooksMixin.set_hook` and the others -- count
+    against the object's server, and every cache on that server is
+    dropped on its next read, since a write to one scope can change what
+    another inherits.
+
+    Changes made outside libtmux (another client, a config reload) are not
+    seen until :meth:`invalidate_option_cache` is called, for instance with
+    each notification line of a control-mode client. Subscribing that
+    client to the formats you render (``refresh-client -B``) makes tmux
+    report ``%subscription-changed`` when they change.
+    """
+
+    _option_cache: dict[tuple[str | int, ...], tmux_cmd] | None = None
+    _option_cache_writes = 0
+
+    def cache_options(self, enabled: bool = True) -> Self:
+        """Turn memoizing of this object's option and hook reads on or off.
+
+        Examples
+        --------
+        >>> session.set_option("@theme", "dark").cache_options().show_option("@theme")
+        'dark'
+        >>> session.show_option("@theme")
+        'dark'
+        >>> session.set_option("@theme", "light").show_option("@theme")
+        'light'
+        >>> session.cache_options(False)
+        Session($... ...)
+        """
+        self._option_cache = {} if enabled else None
+        return self
+
+    def invalidate_option_cache(self, notification: str | None = None) -> bool:
+        """Drop memoized reads on every cached object of this server.
+
+        Parameters
+        ----------
+        notification : str, optional
+            A line read from a control-mode client. Only notifications of a
+            change invalidate: command replies and pane output are ignored.
+
+        Returns
+        -------
+        bool
+            Whether the caches were invalidated.
+
+        Examples
+        --------
+        >>> session.invalidate_option_cache("%output %1 hello")
+        False
+        >>> session.invalidate_option_cache("%sessions-changed")
+        True
+        """
+        if notification is not None and (
+            not notification.startswith("%") or notification.startswith(_NOT_CHANGES)
+        ):
+            return False
+        self._note_option_write()
+        return True
+
+    def _cached_cmd(self, subcommand: str, *args: str | int) -> tmux_cmd:
+        """Run a read-only *subcommand*, or return its memoized result."""
+        if self._option_cache is None:
+            return self.cmd(subcommand, *args)
+        writes = _server_writes(self)
+        if writes != self._option_cache_writes:
+            self._option_cache.clear()
+            self._option_cache_writes = writes
+        key = (subcommand, *args)
+        proc = self._option_cache.get(key)
+        if proc is None:
+            proc = self.cmd(subcommand, *args)
+            if not proc.stderr:
+                self._option_cache[key] = proc
+        return proc
+
+    def _note_option_write(self) -> None:
+        """Record that options or hooks on this object's server changed."""
+        server: t.Any = getattr(self, "server", self)
+        server._option_writes = _server_writes(self) + 1
+
+
+def _server_writes(obj: CmdMixin) -> int:
+    """Return how many option writes *obj*'s server has seen."""
+    server: t.Any = getattr(obj, "server", obj)
+    return t.cast("int", getattr(server, "_option_writes", 0))
@@ -0,0 +1,194 @@
+"""Incremental pane capture: only the lines added since the previous call.
+
+Note
+----
+This is an internal API not covered by versioning policy.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import typing as t
+
+from libtmux.common import raise_if_stderr
+
+if t.TYPE_CHECKING:
+    from libtmux.pane import Pane
+
+#: Lines remembered at the end of each capture, to find the position again
+#: after tmux evicts or clears history.
+TAIL_LINES = 3
+
+#: Lines captured above the expected position on the first widening search.
+SEARCH_LINES = 64
+
+#: Captures tried before falling back to one from the start of history.
+MAX_ATTEMPTS = 6
+
+_STATE_FORMAT = "#{history_size} #{cursor_y}"
+
+
+@dataclasses.dataclass(frozen=True)
+class CaptureCursor:
+    """Where :meth:`libtmux.Pane.capture_since` stopped reading a pane.
+
+    Lines are counted from the first line of the pane's history. Treat the
+    cursor as opaque and pass it back to the next call.
+    """
+
+    pane_id: str
+    """Pane the cursor belongs to."""
+    line: int
+    """Index of the first line not yet returned."""
+    history_size: int
+    """The pane's ``#{history_size}`` when the cursor was taken."""
+    tail: tuple[str, ...]
+    """Last lines before :attr:`line`, used to find it again after history
+    moved under it."""
+
+
+@dataclasses.dataclass(frozen=True)
+class PaneCapture:
+    """Lines a pane printed since a :class:`CaptureCursor`."""
+
+    lines: list[str]
+    """New, completed lines -- every row above the cursor row."""
+    cursor: CaptureCursor
+    """Pass to the next :meth:`~libtmux.Pane.capture_since` call."""
+    skipped: bool = False
+    """True when lines were lost before they could be read: history was
+    cleared or evicted past the previous cursor. :attr:`lines` then holds
+    everything the pane still has. A cursor taken before the pane completed
+    any line has nothing to recognize, so it cannot report a loss."""
+
+
+def capture_since(pane: Pane, cursor: CaptureCursor | None = None) -> PaneCapture:
+    """Return the lines *pane* completed after *cursor*.
+
+    Rows are counted from the top of history: a line's position is its row
+    in the visible pane plus ``#{history_size}``. Each call reads the
+    state and captures from just above the previous position in one tmux
+    command, so it costs the new lines plus a few of context. The lines
+    kept in :attr:`CaptureCursor.tail` must still sit right above that
+    position; when they do not (tmux dropped old lines at
+    ``history-limit`` or ``clear-history`` ran) they are searched for
+    further up, widening the capture a few times before giving up and
+    reporting :attr:`PaneCapture.skipped`.
+
+    Parameters
+    ----------
+    pane : :class:`~libtmux.Pane`
+        Pane to read.
+    cursor : :class:`CaptureCursor`, optional
+        Returned by the previous call. ``None`` starts at the top of the
+        pane's history.
+
+    Returns
+    -------
+    :class:`PaneCapture`
+
+    Raises
+    ------
+    ValueError
+        If *cursor* belongs to another pane.
+    :exc:`~libtmux.exc.LibTmuxException`
+        If tmux fails to read the pane.
+    """
+    if cursor is not None and cursor.pane_id != pane.pane_id:
+        msg = f"cursor belongs to pane {cursor.pane_id}, not {pane.pane_id}"
+        raise ValueError(msg)
+
+    line = cursor.line if cursor is not None else 0
+    tail = cursor.tail if cursor is not None else ()
+    history_size = cursor.history_size if cursor is not None else 0
+    above = 0
+    for attempt in range(MAX_ATTEMPTS + 1):
+        start = line - len(tail) - above
+        from_top = start <= 0 or attempt == MAX_ATTEMPTS
+        first, end, new_history_size, rows = _capture(
+            pane,
+            None if from_top else start - history_size,
+        )
+        if not from_top and first > start:
+            # History grew between the previous read and this one, so the
+            # capture began below the lines wanted. Expect as much growth
+            # again on the retry.
+            history_size = 2 * new_history_size - history_size
+            continue
+        history_size = new_history_size
+
+        found = _find_tail(rows, tail, line - first)
+        if found is not None or from_top:
+            new_cursor = CaptureCursor(
+                pane_id=str(pane.pane_id),
+                line=end,
+                history_size=history_size,
+                tail=tuple(rows[-TAIL_LINES:]),
+            )
+            if found is None:
+                return PaneCapture(rows, new_cursor, skipped=bool(tail))
+            return PaneCapture(rows[found:], new_cursor)
+        above = max(SEARCH_LINES, 4 * above)
+
+    msg = "unreachable: the last attempt captures from the top of history"
+    raise AssertionError(msg)
+
+
+def _capture(pane: Pane, start: int | None) -> tuple[int, int, int, list[str]]:
+    """Capture completed rows from *start* (``None``: top of history).
+
+    Returns the first and end line positions covered, the history size the
+    capture saw, and the rows. State and rows come from one tmux command,
+    so no output lands between them.
+    """
+    proc = pane.server.cmd(
+        "display-message",
+        "-p",
+        "-t",
+        str(pane.pane_id),
+        _STATE_FORMAT,
+        ";",
+        "capture-pane",
+        "-p",
+        "-t",
+        str(pane.pane_id),
+        "-S",
+        "-" if start is None else str(start),
+        "-E",
+        "-",
+    )
+    raise_if_stderr(proc, "capture-pane")
+    state, *rows = proc.stdout
+    history_size, cursor_y = (int(value) for value in state.split())
+    # tmux clamps a start above the oldest line to the oldest line.
+    first = 0 if start is None else max(start + history_size, 0)
+    end = history_size + cursor_y
+    # Keep completed rows only; the cursor row may still be written to.
+    # tmux_cmd drops trailing empty lines, so restore blank rows it ate.
+    count = max(end - first, 0)
+    rows = rows[:count] + [""] * (count - len(rows))
+    return first, max(end, first), history_size, rows
+
+
+def _find_tail(rows: list[str], tail: tuple[str, ...], expected: int) -> int | None:
+    """Return the index in *rows* right after *tail*, nearest *expected*.
+
+    Lines only move up (history scrolls, or is evicted or cleared), so the
+    search runs from *expected* towards the top.
+
+    Examples
+    --------
+    >>> _find_tail(["a", "b", "c", "d"], ("b", "c"), 3)
+    3
+    >>> _find_tail(["b", "c", "d", "e"], ("b", "c"), 3)
+    2
+    >>> _find_tail(["x", "y"], ("b", "c"), 2) is None
+    True
+    >>> _find_tail(["x", "y"], (), 0)
+    0
+    """
+    size = len(tail)
+    for index in range(min(expected, len(rows)), size - 1, -1):
+        if tuple(rows[index - size : index]) == tail:
+            return index
+    return None
@@ -0,0 +1,159 @@
+"""Search the history of many panes at once.
+
+Note
+----
+This is an internal API not covered by versioning policy.
+"""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import itertools
+import re
+import typing as t
+
+from libtmux import exc
+from libtmux.common import raise_if_stderr
+from libtmux.neo import _escape_format_argument, _is_target_not_found_error
+
+if t.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from libtmux.server import Server
+
+#: Panes captured per tmux invocation. Small enough that a first-match
+#: search stops soon after the hit, large enough to keep process spawns few.
+GREP_BATCH = 16
+
+#: A batch capture in flight: lines per pane ID, and errors per pane ID.
+_Capture: t.TypeAlias = (
+    "concurrent.futures.Future[tuple[dict[str, list[str]], dict[str, str]]]"
+)
+
+
+class GrepHit(t.NamedTuple):
+    """A line matching :meth:`libtmux.Server.grep`."""
+
+    pane_id: str
+    line_no: int
+    line: str
+
+
+def grep_panes(
+    server: Server,
+    pattern: str | re.Pattern[str],
+    pane_ids: Sequence[str],
+    *,
+    listed: bool,
+    start: t.Literal["-"] | int | None,
+    join_wrapped: bool,
+    first: bool,
+    prefilter: str | None,
+    max_workers: int,
+) -> list[GrepHit]:
+    """Capture *pane_ids* in batches on a thread pool and search each line.
+
+    Batches are captured in pane order and searched in that order as they
+    complete, so hits are ordered by pane, then line. With *first*, the
+    search returns at the first hit and batches not yet started are
+    cancelled.
+
+    A pane that cannot be captured does not stop the search. With
+    *listed*, the panes were listed by libtmux, and those that closed since
+    are left out; other failures are raised together at the end, as a
+    :exc:`~libtmux.exc.BatchError` whose ``results`` holds the hits.
+    """
+    regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+    if prefilter is not None:
+        matching = _prefilter(server, prefilter)
+        pane_ids = [pane_id for pane_id in pane_ids if pane_id in matching]
+    batches = [
+        pane_ids[index : index + GREP_BATCH]
+        for index in range(0, len(pane_ids), GREP_BATCH)
+    ]
+    if not batches:
+        return []
+
+    hits: list[GrepHit] = []
+    errors: dict[str, str] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as pool:
+        # Keep at most max_workers batches in flight, so a first-match
+        # search captures little beyond the batch holding the hit.
+        pending: collections.deque[_Capture] = collections.deque()
+        remaining = iter(batches)
+        try:
+            for batch in itertools.islice(remaining, max_workers):
+                pending.append(
+                    _submit(pool, server, batch, start, join_wrapped, listed),
+                )
+            while pending:
+                captures, failed = pending.popleft().result()
+                errors.update(failed)
+                for batch in itertools.islice(remaining, 1):
+                    pending.append(
+                        _submit(pool, server, batch, start, join_wrapped, listed),
+                    )
+                for pane_id, lines in captures.items():
+                    for line_no, line in enumerate(lines):
+                        if regex.search(line):
+                            hits.append(GrepHit(pane_id, line_no, line))
+                            if first:
+                                return hits
+        finally:
+            for future in pending:
+                future.cancel()
+    if errors:
+        raise exc.BatchError(errors, subcommand="capture-pane", results=hits)
+    return hits
+
+
+def _submit(
+    pool: concurrent.futures.ThreadPoolExecutor,
+    server: Server,
+    batch: Sequence[str],
+    start: t.Literal["-"] | int | None,
+    join_wrapped: bool,
+    listed: bool,
+) -> _Capture:
+    """Capture *batch* on *pool*."""
+    return pool.submit(_capture, server, batch, start, join_wrapped, listed)
+
+
+def _capture(
+    server: Server,
+    batch: Sequence[str],
+    start: t.Literal["-"] | int | None,
+    join_wrapped: bool,
+    listed: bool,
+) -> tuple[dict[str, list[str]], dict[str, str]]:
+    """Capture *batch*; return the captures and the panes that failed.
+
+    With *listed*, panes that no longer exist are dropped, not failed.
+    """
+    try:
+        return server.capture_many(batch, start, join_wrapped=join_wrapped), {}
+    except exc.BatchError as error:
+        failed = {
+            pane_id: message
+            for pane_id, message in error.errors.items()
+            if not (listed and _is_target_not_found_error(message))
+        }
+        return t.cast("dict[str, list[str]]", error.results), failed
+
+
+def _prefilter(server: Server, pattern: str) -> set[str]:
+    """Return the IDs of panes whose visible screen matches *pattern*.
+
+    The search runs inside tmux as ``#{C/r:pattern}``, one ``list-panes``
+    for the whole server.
+    """
+    escaped = _escape_format_argument(pattern)
+    proc = server.cmd("list-panes", "-a", "-F", f"#{{pane_id}} #{{C/r:{escaped}}}")
+    raise_if_stderr(proc, "list-panes")
+    matching: set[str] = set()
+    for line in proc.stdout:
+        pane_id, _, found = line.partition(" ")
+        if found not in {"", "0"}:
+            matching.add(pane_id)
+    return matching
@@ -0,0 +1,195 @@
+"""Memory-mapped access to pane history exported to a file.
+
+Note
+----
+This is an internal API not covered by versioning policy.
+"""
+
+from __future__ import annotations
+
+import bisect
+import mmap
+import pathlib
+import re
+import typing as t
+from array import array
+
+if t.TYPE_CHECKING:
+    import types
+    from collections.abc import Iterator
+
+    from typing_extensions import Self
+
+    from libtmux._internal.types import StrPath
+
+
+class PaneHistory:
+    r"""Lines of an exported pane history, read through :mod:`mmap`.
+
+    The file stays on disk: the operating system pages in only what is
+    indexed or searched, so a 100,000-line history costs the line index
+    (eight bytes a line, built on first use) rather than a list of strings.
+
+    Open one with :meth:`libtmux.Pane.export_history`, or on any file of
+    newline-separated text. Close it, or use it in a ``with`` block, to
+    release the mapping.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        File to map.
+    encoding : str, optional
+        Encoding used to decode lines and encode ``str`` patterns. Default
+        ``"utf-8"``.
+    errors : str, optional
+        Decoding error handler. Default ``"replace"``.
+
+    Examples
+    --------
+    >>> tmp_path = request.getfixturevalue("tmp_path")
+    >>> _ = (tmp_path / "history.txt").write_text("$ make\ncc -c a.c\nerror: a.c\n")
+    >>> with PaneHistory(tmp_path / "history.txt") as history:
+    ...     len(history), history[1], history[-1]
+    ...     list(history.search(r"error: (\w+)"))
+    (3, 'cc -c a.c', 'error: a.c')
+    [(2, 'error: a.c')]
+    """
+
+    path: pathlib.Path
+
+    def __init__(
+        self,
+        path: StrPath,
+        *,
+        encoding: str = "utf-8",
+        errors: str = "replace",
+    ) -> None:
+        self.path = pathlib.Path(path)
+        self.encoding = encoding
+        self.errors = errors
+        self._size = self.path.stat().st_size
+        self._map: mmap.mmap | None = None
+        if self._size:
+            with self.path.open("rb") as file:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._starts: array[int] | None = None
+        self._closed = False
+
+    def close(self) -> None:
+        """Release the mapping. Safe to call more than once."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._size = 0
+        self._starts = None
+        self._closed = True
+
+    @property
+    def closed(self) -> bool:
+        """True once :meth:`close` ran; a closed history has no lines."""
+        return self._closed
+
+    def _line_starts(self) -> array[int]:
+        """Return the byte offset of every line, indexing the file once."""
+        if self._starts is None:
+            starts = array("Q")
+            if self._map is not None:
+                starts.append(0)
+                find = self._map.find
+                end = find(b"\n")
+                while end != -1:
+                    starts.append(end + 1)
+                    end = find(b"\n", end + 1)
+                if starts[-1] == self._size:
+                    # The final newline ends the last line; it starts none.
+                    starts.pop()
+            self._starts = starts
+        return self._starts
+
+    def _line(self, index: int) -> str:
+        """Decode line *index*, a non-negative index known to exist."""
+        assert self._map is not None
+        starts = self._line_starts()
+        start = starts[index]
+        if index + 1 < len(starts):
+            end = starts[index + 1] - 1
+        else:
+            end = self._size - (self._map[-1:] == b"\n")
+        return self._map[start:end].decode(self.encoding, self.errors)
+
+    def __len__(self) -> int:
+        """Return the number of lines."""
+        return len(self._line_starts())
+
+    @t.overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        """Return a line, or a list of lines for a slice."""
+        count = len(self)
+        if isinstance(index, slice):
+            return [self._line(i) for i in range(*index.indices(count))]
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            msg = "history line index out of range"
+            raise IndexError(msg)
+        return self._line(index)
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield each line, decoding one at a time."""
+        for index in range(len(self)):
+            yield self._line(index)
+
+    def search(
+        self,
+        pattern: str | bytes | re.Pattern[bytes],
+    ) -> Iterator[tuple[int, str]]:
+        r"""Yield ``(line_number, line)`` for each line matching *pattern*.
+
+        The regular expression runs over the mapped bytes, not decoded text,
+        so a ``str`` pattern is encoded first; character classes such as
+        ``\w`` then match ASCII only. A pattern can match across lines; the
+        line where the match starts is reported, once per line.
+
+        Parameters
+        ----------
+        pattern : str, bytes or :class:`re.Pattern`
+            Regular expression. ``str`` and ``bytes`` patterns are compiled
+            with :data:`re.MULTILINE`, so ``^`` and ``$`` match at line
+            boundaries; a compiled pattern is used as given.
+        """
+        if self._map is None:
+            return
+        if isinstance(pattern, str):
+            pattern = pattern.encode(self.encoding)
+        regex = (
+            re.compile(pattern, re.MULTILINE) if isinstance(pattern, bytes) else pattern
+        )
+        starts = self._line_starts()
+        last = -1
+        for match in regex.finditer(self._map):
+            index = bisect.bisect_right(starts, match.start()) - 1
+            if index != last:
+                last = index
+                yield index, self._line(index)
+
+    def __enter__(self) -> Self:
+        """Return the history."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_tb: types.TracebackType | None,
+    ) -> None:
+        """Release the mapping."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Represent the history by its file."""
+        return f"{self.__class__.__name__}({str(self.path)!r})"
@@ -0,0 +1,295 @@
+"""Record pane output to asciicast v2 files.
+
+Note
+----
+This is an internal API not covered by versioning policy.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import pathlib
+import selectors
+import threading
+import time
+import typing as t
+
+from libtmux._internal.pane_stream import PaneStream
+from libtmux.common import raise_if_stderr
+
+if t.TYPE_CHECKING:
+    import types
+
+    from typing_extensions import Self
+
+    from libtmux._internal.types import StrPath
+    from libtmux.pane import Pane
+
+#: Bytes of events held in memory before they are written to the file.
+BUFFER_SIZE = 65536
+
+#: Seconds :meth:`PaneRecording.stop` waits for output still in the pipe.
+STOP_TIMEOUT = 1.0
+
+
+class PaneRecording:
+    r"""Pane output written to an `asciicast v2`_ file as it is produced.
+
+    Output arrives through a :class:`~libtmux._internal.pane_stream.PaneStream`
+    (``pipe-pane -O`` into a FIFO). Every recording in the process is served
+    by one background thread waiting on all their FIFOs at once, and events
+    go through a buffered file, so a recording costs a FIFO, a ``cat``
+    process in tmux and a file -- not a thread or a write per chunk.
+
+    Each chunk is stamped with the seconds since the recording started, as
+    it is read. Open one with :meth:`libtmux.Pane.record`; :meth:`stop`, or
+    leaving a ``with`` block, writes what is left and closes the file. A
+    recording also stops by itself when the pane closes.
+
+    .. _asciicast v2: https://docs.asciinema.org/manual/asciicast/v2/
+
+    Parameters
+    ----------
+    pane : :class:`~libtmux.Pane`
+        Pane to record.
+    path : str or PathLike
+        File to write; replaced if it exists.
+    title : str, optional
+        Title stored in the file's header.
+    buffer_size : int, optional
+        Bytes buffered before a write. Default :data:`BUFFER_SIZE`.
+
+    Examples
+    --------
+    >>> import json
+    >>> tmp_path = request.getfixturevalue("tmp_path")
+    >>> pane = window.split(shell="sh")
+    >>> from libtmux.test.retry import retry_until
+    >>> with pane.record(tmp_path / "demo.cast") as recording:
+    ...     pane.send_keys("echo $((6 * 7))", enter=True)
+    ...     retry_until(lambda: "42" in pane.capture_pane())
+    True
+    >>> header, *events = (tmp_path / "demo.cast").read_text().splitlines()
+    >>> json.loads(header)["version"]
+    2
+    >>> any("42" in json.loads(event)[2] for event in events)
+    True
+    """
+
+    pane: Pane
+    path: pathlib.Path
+
+    def __init__(
+        self,
+        pane: Pane,
+        path: StrPath,
+        *,
+        title: str | None = None,
+        buffer_size: int = BUFFER_SIZE,
+    ) -> None:
+        self.pane = pane
+        self.path = pathlib.Path(path)
+        self.title = title
+        self.buffer_size = buffer_size
+        self._stream: PaneStream | None = None
+        self._file: t.TextIO | None = None
+        self._started = 0.0
+        self._lock = threading.Lock()
+
+    def start(self) -> Self:
+        """Write the header and begin recording.
+
+        Returns the recording. Calling it on a started recording does
+        nothing.
+        """
+        with self._lock:
+            if self._file is not None:
+                return self
+            proc = self.pane.cmd(
+                "display-message", "-p", "#{pane_width} #{pane_height}"
+            )
+            raise_if_stderr(proc, "display-message")
+            width, height = (int(value) for value in proc.stdout[0].split())
+            header: dict[str, t.Any] = {
+                "version": 2,
+                "width": width,
+                "height": height,
+                "timestamp": int(time.time()),
+            }
+            if self.title is not None:
+                header["title"] = self.title
+            file = self.path.open("w", encoding="utf-8", buffering=self.buffer_size)
+            try:
+                file.write(json.dumps(header) + "\n")
+                self._stream = PaneStream(self.pane).open()
+            except BaseException:
+                file.close()
+                raise
+            self._file = file
+            self._started = time.monotonic()
+        _loop.add(self)
+        return self
+
+    def stop(self) -> None:
+        """Stop piping the pane, write the output still in flight, close the file.
+
+        Output tmux already sent down the pipe is recorded, waiting up to
+        :data:`STOP_TIMEOUT` seconds for it. Safe to call more than once,
+        and after the pane has closed.
+        """
+        with self._lock:
+            if self._stream is None:
+                return
+            try:
+                self._stream.end_pipe()
+                deadline = time.monotonic() + STOP_TIMEOUT
+                while not self._stream.ended:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._write(
+                        self._stream.read(timeout=remaining),
+                    ):
+                        break
+            finally:
+                self._finish()
+
+    @property
+    def recording(self) -> bool:
+        """True between :meth:`start` and the recording stopping."""
+        return self._file is not None
+
+    def _finish(self) -> None:
+        """Drain and close everything; the caller holds the lock."""
+        if self._file is None or self._stream is None:
+            return
+        try:
+            self._drain()
+            _loop.remove(self)
+            self._stream.close()
+        finally:
+            self._file.close()
+            self._file = None
+            self._stream = None
+
+    def _drain(self) -> None:
+        """Write an event for each chunk waiting in the FIFO."""
+        assert self._stream is not None
+        while self._write(self._stream.read(timeout=0)):
+            pass
+
+    def _write(self, chunk: str | None) -> bool:
+        """Write *chunk* as an output event; return False for no chunk."""
+        if chunk is None:
+            return False
+        assert self._file is not None
+        elapsed = round(time.monotonic() - self._started, 6)
+        self._file.write(json.dumps([elapsed, "o", chunk]) + "\n")
+        return True
+
+    def _on_readable(self) -> None:
+        """Record what arrived; stop if the pane's output has ended."""
+        with self._lock:
+            if self._file is None or self._stream is None:
+                return
+            self._drain()
+            if self._stream.ended:
+                self._finish()
+
+    def fileno(self) -> int:
+        """Return the descriptor output arrives on."""
+        if self._stream is None:
+            msg = "recording is not started"
+            raise ValueError(msg)
+        return self._stream.fileno()
+
+    def __enter__(self) -> Self:
+        """Start recording."""
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_tb: types.TracebackType | None,
+    ) -> None:
+        """Stop recording."""
+        self.stop()
+
+    def __repr__(self) -> str:
+        """Represent the recording by its pane and file."""
+        return f"{self.__class__.__name__}({self.pane.pane_id}, {str(self.path)!r})"
+
+
+class _RecorderLoop:
+    """One daemon thread serving every :class:`PaneRecording`.
+
+    The thread owns the selector. Other threads queue registrations and
+    removals and wake it through a pipe, so the selector is never changed
+    while it waits.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._changes: list[tuple[PaneRecording, bool]] = []
+        self._thread: threading.Thread | None = None
+        self._wake_write = -1
+
+    def add(self, recording: PaneRecording) -> None:
+        """Start serving *recording*."""
+        self._change(recording, add=True)
+
+    def remove(self, recording: PaneRecording) -> None:
+        """Stop serving *recording*; call before closing its stream."""
+        self._change(recording, add=False)
+
+    def _change(self, recording: PaneRecording, *, add: bool) -> None:
+        """Queue a change for the thread, starting it on first use."""
+        with self._lock:
+            self._changes.append((recording, add))
+            if self._thread is None:
+                selector = selectors.DefaultSelector()
+                wake_read, self._wake_write = os.pipe()
+                os.set_blocking(self._wake_write, False)
+                selector.register(wake_read, selectors.EVENT_READ)
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(selector, wake_read),
+                    name="libtmux-recorder",
+                    daemon=True,
+                )
+                self._thread.start()
+            else:
+                # A full pipe already holds a wake-up.
+                with contextlib.suppress(BlockingIOError):
+                    os.write(self._wake_write, b"\0")
+
+    def _run(self, selector: selectors.BaseSelector, wake_read: int) -> None:
+        """Apply queued changes, then record from whichever FIFOs are ready."""
+        while True:
+            with self._lock:
+                changes, self._changes = self._changes, []
+            for recording, add in changes:
+                # A recording's descriptor is closed after it is removed;
+                # unregister by key so a reused descriptor is never confused.
+                for key in list(selector.get_map().values()):
+                    if key.data is recording:
+                        selector.unregister(key.fileobj)
+                if add:
+                    with contextlib.suppress(ValueError):
+                        selector.register(
+                            recording.fileno(),
+                            selectors.EVENT_READ,
+                            recording,
+                        )
+            for key, _ in selector.select():
+                if key.data is None:
+                    os.read(wake_read, 4096)
+                    continue
+                recording = key.data
+                recording._on_readable()
+                if not recording.recording:
+                    selector.unregister(key.fileobj)
+
+
+_loop = _RecorderLoop()
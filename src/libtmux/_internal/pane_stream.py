@@ -0,0 +1,421 @@
+"""Live pane output streamed through ``pipe-pane`` into a FIFO.
+
+Note
+----
+This is an internal API not covered by versioning policy.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import contextlib
+import os
+import pathlib
+import re
+import select
+import shlex
+import shutil
+import tempfile
+import time
+import typing as t
+
+from libtmux import exc
+from libtmux.neo import _is_target_not_found_error
+
+if t.TYPE_CHECKING:
+    import types
+    from collections.abc import AsyncIterator, Iterator
+
+    from typing_extensions import Self
+
+    from libtmux.pane import Pane
+
+#: Bytes requested per :func:`os.read` on the FIFO.
+READ_SIZE = 65536
+
+#: Line breaks in terminal output: ``\r\n``, a lone ``\n``, or a lone ``\r``.
+_LINE_BREAK = re.compile(r"\r\n|\r|\n")
+
+
+class PaneStream:
+    r"""Iterate over a pane's output as tmux produces it.
+
+    tmux's ``pipe-pane -O`` copies everything the pane prints to a shell
+    command. Here that command is ``cat`` writing into a FIFO this process
+    created and reads, so output arrives as it is produced -- nothing is
+    missed between polls and no subprocess is spawned per read.
+
+    Use :meth:`libtmux.Pane.stream` to open one. The stream is an iterator
+    and an async iterator, and a context manager that stops the pipe (via
+    :meth:`libtmux.Pane.pipe`) and removes the FIFO on exit.
+
+    Output is the raw byte stream the pane's program wrote, decoded to
+    text: escape sequences (colors, cursor movement, bracketed-paste
+    toggles) are not interpreted or removed, so a line may start with
+    ``"\x1b[?2004l"`` or carry color codes. Match with substrings or
+    regular expressions rather than whole-line equality.
+
+    tmux allows one pipe per pane: opening a stream replaces any pipe the
+    pane already had, and :meth:`close` leaves the pane unpiped.
+
+    Parameters
+    ----------
+    pane : :class:`~libtmux.Pane`
+        Pane to follow.
+    lines : bool, optional
+        Yield complete lines instead of chunks as they are read. ``\r\n``,
+        ``\n`` and a lone ``\r`` (a carriage return that redraws the line)
+        each end a line and are removed. A final unterminated line is
+        yielded when the stream ends.
+    encoding : str, optional
+        Encoding of the pane output. Default ``"utf-8"``.
+    errors : str, optional
+        Decoding error handler. Default ``"replace"``, so stray bytes from
+        the terminal never end iteration.
+
+    Examples
+    --------
+    Read with a timeout so a missing line cannot block forever. The shell
+    echoes the typed command too, so look for text only the output holds:
+
+    >>> with pane.stream(lines=True) as stream:
+    ...     pane.send_keys("echo $((6 * 7))", enter=True)
+    ...     line = stream.read(timeout=5)
+    ...     while line is not None and not line.endswith("42"):
+    ...         line = stream.read(timeout=5)
+    >>> line
+    '42'
+    """
+
+    pane: Pane
+    path: pathlib.Path | None
+
+    def __init__(
+        self,
+        pane: Pane,
+        *,
+        lines: bool = False,
+        encoding: str = "utf-8",
+        errors: str = "replace",
+    ) -> None:
+        self.pane = pane
+        self.lines = lines
+        self.path = None
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors)
+        self._partial = ""
+        self._pending: list[str] = []
+        self._read_fd: int | None = None
+        self._hold_fd: int | None = None
+        self._eof = False
+
+    def open(self) -> Self:
+        """Create the FIFO and point the pane's ``pipe-pane`` at it.
+
+        Returns the stream, so ``stream = PaneStream(pane).open()`` works.
+        Calling it on an open stream does nothing.
+        """
+        if self.path is not None:
+            return self
+        directory = pathlib.Path(tempfile.mkdtemp(prefix="libtmux-stream-"))
+        self.path = directory / "output"
+        try:
+            os.mkfifo(self.path, 0o600)
+            # Open the read end without waiting for a writer, then hold a
+            # write end ourselves: until ``cat`` connects, reads block
+            # instead of reporting end-of-file.
+            self._read_fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+            self._hold_fd = os.open(self.path, os.O_WRONLY | os.O_NONBLOCK)
+            self.pane.pipe(
+                f"exec cat > {shlex.quote(str(self.path))}",
+                output_only=True,
+            )
+        except BaseException:
+            self._release()
+            raise
+        return self
+
+    def close(self) -> None:
+        """Stop piping the pane and remove the FIFO.
+
+        Output already written to the FIFO is discarded. Safe to call more
+        than once, and after the pane or its server has gone away -- there
+        is no pipe left to stop then.
+
+        Raises
+        ------
+        :exc:`~libtmux.exc.LibTmuxException`
+            When tmux refuses to stop the pipe of a pane that still exists.
+            The FIFO is removed regardless.
+        """
+        if self.path is None:
+            return
+        try:
+            if self._hold_fd is not None:
+                os.close(self._hold_fd)
+                self._hold_fd = None
+            self.pane.pipe(None)
+        except exc.LibTmuxException as error:
+            if not _is_gone_error(str(error)):
+                raise
+        finally:
+            self._release()
+
+    def end_pipe(self) -> None:
+        """Stop piping the pane but keep reading what is still in flight.
+
+        tmux closes the pipe, ``cat`` writes out what it holds and exits,
+        and the stream then :attr:`ended` once that output is read --
+        unlike :meth:`close`, which discards it. :meth:`close` the stream
+        afterwards to remove the FIFO.
+
+        Raises
+        ------
+        :exc:`~libtmux.exc.LibTmuxException`
+            When tmux refuses to stop the pipe of a pane that still exists.
+        """
+        if self.path is None:
+            return
+        if self._hold_fd is not None:
+            os.close(self._hold_fd)
+            self._hold_fd = None
+        try:
+            self.pane.pipe(None)
+        except exc.LibTmuxException as error:
+            if not _is_gone_error(str(error)):
+                raise
+
+    @property
+    def closed(self) -> bool:
+        """True once :meth:`close` ran, or before :meth:`open`."""
+        return self.path is None
+
+    def _release(self) -> None:
+        """Close both FIFO ends and delete the FIFO's directory."""
+        for fd in (self._hold_fd, self._read_fd):
+            if fd is not None:
+                with contextlib.suppress(OSError):
+                    os.close(fd)
+        self._hold_fd = self._read_fd = None
+        if self.path is not None:
+            shutil.rmtree(self.path.parent, ignore_errors=True)
+        self.path = None
+        self._eof = True
+
+    def fileno(self) -> int:
+        """Return the FIFO's read descriptor, for :mod:`selectors` and friends.
+
+        Raises
+        ------
+        ValueError
+            If the stream is not open.
+        """
+        if self._read_fd is None:
+            msg = "stream is not open"
+            raise ValueError(msg)
+        return self._read_fd
+
+    @property
+    def ended(self) -> bool:
+        """True once every piece of output has been read and the pipe ended."""
+        return self._eof and not self._pending
+
+    def read(self, timeout: float | None = None) -> str | None:
+        """Return the next piece of output, waiting up to *timeout* seconds.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Seconds to wait for output. ``None`` waits until output arrives
+            or the stream ends.
+
+        Returns
+        -------
+        str or None
+            The next chunk (or line, with ``lines=True``; an empty line is
+            ``""``). ``None`` if *timeout* passed first or the stream has
+            :attr:`ended`.
+        """
+        while not self._pending:
+            if self._eof or self._read_fd is None:
+                return None
+            ready, _, _ = select.select([self._read_fd], [], [], timeout)
+            if not ready:
+                return None
+            self._read_ready()
+        return self._pending.pop(0)
+
+    def expect(
+        self,
+        pattern: str | re.Pattern[str],
+        timeout: float | None = None,
+    ) -> re.Match[str]:
+        r"""Read until the output matches *pattern*; return the match.
+
+        The search runs over everything read by this call, so a match may
+        span reads (or lines, joined with ``\n`` when ``lines=True``). The
+        match's ``string`` holds that text, so ``match.string[:match.start()]``
+        is the output that came before it. Output after the match stays
+        unread: the rest of the chunk is returned by the next :meth:`read`
+        or :meth:`expect`; with ``lines=True`` the matching line is consumed
+        whole.
+
+        The process sleeps in :func:`select.select` between reads, so it
+        wakes as soon as the output arrives, without polling tmux.
+
+        Parameters
+        ----------
+        pattern : str or :class:`re.Pattern`
+            Regular expression, searched with :meth:`re.Pattern.search`.
+            Output is raw terminal text; allow for escape sequences.
+        timeout : float, optional
+            Seconds to wait in total. ``None`` waits until a match or the
+            end of the stream.
+
+        Raises
+        ------
+        :exc:`~libtmux.exc.WaitTimeout`
+            If *timeout* passed, or the output ended, before a match.
+
+        Examples
+        --------
+        >>> with pane.stream() as stream:
+        ...     pane.send_keys("echo $((6 * 7))", enter=True)
+        ...     match = stream.expect(r"4\d", timeout=5)
+        >>> match.group()
+        '42'
+        """
+        regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+        deadline = None if timeout is None else time.monotonic() + timeout
+        separator = "\n" if self.lines else ""
+        text = ""
+        while True:
+            remaining = (
+                None if deadline is None else max(deadline - time.monotonic(), 0)
+            )
+            item = self.read(timeout=remaining)
+            if item is None:
+                if self.ended:
+                    msg = f"pane output ended before {regex.pattern!r} matched"
+                else:
+                    msg = f"no pane output matched {regex.pattern!r} in {timeout}s"
+                raise exc.WaitTimeout(msg)
+            text += item + separator
+            match = regex.search(text)
+            if match is not None:
+                if not self.lines and match.end() < len(text):
+                    self._pending.insert(0, text[match.end() :])
+                return match
+
+    def _read_ready(self) -> None:
+        """Read what the FIFO holds into pending output."""
+        assert self._read_fd is not None
+        try:
+            data = os.read(self._read_fd, READ_SIZE)
+        except BlockingIOError:
+            # Another reader drained the FIFO between select() and read().
+            return
+        final = data == b""
+        if final:
+            self._eof = True
+        elif self._hold_fd is not None:
+            # ``cat`` is connected; let its exit (pipe stopped, pane gone)
+            # reach us as end-of-file.
+            os.close(self._hold_fd)
+            self._hold_fd = None
+        text = self._decoder.decode(data, final=final)
+        if not self.lines:
+            if text:
+                self._pending.append(text)
+            return
+        buffered = self._partial + text
+        # A trailing ``\r`` may be the first half of a ``\r\n`` split
+        # across reads; hold it back until the next read decides.
+        held = "\r" if buffered.endswith("\r") and not final else ""
+        *complete, rest = _LINE_BREAK.split(buffered.removesuffix(held))
+        self._pending.extend(complete)
+        self._partial = rest + held
+        if final and self._partial:
+            self._pending.append(self._partial)
+            self._partial = ""
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield output until the stream is closed or the pipe ends."""
+        while (item := self.read()) is not None:
+            yield item
+
+    def __aiter__(self) -> AsyncIterator[str]:
+        """Yield output without blocking the event loop."""
+        return self._aiter()
+
+    async def _aiter(self) -> AsyncIterator[str]:
+        """Read without waiting; park on the event loop until more arrives."""
+        while True:
+            item = self.read(timeout=0)
+            if item is not None:
+                yield item
+            elif self.ended or self.closed:
+                return
+            else:
+                await self._readable()
+
+    async def _readable(self) -> None:
+        """Wait until the FIFO has data, via the running loop's reader."""
+        fd = self._read_fd
+        if fd is None:
+            return
+        loop = asyncio.get_running_loop()
+        ready: asyncio.Future[None] = loop.create_future()
+
+        def wake() -> None:
+            if not ready.done():
+                ready.set_result(None)
+
+        loop.add_reader(fd, wake)
+        try:
+            await ready
+        finally:
+            loop.remove_reader(fd)
+
+    def __enter__(self) -> Self:
+        """Open the stream."""
+        return self.open()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_tb: types.TracebackType | None,
+    ) -> None:
+        """Close the stream."""
+        self.close()
+
+    async def __aenter__(self) -> Self:
+        """Open the stream."""
+        return self.open()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_tb: types.TracebackType | None,
+    ) -> None:
+        """Close the stream."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Represent the stream by its pane and state."""
+        state = "closed" if self.closed else str(self.path)
+        return f"{self.__class__.__name__}({self.pane.pane_id}, {state})"
+
+
+def _is_gone_error(stderr_text: str) -> bool:
+    """Return True if tmux failed because the pane or its server is gone."""
+    from libtmux.server import _is_daemon_not_up_error
+
+    return (
+        _is_target_not_found_error(stderr_text)
+        or _is_daemon_not_up_error(stderr_text)
+        # The daemon was shutting down as the command connected.
+        or "server exited unexpectedly" in stderr_text
+    )
@@ -8,6 +8,7 @@ This is an internal API not covered by versioning policy.
 from __future__ import annotations
 
 import logging
+import operator
 import re
 import typing as t
 from collections.abc import Callable, Iterable, Mapping, Sequence
@@ -297,6 +298,78 @@ def lookup_iregex(
     return False
 
 
+#: A string tmux would print for a number: an integer or a decimal.
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def _as_number(value: t.Any) -> int | float | None:
+    """Return *value* as a number if it is one or spells one, else None."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str) and _NUMBER.fullmatch(value):
+        return float(value) if "." in value else int(value)
+    return None
+
+
+def _lookup_compare(
+    data: t.Any,
+    rhs: t.Any,
+    compare: Callable[[t.Any, t.Any], bool],
+) -> bool:
+    """Order *data* against *rhs*, as numbers when both sides are numeric.
+
+    tmux objects hold :class:`str` fields, so ``"10"`` against ``9`` or
+    ``"9"`` compares as numbers, not text. Values that cannot be ordered
+    against each other are no match.
+
+    >>> _lookup_compare(10, 9, operator.gt)
+    True
+    >>> _lookup_compare("10", "9", operator.gt)
+    True
+    >>> _lookup_compare("10", 9, operator.gt)
+    True
+    >>> _lookup_compare("beta", "alpha", operator.gt)
+    True
+    >>> _lookup_compare("main", 9, operator.gt)
+    False
+    """
+    left, right = _as_number(data), _as_number(rhs)
+    if left is not None and right is not None:
+        return bool(compare(left, right))
+    try:
+        return bool(compare(data, rhs))
+    except Exception:
+        return False
+
+
+def lookup_gt(
+    data: str | list[str] | Mapping[str, str],
+    rhs: str | list[str] | Mapping[str, str] | re.Pattern[str],
+) -> bool:
+    return _lookup_compare(data, rhs, operator.gt)
+
+
+def lookup_gte(
+    data: str | list[str] | Mapping[str, str],
+    rhs: str | list[str] | Mapping[str, str] | re.Pattern[str],
+) -> bool:
+    return _lookup_compare(data, rhs, operator.ge)
+
+
+def lookup_lt(
+    data: str | list[str] | Mapping[str, str],
+    rhs: str | list[str] | Mapping[str, str] | re.Pattern[str],
+) -> bool:
+    return _lookup_compare(data, rhs, operator.lt)
+
+
+def lookup_lte(
+    data: str | list[str] | Mapping[str, str],
+    rhs: str | list[str] | Mapping[str, str] | re.Pattern[str],
+) -> bool:
+    return _lookup_compare(data, rhs, operator.le)
+
+
 LOOKUP_NAME_MAP: Mapping[str, LookupProtocol] = {
     "eq": lookup_exact,
     "exact": lookup_exact,
@@ -311,6 +384,10 @@ LOOKUP_NAME_MAP: Mapping[str, LookupProtocol] = {
     "nin": lookup_nin,
     "regex": lookup_regex,
     "iregex": lookup_iregex,
+    "gt": lookup_gt,
+    "gte": lookup_gte,
+    "lt": lookup_lt,
+    "lte": lookup_lte,
 }
 
 
@@ -0,0 +1,393 @@
+"""Pane screens as cell grids, parsed from ``capture-pane -e`` output.
+
+Note
+----
+This is an internal API not covered by versioning policy.
+"""
+
+from __future__ import annotations
+
+import enum
+import re
+import typing as t
+import unicodedata
+from array import array
+
+from libtmux.common import raise_if_stderr
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from libtmux.pane import Pane
+
+#: Color value of a cell using the terminal's default color.
+DEFAULT_COLOR = -1
+
+#: Set on color values that hold a 24-bit RGB color rather than an index.
+RGB_FLAG = 1 << 24
+
+
+class Attr(enum.IntFlag):
+    """Text attributes of a cell, as set by SGR escape sequences."""
+
+    NONE = 0
+    BOLD = 1
+    DIM = 2
+    ITALIC = 4
+    UNDERLINE = 8
+    BLINK = 16
+    REVERSE = 32
+    HIDDEN = 64
+    STRIKETHROUGH = 128
+    DOUBLE_UNDERLINE = 256
+    OVERLINE = 512
+
+
+def rgb(red: int, green: int, blue: int) -> int:
+    """Return the color value for a 24-bit color.
+
+    Examples
+    --------
+    >>> hex(rgb(255, 128, 0))
+    '0x1ff8000'
+    """
+    return RGB_FLAG | red << 16 | green << 8 | blue
+
+
+class Cell(t.NamedTuple):
+    """One cell of a :class:`Screen`.
+
+    Colors are :data:`DEFAULT_COLOR`, a palette index (0-255), or an
+    :func:`rgb` value. The right half of a wide character has ``char ""``.
+    """
+
+    char: str
+    fg: int
+    bg: int
+    attrs: Attr
+
+
+class CellChange(t.NamedTuple):
+    """A cell that differs between two screens."""
+
+    row: int
+    col: int
+    old: Cell
+    new: Cell
+
+
+#: An escape sequence: CSI (SGR when it ends in ``m``), OSC, or a lone ESC pair.
+_ESCAPE = re.compile(
+    r"\x1b\[([0-9;:?]*)([@-~])|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)|\x1b[@-_]",
+)
+
+#: SGR codes that set an attribute, and codes that clear attributes.
+_SET_ATTR: dict[int, Attr] = {
+    1: Attr.BOLD,
+    2: Attr.DIM,
+    3: Attr.ITALIC,
+    4: Attr.UNDERLINE,
+    5: Attr.BLINK,
+    7: Attr.REVERSE,
+    8: Attr.HIDDEN,
+    9: Attr.STRIKETHROUGH,
+    21: Attr.DOUBLE_UNDERLINE,
+    53: Attr.OVERLINE,
+}
+_CLEAR_ATTR: dict[int, Attr] = {
+    22: Attr.BOLD | Attr.DIM,
+    23: Attr.ITALIC,
+    24: Attr.UNDERLINE | Attr.DOUBLE_UNDERLINE,
+    25: Attr.BLINK,
+    27: Attr.REVERSE,
+    28: Attr.HIDDEN,
+    29: Attr.STRIKETHROUGH,
+    55: Attr.OVERLINE,
+}
+
+
+class Screen:
+    r"""A grid of cells: characters with their colors and attributes.
+
+    Cells are stored column-wise and row-major -- a list of characters and
+    one :class:`array.array` each for foreground, background and
+    attributes -- so comparing two screens compares arrays in C rather than
+    cell objects in Python.
+
+    Build one with :meth:`libtmux.Pane.screen`, or :meth:`parse` any
+    ``capture-pane -e`` style text.
+
+    Examples
+    --------
+    >>> screen = Screen.parse(["plain \x1b[1;31mbold red\x1b[0m"], width=20)
+    >>> screen.lines
+    ['plain bold red']
+    >>> screen[0, 6]
+    Cell(char='b', fg=1, bg=-1, attrs=<Attr.BOLD: 1>)
+    >>> later = Screen.parse(["plain \x1b[1;32mbold red\x1b[0m"], width=20)
+    >>> [(change.col, change.new.fg) for change in screen.diff(later)][:2]
+    [(6, 2), (7, 2)]
+    """
+
+    __slots__ = ("attrs", "bg", "chars", "fg", "height", "width")
+
+    def __init__(self, width: int, height: int) -> None:
+        size = width * height
+        self.width = width
+        self.height = height
+        self.chars: list[str] = [" "] * size
+        self.fg = array("i", [DEFAULT_COLOR]) * size
+        self.bg = array("i", [DEFAULT_COLOR]) * size
+        self.attrs = array("I", [0]) * size
+
+    @classmethod
+    def parse(
+        cls,
+        lines: Iterable[str],
+        width: int,
+        height: int | None = None,
+    ) -> Screen:
+        """Build a screen from lines carrying SGR escape sequences.
+
+        Styles carry over from one line to the next, as in
+        ``capture-pane -e`` output. Escape sequences other than SGR are
+        skipped. Text beyond *width* is cut off.
+
+        Parameters
+        ----------
+        lines : iterable of str
+            One string per row.
+        width : int
+            Columns.
+        height : int, optional
+            Rows; defaults to the number of lines. Missing rows are blank.
+        """
+        rows = list(lines)
+        screen = cls(width, len(rows) if height is None else height)
+        style = [DEFAULT_COLOR, DEFAULT_COLOR, 0]
+        for row, line in enumerate(rows[: screen.height]):
+            col = 0
+            position = 0
+            for match in _ESCAPE.finditer(line):
+                if match.start() > position:
+                    col = screen._write(row, col, line[position : match.start()], style)
+                position = match.end()
+                if match.group(2) == "m":
+                    _apply_sgr(match.group(1), style)
+            if position < len(line):
+                screen._write(row, col, line[position:], style)
+        return screen
+
+    def _write(self, row: int, col: int, text: str, style: list[int]) -> int:
+        """Put *text* at (*row*, *col*) in *style*; return the next column."""
+        width = self.width
+        if text.isascii():
+            count = min(len(text), width - col)
+            if count <= 0:
+                return col
+            start = row * width + col
+            end = start + count
+            self.chars[start:end] = text[:count]
+            self.fg[start:end] = array("i", [style[0]]) * count
+            self.bg[start:end] = array("i", [style[1]]) * count
+            self.attrs[start:end] = array("I", [style[2]]) * count
+            return col + count
+        for char in text:
+            wide = unicodedata.east_asian_width(char) in {"W", "F"}
+            if unicodedata.combining(char) and col > 0:
+                self.chars[row * width + col - 1] += char
+                continue
+            if col + (2 if wide else 1) > width:
+                break
+            index = row * width + col
+            self.chars[index] = char
+            self.fg[index], self.bg[index], self.attrs[index] = style
+            col += 1
+            if wide:
+                self.chars[index + 1] = ""
+                self.fg[index + 1], self.bg[index + 1], self.attrs[index + 1] = style
+                col += 1
+        return col
+
+    def __getitem__(self, position: tuple[int, int]) -> Cell:
+        """Return the cell at ``(row, col)``."""
+        row, col = position
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            msg = f"cell {position} outside {self.width}x{self.height} screen"
+            raise IndexError(msg)
+        index = row * self.width + col
+        return Cell(
+            self.chars[index],
+            self.fg[index],
+            self.bg[index],
+            Attr(self.attrs[index]),
+        )
+
+    @property
+    def lines(self) -> list[str]:
+        """Text of each row, without trailing blanks or trailing empty rows."""
+        width = self.width
+        lines = [
+            "".join(self.chars[start : start + width]).rstrip()
+            for start in range(0, width * self.height, width)
+        ]
+        while lines and not lines[-1]:
+            lines.pop()
+        return lines
+
+    def _row_equal(self, other: Screen, row: int) -> bool:
+        """Return True if *row* is the same on both screens."""
+        start = row * self.width
+        end = start + self.width
+        return (
+            self.chars[start:end] == other.chars[start:end]
+            and self.fg[start:end] == other.fg[start:end]
+            and self.bg[start:end] == other.bg[start:end]
+            and self.attrs[start:end] == other.attrs[start:end]
+        )
+
+    def changed_rows(self, other: Screen) -> list[int]:
+        """Return the rows that differ from *other*, a screen of equal size."""
+        self._check_size(other)
+        return [row for row in range(self.height) if not self._row_equal(other, row)]
+
+    def diff(self, other: Screen) -> list[CellChange]:
+        """Return every cell that differs in *other*, a screen of equal size.
+
+        Rows are compared whole first; only changed rows are walked cell by
+        cell.
+        """
+        changes: list[CellChange] = []
+        for row in self.changed_rows(other):
+            for col in range(self.width):
+                old, new = self[row, col], other[row, col]
+                if old != new:
+                    changes.append(CellChange(row, col, old, new))
+        return changes
+
+    def _check_size(self, other: Screen) -> None:
+        """Raise ValueError unless *other* has this screen's size."""
+        if (self.width, self.height) != (other.width, other.height):
+            msg = (
+                f"cannot compare a {self.width}x{self.height} screen "
+                f"with a {other.width}x{other.height} one"
+            )
+            raise ValueError(msg)
+
+    def __eq__(self, other: object) -> bool:
+        """Screens are equal when their size and every cell match."""
+        if not isinstance(other, Screen):
+            return NotImplemented
+        return (
+            (self.width, self.height) == (other.width, other.height)
+            and self.chars == other.chars
+            and self.fg == other.fg
+            and self.bg == other.bg
+            and self.attrs == other.attrs
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Represent the screen by its size."""
+        return f"{self.__class__.__name__}({self.width}x{self.height})"
+
+
+def capture_screen(pane: Pane) -> Screen:
+    """Capture the visible area of *pane* as a :class:`Screen`.
+
+    The pane size and the styled rows come from one tmux command, so a
+    resize cannot land between them.
+    """
+    proc = pane.server.cmd(
+        "display-message",
+        "-p",
+        "-t",
+        str(pane.pane_id),
+        "#{pane_width} #{pane_height}",
+        ";",
+        "capture-pane",
+        "-p",
+        "-e",
+        "-N",
+        "-t",
+        str(pane.pane_id),
+    )
+    raise_if_stderr(proc, "capture-pane")
+    size, *rows = proc.stdout
+    width, height = (int(value) for value in size.split())
+    return Screen.parse(rows, width, height)
+
+
+def _apply_sgr(params: str, style: list[int]) -> None:
+    """Update ``[fg, bg, attrs]`` *style* in place for SGR *params*.
+
+    Examples
+    --------
+    >>> style = [DEFAULT_COLOR, DEFAULT_COLOR, 0]
+    >>> _apply_sgr("1;38;5;208;48;2;0;0;255", style)
+    >>> style[0], hex(style[1]), Attr(style[2])
+    (208, '0x10000ff', <Attr.BOLD: 1>)
+    >>> _apply_sgr("38:2::1:2:3;22;49", style)
+    >>> hex(style[0]), style[1], style[2]
+    ('0x1010203', -1, 0)
+    >>> _apply_sgr("", style)
+    >>> style
+    [-1, -1, 0]
+    """
+    codes = params.split(";") if params else ["0"]
+    index = 0
+    while index < len(codes):
+        code, _, sub = codes[index].partition(":")
+        index += 1
+        number = int(code) if code.isdigit() else 0
+        if number == 0:
+            style[:] = [DEFAULT_COLOR, DEFAULT_COLOR, 0]
+        elif number in _SET_ATTR:
+            if number == 4 and sub == "0":
+                style[2] &= ~int(Attr.UNDERLINE | Attr.DOUBLE_UNDERLINE)
+            else:
+                style[2] |= int(_SET_ATTR[number])
+        elif number in _CLEAR_ATTR:
+            style[2] &= ~int(_CLEAR_ATTR[number])
+        elif 30 <= number <= 37:
+            style[0] = number - 30
+        elif 40 <= number <= 47:
+            style[1] = number - 40
+        elif 90 <= number <= 97:
+            style[0] = number - 90 + 8
+        elif 100 <= number <= 107:
+            style[1] = number - 100 + 8
+        elif number == 39:
+            style[0] = DEFAULT_COLOR
+        elif number == 49:
+            style[1] = DEFAULT_COLOR
+        elif number in {38, 48, 58}:
+            if sub:
+                color = _extended_color(sub.split(":"))
+            else:
+                color, used = _extended_color_args(codes, index)
+                index += used
+            if number != 58 and color is not None:
+                style[0 if number == 38 else 1] = color
+
+
+def _extended_color(fields: list[str]) -> int | None:
+    """Decode ``5:n`` or ``2:[colorspace:]r:g:b`` colon sub-parameters."""
+    values = [int(field) if field.isdigit() else 0 for field in fields]
+    if values[:1] == [5] and len(values) >= 2:
+        return values[1]
+    if values[:1] == [2] and len(values) >= 4:
+        red, green, blue = values[-3:]
+        return rgb(red, green, blue)
+    return None
+
+
+def _extended_color_args(codes: list[str], index: int) -> tuple[int | None, int]:
+    """Decode ``5;n`` or ``2;r;g;b`` from *codes*; return color and codes used."""
+    kind = codes[index] if index < len(codes) else ""
+    if kind == "5" and index + 1 < len(codes):
+        return _extended_color(codes[index : index + 2]), 2
+    if kind == "2" and index + 3 < len(codes):
+        return _extended_color(codes[index : index + 4]), 4
+    return None, 1
@@ -0,0 +1,99 @@
+"""Share one in-flight call among concurrent callers asking the same thing.
+
+Note
+----
+This is an internal API not covered by versioning policy.
+"""
+
+from __future__ import annotations
+
+import threading
+import typing as t
+from collections.abc import Callable, Hashable
+
+T = t.TypeVar("T")
+
+
+class _Call(t.Generic[T]):
+    """One in-flight call: its outcome, and the event its waiters block on."""
+
+    __slots__ = ("done", "error", "result", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class SingleFlight(t.Generic[T]):
+    """Coalesce concurrent calls that share a key into one execution.
+
+    The first thread to call :meth:`do` with a key runs the function; threads
+    arriving with the same key while it runs wait and receive its result (or
+    its exception). Nothing is cached: once the call returns, the next caller
+    with that key runs the function afresh.
+
+    Examples
+    --------
+    >>> from libtmux._internal.single_flight import SingleFlight
+    >>> flight: SingleFlight[int] = SingleFlight()
+    >>> flight.do("answer", lambda: 42)
+    42
+
+    Nothing is kept once a call returns, so the next call runs again:
+
+    >>> runs = iter(range(3))
+    >>> flight.do("count", lambda: next(runs))
+    0
+    >>> flight.do("count", lambda: next(runs))
+    1
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call[T]] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run *fn*, or wait for the identical call already running.
+
+        Parameters
+        ----------
+        key : :class:`~collections.abc.Hashable`
+            Identifies the call; callers with equal keys share one run.
+        fn : callable
+            Produces the result. Only the first caller's *fn* runs.
+
+        Returns
+        -------
+        The result of the shared run. Every caller receives the same object.
+
+        Raises
+        ------
+        Exception
+            Whatever the shared run raised, re-raised in every caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return t.cast("T", call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
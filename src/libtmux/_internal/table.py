@@ -0,0 +1,361 @@
+"""Column-oriented tables for bulk tmux listings.
+
+Note
+----
+This is an internal API not covered by versioning policy.
+"""
+
+from __future__ import annotations
+
+import importlib
+import typing as t
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+
+CellValue: t.TypeAlias = "str | int | None"
+
+
+def _numpy() -> t.Any:
+    """Return the :mod:`numpy` module, or ``None`` when it is not installed.
+
+    NumPy is optional: only :meth:`Table.array` needs it, and
+    :meth:`Table.where` accepts its boolean arrays when it is present.
+    """
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        return None
+
+
+class Table:
+    """Column-oriented rows from a tmux listing.
+
+    Each field is held as one column -- a list with one cell per row -- so
+    a listing of thousands of panes costs one list per field instead of one
+    dict per row. Cells tmux left empty are ``None``. Columns named in
+    *numeric* hold :class:`int` cells. :meth:`column` hands back plain lists;
+    :meth:`array` hands back NumPy arrays when NumPy is installed.
+
+    Every transforming method (:meth:`take`, :meth:`where`, :meth:`sort`,
+    :meth:`group_by`) returns new tables and leaves the original untouched.
+
+    Parameters
+    ----------
+    columns : :class:`~collections.abc.Mapping`
+        Field name to cells. Every column must hold the same number of cells.
+    numeric : :class:`~collections.abc.Iterable`, optional
+        Field names whose cells are integers. Names with no column are
+        ignored.
+
+    Raises
+    ------
+    ValueError
+        When the columns differ in length.
+
+    Examples
+    --------
+    >>> from libtmux._internal.table import Table
+    >>> table = Table(
+    ...     {
+    ...         "pane_id": ["%1", "%2", "%3"],
+    ...         "pane_width": [80, 120, 40],
+    ...         "window_id": ["@1", "@1", "@2"],
+    ...     },
+    ...     numeric=["pane_width"],
+    ... )
+    >>> len(table)
+    3
+    >>> table.fields
+    ('pane_id', 'pane_width', 'window_id')
+
+    Filter with a boolean mask, one entry per row:
+
+    >>> wide = table.where([width > 60 for width in table.column("pane_width")])
+    >>> wide.column("pane_id")
+    ['%1', '%2']
+
+    With NumPy installed, :meth:`array` gives the same filter as one
+    vectorized comparison: ``table.where(table.array("pane_width") > 60)``.
+
+    Sort and group without building a Python object per row:
+
+    >>> table.sort("pane_width").column("pane_id")
+    ['%3', '%1', '%2']
+    >>> {key: len(group) for key, group in table.group_by("window_id").items()}
+    {'@1': 2, '@2': 1}
+    """
+
+    __slots__ = ("_columns", "_length", "_numeric")
+
+    def __init__(
+        self,
+        columns: Mapping[str, Sequence[CellValue]],
+        numeric: Iterable[str] = (),
+    ) -> None:
+        self._columns: dict[str, list[CellValue]] = {
+            name: list(cells) for name, cells in columns.items()
+        }
+        lengths = {len(cells) for cells in self._columns.values()}
+        if len(lengths) > 1:
+            msg = f"Table columns differ in length: {sorted(lengths)}"
+            raise ValueError(msg)
+        self._length = lengths.pop() if lengths else 0
+        self._numeric = frozenset(numeric) & self._columns.keys()
+
+    @classmethod
+    def from_lines(
+        cls,
+        lines: Iterable[str],
+        fields: Sequence[str],
+        separator: str,
+        numeric: Iterable[str] = (),
+    ) -> Table:
+        """Build a table from separator-joined tmux ``-F`` output lines.
+
+        Each line is split once and its values appended straight onto their
+        columns; no per-row dict is built. A trailing separator (as the
+        templates from :func:`libtmux.neo.get_output_format` produce) is
+        dropped.
+
+        Parameters
+        ----------
+        lines : :class:`~collections.abc.Iterable`
+            One tmux output line per row.
+        fields : :class:`~collections.abc.Sequence`
+            Field names, in the order their values appear on each line.
+        separator : str
+            String between values, e.g.
+            :data:`libtmux.formats.FORMAT_SEPARATOR`.
+        numeric : :class:`~collections.abc.Iterable`, optional
+            Field names whose values are decoded with :class:`int`.
+
+        Raises
+        ------
+        ValueError
+            When a line carries a different number of values than *fields*,
+            or a numeric value is not an integer.
+
+        Examples
+        --------
+        >>> from libtmux._internal.table import Table
+        >>> table = Table.from_lines(
+        ...     ["%1|80|", "%2||"],
+        ...     fields=("pane_id", "pane_width"),
+        ...     separator="|",
+        ...     numeric=("pane_width",),
+        ... )
+        >>> table.column("pane_width")
+        [80, None]
+        """
+        numeric = frozenset(numeric)
+        columns: list[list[CellValue]] = [[] for _ in fields]
+        width = len(fields)
+        for line in lines:
+            values = line.split(separator)
+            if values and values[-1] == "":
+                values.pop()
+            if len(values) != width:
+                msg = f"Expected {width} values per line, got {len(values)}"
+                raise ValueError(msg)
+            for cells, value in zip(columns, values, strict=True):
+                cells.append(value or None)
+        for name, cells in zip(fields, columns, strict=True):
+            if name in numeric:
+                cells[:] = [None if cell is None else int(cell) for cell in cells]
+        return cls(dict(zip(fields, columns, strict=True)), numeric=numeric)
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self._length
+
+    def __repr__(self) -> str:
+        """Represent the table by its shape."""
+        return f"Table(rows={self._length}, fields={len(self._columns)})"
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Field names, in column order."""
+        return tuple(self._columns)
+
+    @property
+    def numeric_fields(self) -> frozenset[str]:
+        """Field names whose cells are integers."""
+        return self._numeric
+
+    def column(self, name: str) -> list[CellValue]:
+        """Return one column as a list of cells, one per row.
+
+        The list is a copy; changing it does not change the table.
+
+        Raises
+        ------
+        KeyError
+            When the table has no such column.
+
+        Examples
+        --------
+        >>> from libtmux._internal.table import Table
+        >>> Table({"window_index": [1, None]}, numeric=["window_index"]).column(
+        ...     "window_index"
+        ... )
+        [1, None]
+        """
+        return list(self._columns[name])
+
+    def array(self, name: str) -> t.Any:
+        """Return one column as a NumPy array.
+
+        Numeric columns come back as a :class:`numpy.ma.MaskedArray` of
+        ``int64`` whose mask marks the rows tmux left empty, ready for
+        ``.sum()``, ``.mean()`` and comparisons. Every other column is an
+        ``object`` array holding :class:`str` or ``None``. The array is a
+        copy; writing to it does not change the table.
+
+        Raises
+        ------
+        ImportError
+            When NumPy is not installed.
+        KeyError
+            When the table has no such column.
+        """
+        np = _numpy()
+        if np is None:
+            msg = "Table.array() requires NumPy; use Table.column() without it"
+            raise ImportError(msg)
+        cells = self._columns[name]
+        if name in self._numeric:
+            return np.ma.MaskedArray(
+                np.array([0 if cell is None else cell for cell in cells], np.int64),
+                mask=np.array([cell is None for cell in cells], dtype=bool),
+            )
+        return np.array(cells, dtype=object)
+
+    def rows(self) -> Iterator[dict[str, CellValue]]:
+        """Yield each row as a dict of its non-empty cells.
+
+        Rows come out in table order, shaped like the dicts
+        :func:`libtmux.neo.fetch_objs` returns -- except that numeric cells
+        are already :class:`int`.
+
+        Examples
+        --------
+        >>> from libtmux._internal.table import Table
+        >>> list(Table({"pane_id": ["%1", None]}).rows())
+        [{'pane_id': '%1'}, {}]
+        """
+        items = list(self._columns.items())
+        for index in range(self._length):
+            yield {
+                name: cells[index] for name, cells in items if cells[index] is not None
+            }
+
+    def take(self, indices: Iterable[int]) -> Table:
+        """Return a table of the rows at *indices*, in the order given.
+
+        Raises
+        ------
+        IndexError
+            When an index is out of range.
+
+        Examples
+        --------
+        >>> from libtmux._internal.table import Table
+        >>> Table({"pane_id": ["%1", "%2", "%3"]}).take([2, 0]).column("pane_id")
+        ['%3', '%1']
+        """
+        picked = [int(index) for index in indices]
+        return Table(
+            {
+                name: [cells[index] for index in picked]
+                for name, cells in self._columns.items()
+            },
+            numeric=self._numeric,
+        )
+
+    def where(self, mask: Iterable[bool]) -> Table:
+        """Return the rows whose *mask* entry is true.
+
+        *mask* holds one truth value per row: a list built from
+        :meth:`column`, or a NumPy boolean array such as
+        ``table.array("pane_width") > 80``. A masked (empty) NumPy cell
+        counts as false.
+
+        Raises
+        ------
+        ValueError
+            When *mask* does not hold one entry per row.
+
+        Examples
+        --------
+        >>> from libtmux._internal.table import Table
+        >>> table = Table({"pane_id": ["%1", "%2"]})
+        >>> table.where([False, True]).column("pane_id")
+        ['%2']
+        """
+        np = _numpy()
+        if np is not None and isinstance(mask, np.ndarray):
+            flags = np.ma.filled(mask, False).astype(bool).tolist()
+        else:
+            flags = [bool(flag) for flag in mask]
+        if len(flags) != self._length:
+            msg = f"Mask has {len(flags)} entries for {self._length} rows"
+            raise ValueError(msg)
+        return self.take(index for index, flag in enumerate(flags) if flag)
+
+    def sort(self, by: str, *, reverse: bool = False) -> Table:
+        """Return the rows ordered by column *by*.
+
+        Numeric columns order numerically, so window index ``10`` follows
+        ``9``. The sort is stable, and rows whose cell is empty come last
+        whichever the direction.
+
+        Raises
+        ------
+        KeyError
+            When the table has no such column.
+
+        Examples
+        --------
+        >>> from libtmux._internal.table import Table
+        >>> table = Table(
+        ...     {"window_index": [10, None, 9]}, numeric=["window_index"]
+        ... )
+        >>> table.sort("window_index").column("window_index")
+        [9, 10, None]
+        >>> table.sort("window_index", reverse=True).column("window_index")
+        [10, 9, None]
+        """
+        cells = self._columns[by]
+        present = [index for index, cell in enumerate(cells) if cell is not None]
+        empty = [index for index, cell in enumerate(cells) if cell is None]
+        # A column holds one kind of value, so its cells compare with each other.
+        present.sort(key=lambda index: t.cast("t.Any", cells[index]), reverse=reverse)
+        return self.take(present + empty)
+
+    def group_by(self, by: str) -> dict[CellValue, Table]:
+        """Split the rows into one table per distinct value of column *by*.
+
+        Groups appear in the order their key is first seen, and rows keep
+        their order within a group. Rows whose cell is empty group under
+        ``None``.
+
+        Raises
+        ------
+        KeyError
+            When the table has no such column.
+
+        Examples
+        --------
+        >>> from libtmux._internal.table import Table
+        >>> table = Table(
+        ...     {"session_id": ["$1", "$2", "$1"], "pane_id": ["%1", "%2", "%3"]}
+        ... )
+        >>> groups = table.group_by("session_id")
+        >>> list(groups)
+        ['$1', '$2']
+        >>> groups["$1"].column("pane_id")
+        ['%1', '%3']
+        """
+        positions: dict[CellValue, list[int]] = {}
+        for index, cell in enumerate(self._columns[by]):
+            positions.setdefault(cell, []).append(index)
+        return {key: self.take(indices) for key, indices in positions.items()}
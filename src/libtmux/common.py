@@ -16,11 +16,15 @@ import subprocess
 import sys
 import typing as t
 
+from libtmux._internal.command_chain import chain_target, run_chain
+
 from . import exc
 from ._compat import LooseVersion
 
 if t.TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Mapping
+
+    from libtmux.session import Session
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +55,33 @@ class CmdMixin:
     cmd: CmdProtocol
 
 
+class Environments(t.NamedTuple):
+    """Environments read by :meth:`libtmux.Server.environments`."""
+
+    global_: dict[str, str | bool]
+    """The global environment (``show-environment -g``)."""
+    sessions: dict[str, dict[str, str | bool]]
+    """Each session's environment, by session ID."""
+
+
+def parse_environment(lines: Iterable[str]) -> dict[str, str | bool]:
+    """Parse ``show-environment`` output into a dict.
+
+    A variable removed from the environment (``-NAME``) maps to True under
+    its ``-`` prefixed name, as tmux prints it.
+
+    Examples
+    --------
+    >>> parse_environment(["EDITOR=vim", "EMPTY=", "-REMOVED", "A=b=c"])
+    {'EDITOR': 'vim', 'EMPTY': '', '-REMOVED': True, 'A': 'b=c'}
+    """
+    environment: dict[str, str | bool] = {}
+    for line in lines:
+        key, separator, value = line.partition("=")
+        environment[key] = value if separator else True
+    return environment
+
+
 class EnvironmentMixin:
     """Mixin for manager session and server level environment variables in tmux."""
 
@@ -114,6 +145,81 @@ class EnvironmentMixin:
             msg = f"tmux set-environment stderr: {cmd.stderr}"
             raise ValueError(msg)
 
+    def set_environment_many(
+        self,
+        mapping: Mapping[str, str],
+        *,
+        unset: Iterable[str] = (),
+        sessions: Iterable[Session | str] | None = None,
+    ) -> None:
+        """Set and unset many environment variables in one tmux call.
+
+        Every ``set-environment`` -- each variable for each target -- is
+        sent as one chained command sequence, split across invocations
+        only where tmux's command size limit requires (see
+        :func:`~libtmux._internal.command_chain.run_chain`).
+
+        Parameters
+        ----------
+        mapping : dict
+            Variables to set, name to value.
+        unset : iterable of str, optional
+            Variables to unset (``-u``).
+        sessions : iterable of :class:`~libtmux.Session` or session IDs, optional
+            Sessions to change. Default: this object's own environment --
+            the session's, or the global one for a server.
+
+        Raises
+        ------
+        :exc:`~libtmux.exc.BatchError`
+            Listing what tmux rejected, by variable name -- or by
+            ``"<session_id>:<name>"`` when *sessions* is given. The other
+            variables are still changed.
+
+        Examples
+        --------
+        >>> other = server.new_session()
+        >>> server.set_environment_many(
+        ...     {"TOKEN": "new", "REGION": "eu"},
+        ...     unset=["OLD_TOKEN"],
+        ...     sessions=[session, other],
+        ... )
+        >>> other.getenv("TOKEN"), session.getenv("REGION")
+        ('new', 'eu')
+
+        .. versionadded:: 0.63
+        """
+        runner, target = chain_target(t.cast("CmdMixin", self))
+        if sessions is None:
+            targets = {"": [*target, *([self._add_option] if self._add_option else [])]}
+        else:
+            targets = {
+                session_id: ["-t", session_id]
+                for session_id in (
+                    session if isinstance(session, str) else str(session.session_id)
+                    for session in sessions
+                )
+            }
+        unset = list(unset)
+        keys: list[str] = []
+        commands: list[list[str]] = []
+        for session_id, flags in targets.items():
+            prefix = f"{session_id}:" if session_id else ""
+            for name, value in mapping.items():
+                keys.append(f"{prefix}{name}")
+                commands.append(["set-environment", *flags, name, value])
+            for name in unset:
+                keys.append(f"{prefix}{name}")
+                commands.append(["set-environment", *flags, "-u", name])
+
+        errors = {
+            key: "\n".join(result.stderr)
+            for key, result in zip(keys, run_chain(runner, commands), strict=True)
+            if not result.ok
+        }
+        if errors:
+            raise exc.BatchError(errors, subcommand="set-environment")
+
     def unset_environment(self, name: str) -> None:
         """Unset environment variable ``$ tmux set-environment -u <name>``.
 
@@ -191,18 +297,7 @@ class EnvironmentMixin:
         if self._add_option:
             tmux_args += [self._add_option]
         cmd = self.cmd(*tmux_args)
-        output = cmd.stdout
-        opts = [tuple(item.split("=", 1)) for item in output]
-        opts_dict: dict[str, str | bool] = {}
-        for _t in opts:
-            if len(_t) == 2:
-                opts_dict[_t[0]] = _t[1]
-            elif len(_t) == 1:
-                opts_dict[_t[0]] = True
-            else:
-                raise exc.VariableUnpackingError(variable=_t)
-
-        return opts_dict
+        return parse_environment(cmd.stdout)
 
     def getenv(self, name: str) -> str | bool | None:
         """Show environment variable ``$ tmux show-environment -t [session] <name>``.
@@ -220,6 +315,10 @@ class EnvironmentMixin:
         -------
         str
             Value of environment variable
+
+        .. versionchanged:: 0.63
+
+           Reads tmux's one line of output directly.
         """
         tmux_args: tuple[str | int, ...] = ()
 
@@ -228,18 +327,13 @@ class EnvironmentMixin:
             tmux_args += (self._add_option,)
         tmux_args += (name,)
         cmd = self.cmd(*tmux_args)
-        output = cmd.stdout
-        opts = [tuple(item.split("=", 1)) for item in output]
-        opts_dict: dict[str, str | bool] = {}
-        for _t in opts:
-            if len(_t) == 2:
-                opts_dict[_t[0]] = _t[1]
-            elif len(_t) == 1:
-                opts_dict[_t[0]] = True
-            else:
-                raise exc.VariableUnpackingError(variable=_t)
-
-        return opts_dict.get(name)
+        # tmux prints just the variable asked for, or nothing if it is unset.
+        if not cmd.stdout:
+            return None
+        key, separator, value = cmd.stdout[0].partition("=")
+        if key != name:
+            return None
+        return value if separator else True
 
 
 def raise_if_stderr(proc: tmux_cmd, subcommand: str) -> None:
@@ -303,13 +397,30 @@ class tmux_cmd:
 
         $ tmux new-session -s my session
 
+    Pass *stdin* to feed commands that read standard input:
+
+    >>> proc = tmux_cmd(
+    ...     f'-L{server.socket_name}', 'load-buffer', '-b', 'piped', '-',
+    ...     stdin='from stdin',
+    ... )
+    >>> server.show_buffer(buffer_name='piped')
+    'from stdin'
+
     Notes
     -----
     .. versionchanged:: 0.8
         Renamed from ``tmux`` to ``tmux_cmd``.
+
+    .. versionchanged:: 0.63
+        Added *stdin*.
     """
 
-    def __init__(self, *args: t.Any, tmux_bin: str | None = None) -> None:
+    def __init__(
+        self,
+        *args: t.Any,
+        tmux_bin: str | None = None,
+        stdin: str | None = None,
+    ) -> None:
         resolved = tmux_bin or shutil.which("tmux")
         if not resolved:
             raise exc.TmuxCommandNotFound
@@ -330,13 +441,14 @@ class tmux_cmd:
         try:
             self.process = subprocess.Popen(
                 cmd,
+                stdin=None if stdin is None else subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
                 encoding="utf-8",
                 errors="backslashreplace",
             )
-            stdout, stderr = self.process.communicate()
+            stdout, stderr = self.process.communicate(stdin)
             returncode = self.process.returncode
         except FileNotFoundError:
             raise exc.TmuxCommandNotFound from None
@@ -506,6 +618,15 @@ def get_version(tmux_bin: str | None = None) -> LooseVersion:
         # OpenBSD base tmux lacks ``-V``; skip letter-stripping on the synthetic.
         return LooseVersion(_no_version_flag_fallback())
 
+    return _normalize_version(version)
+
+
+def _normalize_version(version: str) -> LooseVersion:
+    """Return a raw tmux version token as a comparable version.
+
+    Letter suffixes are dropped (``"3.7a"`` compares as ``3.7``) and git
+    builds (``"master"``) compare as the newest supported release.
+    """
     # Allow latest tmux HEAD
     if version == "master":
         return LooseVersion(f"{TMUX_MAX_VERSION}-master")
@@ -515,6 +636,90 @@ def get_version(tmux_bin: str | None = None) -> LooseVersion:
     return LooseVersion(version)
 
 
+class TmuxCapabilities:
+    """Version gates for one tmux server.
+
+    :func:`has_gte_version` and friends ask the *client* binary
+    (``tmux -V``). The server a socket points at can be a different build --
+    a long-running server left behind by an upgrade, or a ``tmux_bin``
+    that differs from the one that started it. Feature gates that decide
+    which flags a command may carry need the server's version, which tmux
+    reports as ``#{version}``.
+
+    Instances are built by :attr:`libtmux.Server.capabilities`; a server
+    probes once and reuses the result for every gate.
+
+    Parameters
+    ----------
+    version_str : str
+        Raw tmux version, e.g. ``"3.7a"`` or ``"master"``.
+    source : str, optional
+        ``"server"`` when read from the server's ``#{version}``, ``"client"``
+        when no server was reachable and the client binary answered instead.
+
+    Examples
+    --------
+    >>> from libtmux.common import TmuxCapabilities
+    >>> caps = TmuxCapabilities("3.4a")
+    >>> caps
+    TmuxCapabilities(version_str='3.4a', source='server')
+    >>> str(caps.version)
+    '3.4'
+    >>> caps.has_gte_version("3.4")
+    True
+    >>> caps.has_lt_version("3.4")
+    False
+
+    The server in use is usually what :attr:`libtmux.Server.capabilities`
+    reports:
+
+    >>> server.capabilities.source
+    'server'
+    >>> server.capabilities.version_str == server.cmd(
+    ...     "display-message", "-p", "#{version}"
+    ... ).stdout[0]
+    True
+    """
+
+    __slots__ = ("source", "version", "version_str")
+
+    def __init__(
+        self,
+        version_str: str,
+        source: t.Literal["server", "client"] = "server",
+    ) -> None:
+        self.version_str = version_str
+        self.source = source
+        self.version = _normalize_version(version_str)
+
+    def __repr__(self) -> str:
+        """Represent capabilities by their raw version and its source."""
+        return (
+            f"{self.__class__.__name__}"
+            f"(version_str={self.version_str!r}, source={self.source!r})"
+        )
+
+    def has_version(self, version: str) -> bool:
+        """Return True if the server runs exactly *version*."""
+        return self.version == LooseVersion(version)
+
+    def has_gt_version(self, min_version: str) -> bool:
+        """Return True if the server is newer than *min_version*."""
+        return self.version > LooseVersion(min_version)
+
+    def has_gte_version(self, min_version: str) -> bool:
+        """Return True if the server is at least *min_version*."""
+        return self.version >= LooseVersion(min_version)
+
+    def has_lte_version(self, max_version: str) -> bool:
+        """Return True if the server is at most *max_version*."""
+        return self.version <= LooseVersion(max_version)
+
+    def has_lt_version(self, max_version: str) -> bool:
+        """Return True if the server is older than *max_version*."""
+        return self.version < LooseVersion(max_version)
+
+
 def has_version(version: str, tmux_bin: str | None = None) -> bool:
     """Return True if tmux version installed.
 
@@ -62,6 +62,50 @@ class LibTmuxException(Exception):
         return f"{self.subcommand}: {base}"
 
 
+class BatchError(LibTmuxException):
+    """Some commands of a batch failed; the rest were carried out.
+
+    Parameters
+    ----------
+    errors : dict
+        tmux's error for each failed item, keyed by what the batch method
+        was given for it (a pane ID, an option name, ...).
+    subcommand : str, optional
+        The tmux subcommand the batch ran.
+    results : object, optional
+        What the batch produced for the items that succeeded, in the form
+        the batch method returns, for methods that return something.
+
+    Examples
+    --------
+    >>> error = BatchError(
+    ...     {"%7": "can't find pane: %7"},
+    ...     subcommand="capture-pane",
+    ...     results={"%1": ["$"]},
+    ... )
+    >>> error.errors
+    {'%7': "can't find pane: %7"}
+    >>> error.results
+    {'%1': ['$']}
+    >>> str(error)
+    "capture-pane: %7: can't find pane: %7"
+
+    .. versionadded:: 0.63
+    """
+
+    def __init__(
+        self,
+        errors: dict[str, str],
+        *args: object,
+        subcommand: str | None = None,
+        results: t.Any = None,
+    ) -> None:
+        self.errors = errors
+        self.results = results
+        summary = "; ".join(f"{key}: {error}" for key, error in errors.items())
+        super().__init__(summary, *args, subcommand=subcommand)
+
+
 class DeprecatedError(LibTmuxException):
     """Raised when a deprecated function, method, or parameter is used.
 
@@ -346,6 +390,49 @@ class AmbiguousOption(OptionError):
     """Option that could potentially match more than one."""
 
 
+class OptionBatchError(BatchError, OptionError):
+    """Some options or hooks of a batch could not be set; the rest were.
+
+    Both a :exc:`BatchError` and an :exc:`OptionError`, so code that catches
+    option errors from :meth:`~libtmux.options.OptionsMixin.set_option`
+    catches these too.
+
+    Parameters
+    ----------
+    option_errors : dict
+        The error for each failed option, keyed by option name, classified
+        by :func:`~libtmux.options.handle_option_error`.
+    subcommand : str, optional
+        The tmux subcommand the batch ran.
+
+    Examples
+    --------
+    >>> error = OptionBatchError(
+    ...     {"no-such": UnknownOption("invalid option: no-such")},
+    ...     subcommand="set-option",
+    ... )
+    >>> type(error.option_errors["no-such"]).__name__
+    'UnknownOption'
+    >>> str(error)
+    'set-option: no-such: invalid option: no-such'
+
+    .. versionadded:: 0.63
+    """
+
+    def __init__(
+        self,
+        option_errors: dict[str, OptionError],
+        *args: object,
+        subcommand: str | None = None,
+    ) -> None:
+        self.option_errors = option_errors
+        super().__init__(
+            {name: str(error) for name, error in option_errors.items()},
+            *args,
+            subcommand=subcommand,
+        )
+
+
 class WaitTimeout(LibTmuxException):
     """Function timed out without meeting condition."""
 
@@ -24,7 +24,8 @@ Bulk Operations API
 -------------------
 This module provides bulk operations for managing multiple indexed hooks:
 
-- :meth:`~HooksMixin.set_hooks` - Set multiple hooks at once
+- :meth:`~HooksMixin.set_hooks` - Set multiple hooks at once, in one tmux
+  invocation
 """
 
 from __future__ import annotations
@@ -34,29 +35,32 @@ import re
 import typing as t
 import warnings
 
+from libtmux._internal.command_chain import chain_target, run_chain
 from libtmux._internal.constants import (
     Hooks,
 )
+from libtmux._internal.option_cache import OptionCacheMixin
 from libtmux._internal.sparse_array import SparseArray
-from libtmux.common import CmdMixin, has_lt_version
 from libtmux.constants import (
     DEFAULT_OPTION_SCOPE,
     HOOK_SCOPE_FLAG_MAP,
     OptionScope,
     _DefaultOptionScope,
 )
-from libtmux.options import handle_option_error
+from libtmux.options import handle_option_error, raise_option_errors
 
 if t.TYPE_CHECKING:
     from typing_extensions import Self
 
+    from libtmux.common import TmuxCapabilities
+
 HookDict = dict[str, t.Any]
 HookValues = dict[int, str] | SparseArray[str] | list[str]
 
 logger = logging.getLogger(__name__)
 
 
-class HooksMixin(CmdMixin):
+class HooksMixin(OptionCacheMixin):
     """Mixin for manager scoped hooks in tmux.
 
     Requires tmux 3.1+. For older versions, use raw commands.
@@ -71,11 +75,10 @@ class HooksMixin(CmdMixin):
         self.hooks = Hooks()
 
     @property
-    def _tmux_bin(self) -> str | None:
-        """Resolve tmux_bin from self (Server) or self.server (Session/Window/Pane)."""
-        return getattr(self, "tmux_bin", None) or getattr(
-            getattr(self, "server", None), "tmux_bin", None
-        )
+    def _server_capabilities(self) -> TmuxCapabilities:
+        """Resolve capabilities from self (Server) or self.server (Window, etc.)."""
+        server: t.Any = getattr(self, "server", self)
+        return t.cast("TmuxCapabilities", server.capabilities)
 
     def run_hook(
         self,
@@ -96,7 +99,7 @@ class HooksMixin(CmdMixin):
             assert scope in HOOK_SCOPE_FLAG_MAP
 
             flag = HOOK_SCOPE_FLAG_MAP[scope]
-            if flag in {"-p", "-w"} and has_lt_version("3.2", tmux_bin=self._tmux_bin):
+            if flag in {"-p", "-w"} and self._server_capabilities.has_lt_version("3.2"):
                 warnings.warn(
                     "Scope flag '-w' and '-p' requires tmux 3.2+. Ignoring.",
                     stacklevel=2,
@@ -142,9 +145,6 @@ class HooksMixin(CmdMixin):
         :exc:`exc.OptionError`, :exc:`exc.UnknownOption`,
         :exc:`exc.InvalidOption`, :exc:`exc.AmbiguousOption`
         """
-        if scope is DEFAULT_OPTION_SCOPE:
-            scope = self.default_hook_scope
-
         if g:
             warnings.warn(
                 "g argument is deprecated in favor of global_",
@@ -167,21 +167,7 @@ class HooksMixin(CmdMixin):
             assert isinstance(append, bool)
             flags.append("-a")
 
-        if global_ is not None and global_:
-            assert isinstance(global_, bool)
-            flags.append("-g")
-
-        if scope is not None and not isinstance(scope, _DefaultOptionScope):
-            assert scope in HOOK_SCOPE_FLAG_MAP
-
-            flag = HOOK_SCOPE_FLAG_MAP[scope]
-            if flag in {"-p", "-w"} and has_lt_version("3.2", tmux_bin=self._tmux_bin):
-                warnings.warn(
-                    "Scope flag '-w' and '-p' requires tmux 3.2+. Ignoring.",
-                    stacklevel=2,
-                )
-            else:
-                flags += (flag,)
+        flags += self._hook_flags(global_=global_, scope=scope)
 
         cmd = self.cmd(
             "set-hook",
@@ -189,12 +175,45 @@ class HooksMixin(CmdMixin):
             hook,
             value,
         )
+        self._note_option_write()
 
         if isinstance(cmd.stderr, list) and len(cmd.stderr):
             handle_option_error(cmd.stderr[0])
 
         return self
 
+    def _hook_flags(
+        self,
+        *,
+        global_: bool | None,
+        scope: OptionScope | _DefaultOptionScope | None,
+    ) -> list[str]:
+        """Return the ``set-hook`` flags for *global_* and *scope*.
+
+        Window and pane scopes need tmux 3.2; on older servers they warn
+        and are left out.
+        """
+        if scope is DEFAULT_OPTION_SCOPE:
+            scope = self.default_hook_scope
+
+        flags: list[str] = []
+        if global_ is not None and global_:
+            assert isinstance(global_, bool)
+            flags.append("-g")
+
+        if scope is not None and not isinstance(scope, _DefaultOptionScope):
+            assert scope in HOOK_SCOPE_FLAG_MAP
+
+            flag = HOOK_SCOPE_FLAG_MAP[scope]
+            if flag in {"-p", "-w"} and self._server_capabilities.has_lt_version("3.2"):
+                warnings.warn(
+                    "Scope flag '-w' and '-p' requires tmux 3.2+. Ignoring.",
+                    stacklevel=3,
+                )
+            else:
+                flags.append(flag)
+        return flags
+
     def unset_hook(
         self,
         hook: str,
@@ -228,7 +247,7 @@ class HooksMixin(CmdMixin):
             assert scope in HOOK_SCOPE_FLAG_MAP
 
             flag = HOOK_SCOPE_FLAG_MAP[scope]
-            if flag in {"-p", "-w"} and has_lt_version("3.2", tmux_bin=self._tmux_bin):
+            if flag in {"-p", "-w"} and self._server_capabilities.has_lt_version("3.2"):
                 warnings.warn(
                     "Scope flag '-w' and '-p' requires tmux 3.2+. Ignoring.",
                     stacklevel=2,
@@ -241,6 +260,7 @@ class HooksMixin(CmdMixin):
             *flags,
             hook,
         )
+        self._note_option_write()
 
         if isinstance(cmd.stderr, list) and len(cmd.stderr):
             handle_option_error(cmd.stderr[0])
@@ -293,7 +313,7 @@ class HooksMixin(CmdMixin):
             assert scope in HOOK_SCOPE_FLAG_MAP
 
             flag = HOOK_SCOPE_FLAG_MAP[scope]
-            if flag in {"-p", "-w"} and has_lt_version("3.2", tmux_bin=self._tmux_bin):
+            if flag in {"-p", "-w"} and self._server_capabilities.has_lt_version("3.2"):
                 warnings.warn(
                     "Scope flag '-w' and '-p' requires tmux 3.2+. Ignoring.",
                     stacklevel=2,
@@ -301,7 +321,7 @@ class HooksMixin(CmdMixin):
             else:
                 flags += (flag,)
 
-        cmd = self.cmd("show-hooks", *flags)
+        cmd = self._cached_cmd("show-hooks", *flags)
         output = cmd.stdout
         hooks: HookDict = {}
         for item in output:
@@ -351,7 +371,7 @@ class HooksMixin(CmdMixin):
             assert scope in HOOK_SCOPE_FLAG_MAP
 
             flag = HOOK_SCOPE_FLAG_MAP[scope]
-            if flag in {"-p", "-w"} and has_lt_version("3.2", tmux_bin=self._tmux_bin):
+            if flag in {"-p", "-w"} and self._server_capabilities.has_lt_version("3.2"):
                 warnings.warn(
                     "Scope flag '-w' and '-p' requires tmux 3.2+. Ignoring.",
                     stacklevel=2,
@@ -361,7 +381,7 @@ class HooksMixin(CmdMixin):
 
         flags += (hook,)
 
-        cmd = self.cmd("show-hooks", *flags)
+        cmd = self._cached_cmd("show-hooks", *flags)
 
         if len(cmd.stderr):
             handle_option_error(cmd.stderr[0])
@@ -445,6 +465,9 @@ class HooksMixin(CmdMixin):
     ) -> Self:
         """Set multiple indexed hooks at once.
 
+        All values, and the unset of ``clear_existing``, are sent as one
+        chained command sequence: one tmux process however many indices.
+
         Parameters
         ----------
         hook : str
@@ -466,6 +489,13 @@ class HooksMixin(CmdMixin):
         Self
             Returns self for method chaining.
 
+        Raises
+        ------
+        :exc:`exc.OptionBatchError`
+            For indices tmux rejected, keyed ``hook[index]`` and classified
+            by :func:`~libtmux.options.handle_option_error`; the others are
+            set.
+
         Examples
         --------
         Set hooks with explicit indices:
@@ -514,19 +544,23 @@ class HooksMixin(CmdMixin):
         >>> session.unset_hook('after-new-window')
         Session($...)
         """
-        if clear_existing:
-            self.unset_hook(hook, global_=global_, scope=scope)
+        flags = self._hook_flags(global_=global_, scope=scope)
 
         # Convert list to dict with sequential indices
         if isinstance(values, list):
             values = dict(enumerate(values))
 
+        runner, target = chain_target(self)
+        names: list[str] = []
+        commands: list[list[str]] = []
+        if clear_existing:
+            names.append(hook)
+            commands.append(["set-hook", *target, "-u", *flags, hook])
         for index, value in values.items():
-            self.set_hook(
-                f"{hook}[{index}]",
-                value,
-                global_=global_,
-                scope=scope,
-            )
+            names.append(f"{hook}[{index}]")
+            commands.append(["set-hook", *target, *flags, names[-1], str(value)])
 
+        results = run_chain(runner, commands)
+        self._note_option_write()
+        raise_option_errors(names, results, "set-hook")
         return self
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import dataclasses
+import datetime
 import functools
 import logging
 import shlex
@@ -11,7 +12,9 @@ from collections.abc import Iterable
 
 from libtmux import exc
 from libtmux._compat import LooseVersion
-from libtmux.common import get_version, raise_if_stderr, tmux_cmd
+from libtmux._internal.single_flight import SingleFlight
+from libtmux._internal.table import Table
+from libtmux.common import raise_if_stderr, tmux_cmd
 from libtmux.formats import FORMAT_SEPARATOR
 
 if t.TYPE_CHECKING:
@@ -986,6 +989,8 @@ def parse_output(
     output: str,
     list_cmd: str = "list-panes",
     tmux_version: str = "3.2a",
+    *,
+    typed: bool = False,
 ) -> OutputRaw:
     """Parse a tmux ``-F`` line into a dict keyed by Obj field name.
 
@@ -1002,11 +1007,19 @@ def parse_output(
         Same value passed to :func:`get_output_format`.
     tmux_version : str
         Same value passed to :func:`get_output_format`.
+    typed : bool
+        Decode each value through :func:`decode_field` while the line is
+        split, so integers, flags, timestamps and lists are converted once
+        here rather than at every comparison. Off by default: the values
+        :class:`Obj` fields hold are strings.
+
+        .. versionadded:: 0.63
 
     Returns
     -------
     OutputRaw
-        A dict mapping field names to non-empty string values.
+        A dict mapping field names to non-empty values: strings, or decoded
+        values when *typed* is set.
 
     Examples
     --------
@@ -1024,6 +1037,17 @@ def parse_output(
     '$1'
     >>> 'pane_id' in result
     False
+
+    With *typed*, numeric fields come back as numbers:
+
+    >>> values[fields.index('session_windows')] = '10'
+    >>> parse_output(
+    ...     FORMAT_SEPARATOR.join(values) + FORMAT_SEPARATOR,
+    ...     list_cmd="list-sessions",
+    ...     tmux_version="3.6a",
+    ...     typed=True,
+    ... )['session_windows']
+    10
     """
     formats, _ = get_output_format(list_cmd, tmux_version)
     values = output.split(FORMAT_SEPARATOR)
@@ -1033,14 +1057,298 @@ def parse_output(
         values = values[:-1]
 
     formatter = dict(zip(formats, values, strict=True))
+    if typed:
+        return {k: decode_field(k, v) for k, v in formatter.items() if v}
     return {k: v for k, v in formatter.items() if v}
 
 
+NUMERIC_FIELDS: frozenset[str] = frozenset(
+    {
+        # Counts, sizes, positions, indexes and PIDs.
+        "active_window_index",
+        "alternate_saved_x",
+        "alternate_saved_y",
+        "buffer_size",
+        "client_cell_height",
+        "client_cell_width",
+        "client_discarded",
+        "client_height",
+        "client_pid",
+        "client_uid",
+        "client_width",
+        "client_written",
+        "copy_cursor_x",
+        "copy_cursor_y",
+        "cursor_x",
+        "cursor_y",
+        "history_bytes",
+        "history_limit",
+        "history_size",
+        "last_window_index",
+        "line",
+        "pane_bottom",
+        "pane_dead_signal",
+        "pane_dead_status",
+        "pane_height",
+        "pane_in_mode",
+        "pane_index",
+        "pane_left",
+        "pane_pb_progress",
+        "pane_pid",
+        "pane_pipe_pid",
+        "pane_right",
+        "pane_top",
+        "pane_width",
+        "pane_x",
+        "pane_y",
+        "pane_z",
+        "pid",
+        "scroll_position",
+        "scroll_region_lower",
+        "scroll_region_upper",
+        "selection_end_x",
+        "selection_end_y",
+        "selection_start_x",
+        "selection_start_y",
+        "session_attached",
+        "session_group_attached",
+        "session_group_size",
+        "session_windows",
+        "uid",
+        "window_active_clients",
+        "window_active_sessions",
+        "window_cell_height",
+        "window_cell_width",
+        "window_height",
+        "window_index",
+        "window_linked_sessions",
+        "window_offset_x",
+        "window_offset_y",
+        "window_panes",
+        "window_stack_index",
+        "window_width",
+        # Unix timestamps, in seconds.
+        "client_activity",
+        "client_created",
+        "pane_dead_time",
+        "session_activity",
+        "session_created",
+        "session_last_attached",
+        "start_time",
+        "window_activity",
+    },
+)
+"""Format tokens tmux always reports as a base-10 integer.
+
+:func:`fetch_table` decodes these columns to :class:`int` once, as it reads
+the listing, so numeric filters and sorts order ``10`` after ``9``.
+"""
+
+
+_TIME_FIELDS: frozenset[str] = frozenset(
+    {
+        "client_activity",
+        "client_created",
+        "pane_dead_time",
+        "session_activity",
+        "session_created",
+        "session_last_attached",
+        "start_time",
+        "window_activity",
+    },
+)
+"""The :data:`NUMERIC_FIELDS` that are Unix timestamps."""
+
+_FLAG_FIELDS: frozenset[str] = frozenset(
+    {
+        "bracket_paste_flag",
+        "client_control_mode",
+        "client_prefix",
+        "client_readonly",
+        "cursor_flag",
+        "insert_flag",
+        "keypad_cursor_flag",
+        "keypad_flag",
+        "mouse_all_flag",
+        "mouse_any_flag",
+        "mouse_button_flag",
+        "mouse_sgr_flag",
+        "mouse_standard_flag",
+        "origin_flag",
+        "pane_active",
+        "pane_at_bottom",
+        "pane_at_left",
+        "pane_at_right",
+        "pane_at_top",
+        "pane_dead",
+        "pane_floating_flag",
+        "pane_format",
+        "pane_input_off",
+        "pane_last",
+        "pane_marked",
+        "pane_marked_set",
+        "pane_pipe",
+        "pane_synchronized",
+        "pane_zoomed_flag",
+        "session_format",
+        "session_group_many_attached",
+        "session_grouped",
+        "session_many_attached",
+        "session_marked",
+        "synchronized_output_flag",
+        "window_active",
+        "window_activity_flag",
+        "window_bell_flag",
+        "window_bigger",
+        "window_end_flag",
+        "window_format",
+        "window_last_flag",
+        "window_linked",
+        "window_marked_flag",
+        "window_silence_flag",
+        "window_start_flag",
+        "window_zoomed_flag",
+        "wrap_flag",
+    },
+)
+"""Format tokens tmux reports as ``"1"`` or ``"0"``."""
+
+_LIST_FIELDS: frozenset[str] = frozenset(
+    {
+        "client_flags",
+        "client_termfeatures",
+        "pane_tabs",
+        "session_alerts",
+        "session_attached_list",
+        "session_group_attached_list",
+        "session_stack",
+        "window_active_clients_list",
+    },
+)
+"""Format tokens tmux reports as comma-separated lists of comma-free items.
+
+Flags, feature names, tab stops, window indexes and client (tty) names never
+contain a comma, so splitting is exact. Lists of session names
+(``session_group_list``, ``window_active_sessions_list``,
+``window_linked_sessions_list``) and of paths (``config_files``) are left
+out: a session named ``"a,b"`` would split into two, so they stay
+:class:`str`.
+"""
+
+FieldType = t.Literal["int", "flag", "time", "list"]
+
+_FIELDS_BY_TYPE: tuple[tuple[FieldType, frozenset[str]], ...] = (
+    ("int", NUMERIC_FIELDS - _TIME_FIELDS),
+    ("time", _TIME_FIELDS),
+    ("flag", _FLAG_FIELDS),
+    ("list", _LIST_FIELDS),
+)
+
+FIELD_TYPES: dict[str, FieldType] = {
+    name: kind for kind, names in _FIELDS_BY_TYPE for name in sorted(names)
+}
+"""Value type of each format token that is not free text.
+
+Drives :func:`decode_field`, and through it the ``typed=True`` mode of
+:func:`parse_output` and :func:`fetch_objs`:
+
+- ``"int"``: a count, size, position, index or PID, decoded to :class:`int`.
+- ``"time"``: a Unix timestamp in seconds, decoded to a UTC
+  :class:`~datetime.datetime`.
+- ``"flag"``: ``"1"`` or ``"0"``, decoded to :class:`bool`.
+- ``"list"``: comma-separated, decoded to a :class:`tuple` of :class:`str`.
+
+Tokens absent from this dict (names, ids, paths, layouts, lists of session
+names or paths, and the ``*_flags`` strings such as ``window_flags``) stay
+:class:`str`, so decoding never changes what a value says.
+"""
+
+
+def decode_field(name: str, value: str) -> t.Any:
+    """Decode one tmux format value according to :data:`FIELD_TYPES`.
+
+    Parameters
+    ----------
+    name : str
+        Format token the value was reported for, e.g. ``"pane_width"``.
+    value : str
+        Non-empty value as tmux printed it.
+
+    Returns
+    -------
+    int | bool | datetime.datetime | tuple[str, ...] | str
+        The decoded value; *value* unchanged for free-text tokens.
+
+    Raises
+    ------
+    ValueError
+        When an ``"int"`` or ``"time"`` token does not hold an integer.
+
+    Examples
+    --------
+    >>> from libtmux.neo import decode_field
+    >>> decode_field("window_index", "10")
+    10
+    >>> decode_field("pane_active", "1")
+    True
+    >>> decode_field("session_created", "0")
+    datetime.datetime(1970, 1, 1, 0, 0, tzinfo=datetime.timezone.utc)
+    >>> decode_field("session_attached_list", "/dev/pts/1,/dev/pts/2")
+    ('/dev/pts/1', '/dev/pts/2')
+    >>> decode_field("window_name", "10")
+    '10'
+    """
+    kind = FIELD_TYPES.get(name)
+    if kind is None:
+        return value
+    if kind == "int":
+        return int(value)
+    if kind == "flag":
+        return value == "1"
+    if kind == "time":
+        return datetime.datetime.fromtimestamp(int(value), tz=datetime.timezone.utc)
+    return tuple(value.split(","))
+
+
+def _list_cmd_args(
+    server: Server,
+    list_cmd: str,
+    format_string: str,
+    list_extra_args: ListExtraArgs = None,
+    filter: str | None = None,  # noqa: A002
+) -> list[str | int]:
+    """Return the tmux argv for a ``list-*`` query against *server*.
+
+    Shared by :func:`fetch_objs` and :func:`fetch_table`, so both address the
+    server and order their flags identically.
+    """
+    tmux_cmds: list[str | int] = []
+
+    if server.socket_name:
+        tmux_cmds.insert(0, f"-L{server.socket_name}")
+    if server.socket_path:
+        tmux_cmds.insert(0, f"-S{server.socket_path}")
+
+    tmux_cmds.append(list_cmd)
+
+    if list_extra_args is not None and isinstance(list_extra_args, Iterable):
+        tmux_cmds.extend(list(list_extra_args))
+
+    if filter is not None:
+        tmux_cmds.extend(["-f", filter])
+
+    tmux_cmds.append(f"-F{format_string}")
+    return tmux_cmds
+
+
 def fetch_objs(
     server: Server,
     list_cmd: ListCmd,
     list_extra_args: ListExtraArgs = None,
     filter: str | None = None,  # noqa: A002
+    *,
+    typed: bool = False,
+    coalesce: bool | None = None,
 ) -> OutputsRaw:
     """Fetch a listing of raw data from a tmux command.
 
@@ -1072,12 +1380,33 @@ def fetch_objs(
             caveat.
 
         .. versionadded:: 0.57
+    typed : bool
+        Decode values per :data:`FIELD_TYPES` as each line is parsed (see
+        :func:`parse_output`). Wrap the result in a
+        :class:`~libtmux._internal.query_list.QueryList` to filter and sort
+        on real numbers, flags and timestamps.
+
+        .. versionadded:: 0.63
+    coalesce : bool, optional
+        Share one tmux call among threads running the identical query at the
+        same moment: the first caller runs ``list-*``, the others wait for it
+        and receive copies of its rows. Defaults to
+        :attr:`Server.coalesce_queries <libtmux.Server.coalesce_queries>`, so
+        a server opted in coalesces the lookups behind
+        :attr:`Server.panes <libtmux.Server.panes>`,
+        :attr:`Session.windows <libtmux.Session.windows>` and friends.
+        Results are never reused once the call returns, but a caller joining
+        a listing already in flight gets rows read before it arrived and may
+        miss its own preceding writes; pass ``False`` where a read must
+        observe them.
+
+        .. versionadded:: 0.63
 
     Returns
     -------
     OutputsRaw
         A list of dicts, each mapping tmux format field names to their
-        non-empty string values.
+        non-empty values: strings, or decoded values when *typed* is set.
 
     Raises
     ------
@@ -1094,30 +1423,55 @@ def fetch_objs(
     True
     >>> 'session_id' in objs[0]
     True
+
+    Typed rows compare as numbers, so window ``10`` sorts after window ``9``:
+
+    >>> from libtmux._internal.query_list import QueryList
+    >>> windows = QueryList(
+    ...     fetch_objs(server=server, list_cmd="list-windows", typed=True)
+    ... )
+    >>> isinstance(windows[0]["window_index"], int)
+    True
+    >>> windows.filter(window_panes__gte=1) == windows
+    True
     """
-    tmux_version = str(get_version(tmux_bin=server.tmux_bin))
+    tmux_version = str(server.capabilities.version)
     _fields, format_string = get_output_format(list_cmd, tmux_version)
 
-    cmd_args: list[str | int] = []
+    tmux_cmds = _list_cmd_args(
+        server,
+        list_cmd,
+        format_string,
+        list_extra_args=list_extra_args,
+        filter=filter,
+    )
 
-    if server.socket_name:
-        cmd_args.insert(0, f"-L{server.socket_name}")
-    if server.socket_path:
-        cmd_args.insert(0, f"-S{server.socket_path}")
+    if coalesce is None:
+        coalesce = server.coalesce_queries
+    if not coalesce:
+        return _run_list_cmd(server, list_cmd, tmux_cmds, tmux_version, typed)
 
-    tmux_cmds = [
-        *cmd_args,
-        list_cmd,
-    ]
+    key = (server.tmux_bin, typed, *map(str, tmux_cmds))
+    outputs = _in_flight_lists.do(
+        key,
+        lambda: _run_list_cmd(server, list_cmd, tmux_cmds, tmux_version, typed),
+    )
+    # Every waiter holds the same list; hand each caller rows of its own.
+    return [dict(row) for row in outputs]
 
-    if list_extra_args is not None and isinstance(list_extra_args, Iterable):
-        tmux_cmds.extend(list(list_extra_args))
 
-    if filter is not None:
-        tmux_cmds.extend(["-f", filter])
+_in_flight_lists: SingleFlight[OutputsRaw] = SingleFlight()
+"""Identical ``list-*`` queries in flight, shared by coalescing callers."""
 
-    tmux_cmds.append(f"-F{format_string}")
 
+def _run_list_cmd(
+    server: Server,
+    list_cmd: ListCmd,
+    tmux_cmds: list[str | int],
+    tmux_version: str,
+    typed: bool,
+) -> OutputsRaw:
+    """Run a ``list-*`` argv built by :func:`_list_cmd_args` and parse it."""
     cmd_str: str | None = None
 
     if logger.isEnabledFor(logging.DEBUG):
@@ -1137,7 +1491,9 @@ def fetch_objs(
 
     raise_if_stderr(proc, list_cmd)
 
-    outputs = [parse_output(line, list_cmd, tmux_version) for line in proc.stdout]
+    outputs = [
+        parse_output(line, list_cmd, tmux_version, typed=typed) for line in proc.stdout
+    ]
 
     if logger.isEnabledFor(logging.DEBUG):
         if cmd_str is None:
@@ -1154,6 +1510,92 @@ def fetch_objs(
     return outputs
 
 
+def fetch_table(
+    server: Server,
+    list_cmd: ListCmd,
+    list_extra_args: ListExtraArgs = None,
+    filter: str | None = None,  # noqa: A002
+) -> Table:
+    """Fetch a tmux listing as one column per field.
+
+    Runs the same query as :func:`fetch_objs` but appends each line's values
+    straight onto per-field columns, so aggregating over thousands of panes
+    allocates no per-row dict or :class:`Obj`. Columns named in
+    :data:`NUMERIC_FIELDS` are decoded to :class:`int` while the listing is
+    read; every other column holds :class:`str`, and empty cells are
+    ``None``.
+
+    Parameters
+    ----------
+    server : :class:`~libtmux.server.Server`
+        The tmux server to query.
+    list_cmd : ListCmd
+        The tmux list command to run, e.g. ``"list-panes"``.
+    list_extra_args : ListExtraArgs, optional
+        Extra arguments appended to the tmux command, e.g. ``("-a",)``.
+    filter : str, optional
+        Filter expression evaluated by tmux (``-f`` flag). Shares the
+        malformed-filter caveat documented on :func:`fetch_objs`.
+
+    Returns
+    -------
+    :class:`~libtmux._internal.table.Table`
+        One column per field in the ``-F`` template, one row per object tmux
+        listed, in tmux's order.
+
+    Raises
+    ------
+    :exc:`~libtmux.exc.LibTmuxException`
+        If the tmux command writes to stderr.
+
+    Examples
+    --------
+    >>> from libtmux.neo import fetch_table
+    >>> _ = window.split()
+    >>> table = fetch_table(
+    ...     server=server, list_cmd="list-panes", list_extra_args=("-a",)
+    ... )
+    >>> len(table) >= 2
+    True
+    >>> all(isinstance(width, int) for width in table.column("pane_width"))
+    True
+    >>> table.column("pane_id")[0].startswith("%")
+    True
+
+    Group panes by window and total their scrollback, without an object per
+    pane:
+
+    >>> by_window = table.group_by("window_id")
+    >>> history = {
+    ...     window_id: sum(panes.column("history_size"))
+    ...     for window_id, panes in by_window.items()
+    ... }
+    >>> all(isinstance(lines, int) for lines in history.values())
+    True
+    """
+    tmux_version = str(server.capabilities.version)
+    fields, format_string = get_output_format(list_cmd, tmux_version)
+
+    tmux_cmds = _list_cmd_args(
+        server,
+        list_cmd,
+        format_string,
+        list_extra_args=list_extra_args,
+        filter=filter,
+    )
+
+    proc = tmux_cmd(*tmux_cmds, tmux_bin=server.tmux_bin)
+
+    raise_if_stderr(proc, list_cmd)
+
+    return Table.from_lines(
+        proc.stdout,
+        fields=fields,
+        separator=FORMAT_SEPARATOR,
+        numeric=NUMERIC_FIELDS,
+    )
+
+
 def _is_target_not_found_error(stderr_text: str) -> bool:
     """Return True if tmux failed because the ``-t`` target does not exist.
 
@@ -1201,6 +1643,47 @@ def _is_target_not_found_error(stderr_text: str) -> bool:
     return "can't find " in stderr_text
 
 
+_FILTERABLE_LIST_CMDS: frozenset[str] = frozenset(
+    {"list-sessions", "list-windows", "list-panes"},
+)
+"""``list-*`` subcommands that accept a ``-f`` filter on every supported tmux.
+
+``list-clients`` is absent: tmux 3.3a still rejects ``-f`` there (``unknown
+flag -f``), so client lookups keep matching in Python.
+"""
+
+
+def _escape_format_argument(value: str) -> str:
+    """Escape *value* for use as an argument inside a tmux ``#{...}`` format.
+
+    ``#``, ``,`` and ``}`` are escaped with a leading ``#`` so a value such as a
+    session name containing a comma cannot end the argument early.
+
+    Examples
+    --------
+    >>> from libtmux.neo import _escape_format_argument
+    >>> _escape_format_argument("a,b}#c")
+    'a#,b#}##c'
+    """
+    return value.replace("#", "##").replace(",", "#,").replace("}", "#}")
+
+
+def _exact_match_filter(obj_key: str, obj_id: str) -> str:
+    """Return a tmux ``-f`` expression true only where *obj_key* equals *obj_id*.
+
+    *obj_id* is escaped with :func:`_escape_format_argument`.
+
+    Examples
+    --------
+    >>> from libtmux.neo import _exact_match_filter
+    >>> _exact_match_filter("pane_id", "%3")
+    '#{==:#{pane_id},%3}'
+    >>> _exact_match_filter("session_name", "a,b}")
+    '#{==:#{session_name},a#,b#}}'
+    """
+    return f"#{{==:#{{{obj_key}}},{_escape_format_argument(obj_id)}}}"
+
+
 def _best_winlink(rows: OutputsRaw) -> OutputRaw:
     """Pick the winlink row tmux would select.
 
@@ -1281,6 +1764,12 @@ def fetch_obj(
 ) -> OutputRaw:
     """Fetch the single ``list-*`` row whose *obj_key* equals *obj_id*.
 
+    The listing carries an exact-match ``-f`` filter (see
+    :func:`_exact_match_filter`), so tmux returns only the rows being asked
+    for rather than every sibling in scope: refreshing one pane of a
+    forty-pane window parses one row, not forty. ``list-clients`` takes no
+    ``-f`` on older tmux, so client lookups are matched in Python instead.
+
     A listing enumerates :term:`winlinks <winlink>`, so a window linked into one
     session at two indexes matches twice. :func:`_best_winlink` then picks the
     row tmux itself would act on, rather than whichever sorted last.
@@ -1341,11 +1830,17 @@ def fetch_obj(
     ...     print(e)
     Could not find pane_id=%99999 for list-panes ('-t', '%99999')
     """
+    row_filter = (
+        _exact_match_filter(obj_key, obj_id)
+        if list_cmd in _FILTERABLE_LIST_CMDS
+        else None
+    )
     try:
         obj_formatters_filtered = fetch_objs(
             server=server,
             list_cmd=list_cmd,
             list_extra_args=list_extra_args,
+            filter=row_filter,
         )
     except exc.LibTmuxException as e:
         # A ``-t``-scoped listing pushes the "does it exist?" question down
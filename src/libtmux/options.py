@@ -67,15 +67,14 @@ to differentiate them, run ``show_options()`` without ``include_inherited=True``
 
 from __future__ import annotations
 
-import io
 import logging
 import re
-import shlex
 import typing as t
 import warnings
 
+from libtmux._internal.command_chain import chain_target, run_chain
+from libtmux._internal.option_cache import OptionCacheMixin
 from libtmux._internal.sparse_array import SparseArray
-from libtmux.common import CmdMixin
 from libtmux.constants import (
     DEFAULT_OPTION_SCOPE,
     OPTION_SCOPE_FLAG_MAP,
@@ -86,10 +85,12 @@ from libtmux.constants import (
 from . import exc
 
 if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
     from typing import TypeAlias
 
     from typing_extensions import Self
 
+    from libtmux._internal.command_chain import CommandResult
     from libtmux._internal.constants import TerminalFeatures
     from libtmux.common import tmux_cmd
 
@@ -117,6 +118,47 @@ ExplodedComplexUntypedOptionsDict: TypeAlias = dict[
 logger = logging.getLogger(__name__)
 
 
+def raise_option_errors(
+    names: Sequence[str],
+    results: Sequence[CommandResult],
+    subcommand: str,
+) -> None:
+    """Raise for the chained option commands that failed.
+
+    *names* are the options the commands in *results* set, in order.
+
+    Raises
+    ------
+    :exc:`exc.OptionBatchError`
+        With each failure classified by :func:`handle_option_error`.
+
+    Examples
+    --------
+    >>> from libtmux._internal.command_chain import CommandResult
+    >>> raise_option_errors(
+    ...     ["@ok", "bogus"],
+    ...     [
+    ...         CommandResult(("set-option", "@ok", "1"), [], []),
+    ...         CommandResult(("set-option", "bogus", "1"), [], ["invalid option: bogus"]),
+    ...     ],
+    ...     "set-option",
+    ... )
+    Traceback (most recent call last):
+    ...
+    libtmux.exc.OptionBatchError: set-option: bogus: invalid option: bogus
+    """
+    errors: dict[str, exc.OptionError] = {}
+    for name, result in zip(names, results, strict=True):
+        if result.ok:
+            continue
+        try:
+            handle_option_error(result.stderr[0])
+        except exc.OptionError as error:
+            errors[name] = error
+    if errors:
+        raise exc.OptionBatchError(errors, subcommand=subcommand)
+
+
 def handle_option_error(error: str) -> type[exc.OptionError]:
     """Raise exception if error in option command found.
 
@@ -251,8 +293,75 @@ def convert_values(
     return convert_value(value)
 
 
+#: A value holding no quote, escape or blank: used as-is.
+_PLAIN_VALUE = re.compile(r"[^ \t\r\n'\"\\]*")
+
+#: A value that is one shell word: quoted runs, escapes and bare text.
+_QUOTED_VALUE = re.compile(
+    r"""[ \t\r\n]*(?P<word>(?:'[^']*'|"(?:[^"\\]|\\.)*"|\\.|[^ \t\r\n'"\\])+)[ \t\r\n]*""",
+    re.DOTALL,
+)
+
+#: One piece of a quoted word.
+_WORD_PART = re.compile(
+    r"""'(?P<single>[^']*)'|"(?P<double>(?:[^"\\]|\\.)*)"|\\(?P<escaped>.)""",
+    re.DOTALL,
+)
+
+#: The escapes honoured inside double quotes.
+_DOUBLE_QUOTED_ESCAPE = re.compile(r'\\([\\"])')
+
+#: An array option's key: ``name[index]``, with ``*`` when inherited.
+_ARRAY_KEY = re.compile(r"(?P<option>[\w-]+)(\[(?P<index>\d+)\])?(?P<inherited>\*)?")
+
+
+def _unquote_part(match: re.Match[str]) -> str:
+    """Return the text a piece of a quoted word stands for."""
+    if match["single"] is not None:
+        return match["single"]
+    if match["double"] is not None:
+        return _DOUBLE_QUOTED_ESCAPE.sub(r"\1", match["double"])
+    return match["escaped"]
+
+
+def _parse_option_line(line: str) -> tuple[str, str | None] | None:
+    r"""Split one line of tmux option output into its key and value.
+
+    Values are unquoted the way :func:`shlex.split` would, in one pass: a
+    value that is not a single shell word is kept as tmux printed it.
+    Returns None for a line without a key.
+
+    Examples
+    --------
+    >>> _parse_option_line("status-keys vi")
+    ('status-keys', 'vi')
+    >>> _parse_option_line("user-keys")
+    ('user-keys', None)
+    >>> _parse_option_line(r'command-alias[0] "info=show-messages -JT"')
+    ('command-alias[0]', 'info=show-messages -JT')
+    >>> _parse_option_line("@quote 'it'\\''s'")
+    ('@quote', "it's")
+    >>> _parse_option_line("session-closed[0] display-message 'gone'")
+    ('session-closed[0]', "display-message 'gone'")
+    >>> _parse_option_line("") is None
+    True
+    """
+    key, separator, value = line.rstrip("\n").partition(" ")
+    key = key.strip()
+    if not key:
+        return None
+    if not separator:
+        return key, None
+    if _PLAIN_VALUE.fullmatch(value):
+        return key, value
+    word = _QUOTED_VALUE.fullmatch(value)
+    if word is None:
+        return key, value
+    return key, _WORD_PART.sub(_unquote_part, word["word"])
+
+
 def parse_options_to_dict(
-    stdout: t.IO[str],
+    stdout: Iterable[str],
 ) -> UntypedOptionsDict:
     r"""Process subprocess.stdout options or hook output to flat, naive, untyped dict.
 
@@ -310,24 +419,10 @@ def parse_options_to_dict(
     True
     """
     output: UntypedOptionsDict = {}
-
-    val: ConvertedValue | None = None
-
-    for item in stdout.readlines():
-        if " " in item:
-            try:
-                key, val = shlex.split(item)
-            except ValueError:
-                key, val = item.split(" ", maxsplit=1)
-        else:
-            key, val = item, None
-        key = key.strip()
-
-        if key:
-            if isinstance(val, str) and val.endswith("\n"):
-                val = val.rstrip("\n")
-
-            output[key] = val
+    for line in stdout:
+        item = _parse_option_line(line)
+        if item is not None:
+            output[item[0]] = item[1]
     return output
 
 
@@ -405,10 +500,7 @@ def explode_arrays(
             continue
 
         try:
-            matchgroup = re.match(
-                r"(?P<option>[\w-]+)(\[(?P<index>\d+)\])?(?P<inherited>\*)?",
-                key,
-            )
+            matchgroup = _ARRAY_KEY.match(key)
             if matchgroup is not None:
                 match = matchgroup.groupdict()
                 if match.get("option") and match.get("index"):
@@ -436,6 +528,75 @@ def explode_arrays(
     return options
 
 
+def parse_options(
+    lines: Iterable[str],
+    force_array: bool = False,
+) -> ExplodedUntypedOptionsDict:
+    r"""Parse tmux option or hook output with its arrays exploded, in one pass.
+
+    Gives the result of :func:`explode_arrays` over
+    :func:`parse_options_to_dict`, without building the flat dict between
+    them: each line is tokenized and stored into its option's
+    :class:`~libtmux._internal.sparse_array.SparseArray` as it is read.
+
+    Examples
+    --------
+    >>> parse_options([
+    ...     "status on",
+    ...     "status-format[0] left",
+    ...     "status-format[2] right",
+    ...     'command-alias[0] "info=show-messages -JT"',
+    ... ]) == {
+    ...     "status": "on",
+    ...     "status-format": {0: "left", 2: "right"},
+    ...     "command-alias": {0: "info=show-messages -JT"},
+    ... }
+    True
+
+    Hooks are always arrays:
+
+    >>> hooks = parse_options(["pane-exited[3] kill-session"], force_array=True)
+    >>> hooks["pane-exited"][3]
+    'kill-session'
+    >>> type(hooks["pane-exited"]).__name__
+    'SparseArray'
+    """
+    options: dict[str, t.Any] = {}
+    for line in lines:
+        item = _parse_option_line(line)
+        if item is None:
+            continue
+        key, val = item
+        if "[" not in key:
+            if force_array:
+                options[key] = {} if key == "terminal-features" else SparseArray()
+                if val is not None:
+                    options[key][0] = val
+            else:
+                options[key] = val
+            continue
+
+        match = _ARRAY_KEY.match(key)
+        if match is None or match["index"] is None:
+            continue
+        name = match["option"] + (match["inherited"] or "")
+        array = options.get(name)
+        if array is None:
+            array = options[name] = SparseArray()
+        try:
+            array[int(match["index"])] = val
+        except TypeError:
+            if force_array and val:
+                options[name] = SparseArray({0: val})
+            else:
+                options[name] = val
+            logger.warning(
+                "tmux options parse failed",
+                extra={"tmux_option_key": name},
+            )
+    return options
+
+
 def explode_complex(
     _dict: ExplodedUntypedOptionsDict,
 ) -> ExplodedComplexUntypedOptionsDict:
@@ -580,7 +741,124 @@ def explode_complex(
     return options
 
 
-class OptionsMixin(CmdMixin):
+class OptionChange(t.NamedTuple):
+    """One change planned by :meth:`OptionsMixin.apply_options`.
+
+    Examples
+    --------
+    >>> OptionChange("set", "status-format[1]", "#[align=centre]").args()
+    ['status-format[1]', '#[align=centre]']
+    >>> OptionChange("append", "command-alias", "ll=list-windows").args()
+    ['-a', 'command-alias', 'll=list-windows']
+    >>> OptionChange("unset", "@team").args()
+    ['-u', '@team']
+    """
+
+    action: t.Literal["set", "unset", "append"]
+    option: str
+    value: str | None = None
+
+    def args(self) -> list[str]:
+        """Return the ``set-option`` arguments that make this change."""
+        if self.action == "unset":
+            return ["-u", self.option]
+        assert self.value is not None
+        if self.action == "append":
+            return ["-a", self.option, self.value]
+        return [self.option, self.value]
+
+
+#: Array options whose entries are keyed by what precedes the separator.
+_KEYED_ARRAY_SEPARATORS = {
+    "command-alias": "=",
+    "terminal-features": ":",
+    "terminal-overrides": ":",
+}
+
+
+def _option_text(value: t.Any) -> str:
+    """Return a scalar option value as tmux prints it."""
+    if isinstance(value, bool):
+        return "on" if value else "off"
+    return str(value)
+
+
+def _keyed_entry(name: str, key: str, value: t.Any) -> str:
+    """Return the array entry for *key* of a keyed option's dict shape."""
+    if name == "command-alias":
+        return f"{key}={value}"
+    if isinstance(value, dict):
+        value = [
+            feature if setting is None else f"{feature}={setting}"
+            for feature, setting in value.items()
+        ]
+    if isinstance(value, (list, tuple)):
+        value = ":".join(str(item) for item in value)
+    return f"{key}:{value}" if value else key
+
+
+def _plan_option(name: str, value: t.Any, current: t.Any) -> list[OptionChange]:
+    """Return the changes that turn *current* (raw tmux text) into *value*."""
+    if value is None:
+        return [] if current is None else [OptionChange("unset", name)]
+    entries = current if isinstance(current, dict) else {}
+    if (
+        isinstance(value, dict)
+        and name in _KEYED_ARRAY_SEPARATORS
+        and not all(isinstance(key, int) for key in value)
+    ):
+        return _plan_keyed_array(name, value, entries)
+    if isinstance(value, (list, tuple)):
+        value = dict(enumerate(value))
+    if isinstance(value, dict):
+        changes = [
+            OptionChange("set", f"{name}[{index}]", _option_text(item))
+            for index, item in value.items()
+            if entries.get(index) != _option_text(item)
+        ]
+        changes += [
+            OptionChange("unset", f"{name}[{index}]")
+            for index in entries
+            if index not in value
+        ]
+        return changes
+    text = _option_text(value)
+    return [] if current == text else [OptionChange("set", name, text)]
+
+
+def _plan_keyed_array(
+    name: str,
+    value: dict[str, t.Any],
+    entries: dict[int, str],
+) -> list[OptionChange]:
+    """Plan an alias or terminal array: match entries by key, not index."""
+    separator = _KEYED_ARRAY_SEPARATORS[name]
+    by_key: dict[str, list[tuple[int, str]]] = {}
+    for index, entry in entries.items():
+        by_key.setdefault(entry.split(separator, 1)[0], []).append((index, entry))
+
+    changes: list[OptionChange] = []
+    for key, setting in value.items():
+        entry = _keyed_entry(name, key, setting)
+        existing = by_key.pop(key, [])
+        if not existing:
+            changes.append(OptionChange("append", name, entry))
+            continue
+        index, old = existing[0]
+        if old != entry:
+            changes.append(OptionChange("set", f"{name}[{index}]", entry))
+        changes += [
+            OptionChange("unset", f"{name}[{index}]") for index, _ in existing[1:]
+        ]
+    changes += [
+        OptionChange("unset", f"{name}[{index}]")
+        for stale in by_key.values()
+        for index, _ in stale
+    ]
+    return changes
+
+
+class OptionsMixin(OptionCacheMixin):
     """Mixin for managing tmux options based on scope."""
 
     default_option_scope: OptionScope | None
@@ -707,12 +985,195 @@ class OptionsMixin(CmdMixin):
             option,
             value,
         )
+        self._note_option_write()
 
         if isinstance(cmd.stderr, list) and len(cmd.stderr):
             handle_option_error(cmd.stderr[0])
 
         return self
 
+    def set_options(
+        self,
+        options: Mapping[str, int | str | bool],
+        *,
+        global_: bool | None = None,
+        scope: OptionScope | _DefaultOptionScope | None = DEFAULT_OPTION_SCOPE,
+    ) -> Self:
+        """Set many options in one tmux invocation.
+
+        Sends a ``set-option`` per entry as one chained command sequence (see
+        :func:`~libtmux._internal.command_chain.run_chain`), where calling
+        :meth:`set_option` in a loop costs a tmux process per option. An
+        option tmux rejects does not stop the others.
+
+        Parameters
+        ----------
+        options : mapping
+            Option names and values. ``True`` and ``False`` become ``on``
+            and ``off``.
+        global_ : bool, optional
+            Set global options (``-g``).
+        scope : :class:`~libtmux.constants.OptionScope`, optional
+            Option scope; defaults to the object's own.
+
+        Raises
+        ------
+        :exc:`exc.OptionBatchError`
+            For options tmux rejected, each classified by
+            :func:`handle_option_error`. An :exc:`exc.OptionError`, as
+            :meth:`set_option` raises.
+
+        Examples
+        --------
+        >>> session.set_options({
+        ...     "@profile": "standard",
+        ...     "status": False,
+        ...     "history-limit": 50000,
+        ... })
+        Session($...)
+        >>> session.show_option("@profile"), session.show_option("status")
+        ('standard', False)
+
+        >>> from libtmux import exc
+        >>> try:
+        ...     session.set_options({"@ok": "yes", "no-such-option": "1"})
+        ... except exc.OptionError as error:
+        ...     list(error.option_errors)
+        ['no-such-option']
+        >>> session.show_option("@ok")
+        'yes'
+
+        .. versionadded:: 0.63
+        """
+        flags = self._option_flags(global_=global_, scope=scope)
+        runner, target = chain_target(self)
+        names = list(options)
+        results = run_chain(
+            runner,
+            [
+                ["set-option", *target, *flags, name, _option_text(options[name])]
+                for name in names
+            ],
+        )
+        self._note_option_write()
+        raise_option_errors(names, results, "set-option")
+        return self
+
+    def apply_options(
+        self,
+        desired: Mapping[str, t.Any],
+        *,
+        global_: bool | None = None,
+        scope: OptionScope | _DefaultOptionScope | None = DEFAULT_OPTION_SCOPE,
+        prune: bool = False,
+        dry_run: bool = False,
+    ) -> list[OptionChange]:
+        """Make the options match *desired*, changing only what differs.
+
+        Reads the current options once, compares them with *desired* as tmux
+        text, and sends the changes as one chained command sequence (see
+        :meth:`set_options`). Re-applying a baseline that already holds
+        sends nothing.
+
+        Array options -- a ``list``, a
+        :class:`~libtmux._internal.sparse_array.SparseArray` or an
+        ``{index: value}`` dict -- are compared index by index; indices not
+        in *desired* are unset. ``command-alias``, ``terminal-features``
+        and ``terminal-overrides`` also take the shapes
+        :meth:`show_options` returns (``{"alias": "command"}``,
+        ``{"xterm*": ["clipboard", "focus"]}``, ``{"xterm*": {"Tc": None}}``);
+        entries are matched by alias or terminal, so a changed entry is set
+        in place and a new one appended. ``None`` unsets an option.
+
+        Parameters
+        ----------
+        desired : mapping
+            Option names and the values they should have; ``None`` for
+            options that should not be set here.
+        global_ : bool, optional
+            Reconcile global options (``-g``).
+        scope : :class:`~libtmux.constants.OptionScope`, optional
+            Option scope; defaults to the object's own.
+        prune : bool, optional
+            Also unset options set at this level but absent from *desired*.
+            Inherited values are not affected.
+        dry_run : bool, optional
+            Return the plan without changing anything.
+
+        Returns
+        -------
+        list of :class:`OptionChange`
+            The changes made, or with *dry_run*, that would be made.
+
+        Raises
+        ------
+        :exc:`exc.OptionBatchError`
+            For changes tmux rejected; the others are made.
+
+        Examples
+        --------
+        >>> baseline = {
+        ...     "@team": "infra",
+        ...     "status": False,
+        ...     "update-environment": ["DISPLAY", "SSH_AUTH_SOCK"],
+        ... }
+        >>> session.apply_options(baseline)
+        [OptionChange(action='set', option='@team', value='infra'),
+         OptionChange(action='set', option='status', value='off'),
+         OptionChange(action='set', option='update-environment[0]', value='DISPLAY'),
+         OptionChange(action='set', option='update-environment[1]', value='SSH_AUTH_SOCK')]
+        >>> session.apply_options(baseline)
+        []
+        >>> session.apply_options({"@team": "web"}, prune=True, dry_run=True)
+        [OptionChange(action='set', option='@team', value='web'),
+         OptionChange(action='unset', option='status', value=None),
+         OptionChange(action='unset', option='update-environment', value=None)]
+
+        .. versionadded:: 0.63
+        """
+        flags = self._option_flags(global_=global_, scope=scope)
+        current = parse_options(
+            self._show_options_raw(global_=global_, scope=scope).stdout,
+        )
+        plan: list[OptionChange] = []
+        for name, value in desired.items():
+            plan += _plan_option(name, value, current.get(name))
+        if prune:
+            plan += [
+                OptionChange("unset", name) for name in current if name not in desired
+            ]
+        if dry_run or not plan:
+            return plan
+
+        runner, target = chain_target(self)
+        commands = [["set-option", *target, *flags, *change.args()] for change in plan]
+        results = run_chain(runner, commands)
+        self._note_option_write()
+        raise_option_errors([change.option for change in plan], results, "set-option")
+        return plan
+
+    def _option_flags(
+        self,
+        *,
+        global_: bool | None,
+        scope: OptionScope | _DefaultOptionScope | None,
+    ) -> list[str]:
+        """Return the ``set-option`` flags for *global_* and *scope*."""
+        if scope is DEFAULT_OPTION_SCOPE:
+            scope = self.default_option_scope
+
+        flags: list[str] = []
+        if global_ is not None and global_:
+            assert isinstance(global_, bool)
+            flags.append("-g")
+
+        if scope is not None and not isinstance(scope, _DefaultOptionScope):
+            assert scope in OPTION_SCOPE_FLAG_MAP
+            scope_flag = OPTION_SCOPE_FLAG_MAP[scope]
+            if scope_flag:  # Session scope has empty string, skip it
+                flags.append(scope_flag)
+        return flags
+
     def unset_option(
         self,
         option: str,
@@ -794,6 +1255,7 @@ class OptionsMixin(CmdMixin):
             *flags,
             option,
         )
+        self._note_option_write()
 
         if isinstance(cmd.stderr, list) and len(cmd.stderr):
             handle_option_error(cmd.stderr[0])
@@ -883,7 +1345,7 @@ class OptionsMixin(CmdMixin):
         if values_only is not None and values_only:
             flags += ("-v",)
 
-        return self.cmd("show-options", *flags)
+        return self._cached_cmd("show-options", *flags)
 
     def _show_options_dict(
         self,
@@ -933,9 +1395,7 @@ class OptionsMixin(CmdMixin):
             quiet=quiet,
         )
 
-        return parse_options_to_dict(
-            io.StringIO("\n".join(cmd.stdout)),
-        )
+        return parse_options_to_dict(cmd.stdout)
 
     def _show_options(
         self,
@@ -974,7 +1434,7 @@ class OptionsMixin(CmdMixin):
         >>> MyServer()._show_options()
         {...}
         """
-        dict_output = self._show_options_dict(
+        cmd = self._show_options_raw(
             global_=global_,
             scope=scope,
             include_hooks=include_hooks,
@@ -982,11 +1442,7 @@ class OptionsMixin(CmdMixin):
             quiet=quiet,
         )
 
-        output_exploded = convert_values(
-            explode_complex(
-                explode_arrays(dict_output),
-            ),
-        )
+        output_exploded = convert_values(explode_complex(parse_options(cmd.stdout)))
 
         return t.cast("ExplodedComplexUntypedOptionsDict", output_exploded)
 
@@ -1131,7 +1587,7 @@ class OptionsMixin(CmdMixin):
 
         flags += (option,)
 
-        return self.cmd("show-options", *flags)
+        return self._cached_cmd("show-options", *flags)
 
     def _show_option(
         self,
@@ -1200,7 +1656,7 @@ class OptionsMixin(CmdMixin):
             return None
 
         # Parse raw output first (preserves indexed keys like "status-format[0]")
-        output_raw = parse_options_to_dict(io.StringIO("\n".join(cmd.stdout)))
+        output_raw = parse_options_to_dict(cmd.stdout)
 
         # Handle tmux's inherited option marker: tmux appends "*" to option names
         # that are inherited from a parent scope (e.g., "visual-activity*" for an
@@ -10,12 +10,20 @@ from __future__ import annotations
 import dataclasses
 import logging
 import pathlib
+import re
 import typing as t
+import uuid
 import warnings
 
 from libtmux import exc
+from libtmux._internal.effective_options import effective_options
 from libtmux._internal.env import pane_id_from_env
-from libtmux.common import get_version_str, has_gte_version, raise_if_stderr, tmux_cmd
+from libtmux._internal.pane_capture import capture_since
+from libtmux._internal.pane_history import PaneHistory
+from libtmux._internal.pane_recording import PaneRecording
+from libtmux._internal.pane_stream import PaneStream
+from libtmux._internal.screen import capture_screen
+from libtmux.common import raise_if_stderr, tmux_cmd
 from libtmux.constants import (
     PANE_DIRECTION_FLAG_MAP,
     RESIZE_ADJUSTMENT_DIRECTION_FLAG_MAP,
@@ -32,6 +40,9 @@ if t.TYPE_CHECKING:
     import sys
     import types
 
+    from libtmux._internal.effective_options import EffectiveOptions
+    from libtmux._internal.pane_capture import CaptureCursor, PaneCapture
+    from libtmux._internal.screen import Screen
     from libtmux._internal.types import StrPath
 
     from .server import Server
@@ -641,7 +652,7 @@ class Pane(
         if preserve_trailing:
             cmd.append("-N")
         if trim_trailing:
-            if has_gte_version("3.4", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.4"):
                 cmd.append("-T")
             else:
                 warnings.warn(
@@ -653,7 +664,7 @@ class Pane(
         if quiet:
             cmd.append("-q")
         if mode_screen:
-            if has_gte_version("3.6", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.6"):
                 cmd.append("-M")
             else:
                 warnings.warn(
@@ -663,7 +674,7 @@ class Pane(
         if pending:
             cmd.append("-P")
         if hyperlinks:
-            if has_gte_version("3.7", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.7"):
                 cmd.append("-H")
             else:
                 warnings.warn(
@@ -671,7 +682,7 @@ class Pane(
                     stacklevel=2,
                 )
         if line_numbers:
-            if has_gte_version("3.7", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.7"):
                 cmd.append("-L")
             else:
                 warnings.warn(
@@ -679,7 +690,7 @@ class Pane(
                     stacklevel=2,
                 )
         if line_flags:
-            if has_gte_version("3.7", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.7"):
                 cmd.append("-F")
             else:
                 warnings.warn(
@@ -691,6 +702,209 @@ class Pane(
             return None
         return proc.stdout
 
+    def capture_since(self, cursor: CaptureCursor | None = None) -> PaneCapture:
+        """Capture only the lines completed since a previous capture.
+
+        Tracks the pane's ``#{history_size}`` and ``#{cursor_y}`` in a
+        :class:`~libtmux._internal.pane_capture.CaptureCursor`, so tailing a
+        busy pane costs the new lines per call rather than the whole
+        scrollback. Lines above the cursor row count as completed; the row
+        being written to is returned once the cursor moves past it.
+
+        Rows are screen rows, as :meth:`capture_pane` returns them without
+        ``join_wrapped``. Content that full-screen programs redraw in place
+        is not tracked.
+
+        Parameters
+        ----------
+        cursor : :class:`~libtmux._internal.pane_capture.CaptureCursor`, optional
+            From the previous call's result. ``None`` returns every line
+            from the top of the history.
+
+        Returns
+        -------
+        :class:`~libtmux._internal.pane_capture.PaneCapture`
+            The new lines, the cursor for the next call, and ``skipped``:
+            True if lines fell out of history (``history-limit``,
+            :meth:`clear_history`) before they were read.
+
+        Examples
+        --------
+        >>> from libtmux.test.retry import retry_until
+        >>> pane = window.split(shell='sh')
+        >>> first = pane.capture_since()
+        >>> pane.send_keys('echo $((6 * 7))', enter=True)
+        >>> retry_until(lambda: '42' in pane.capture_pane())
+        True
+        >>> later = pane.capture_since(first.cursor)
+        >>> later.lines[-1]
+        '42'
+        >>> pane.capture_since(later.cursor).lines
+        []
+
+        .. versionadded:: 0.63
+        """
+        return capture_since(self, cursor)
+
+    def screen(self) -> Screen:
+        r"""Capture the visible pane as a grid of styled cells.
+
+        Parses ``capture-pane -e`` output into a
+        :class:`~libtmux._internal.screen.Screen`: each cell's character,
+        foreground, background and attributes, held in arrays. Two screens
+        compare row by row in C, and :meth:`~libtmux._internal.screen.Screen.diff`
+        lists the cells that changed between frames, so tests of terminal
+        UIs need no escape-sequence string matching.
+
+        Returns
+        -------
+        :class:`~libtmux._internal.screen.Screen`
+            Sized to the pane. Cells past the end of the text are blank.
+
+        Examples
+        --------
+        >>> from libtmux.test.retry import retry_until
+        >>> pane = window.split(shell='sh')
+        >>> before = pane.screen()
+        >>> pane.send_keys(r"printf '\033[1;31mred\033[0m\n'", enter=True)
+        >>> retry_until(lambda: 'red' in pane.capture_pane()[1:])
+        True
+        >>> after = pane.screen()
+        >>> row = after.lines.index('red')
+        >>> after[row, 0]
+        Cell(char='r', fg=1, bg=-1, attrs=<Attr.BOLD: 1>)
+        >>> row in before.changed_rows(after)
+        True
+
+        .. versionadded:: 0.63
+        """
+        return capture_screen(self)
+
+    def effective_options(self) -> EffectiveOptions:
+        """Return the options in effect for the pane, and where each was set.
+
+        Server, session, window and pane options -- global tables included
+        -- are read in one chained tmux call and merged in Python the way
+        tmux resolves them, so no ``show-options -A`` per scope and no
+        ``*`` inheritance markers to interpret.
+
+        Returns
+        -------
+        :class:`~libtmux._internal.effective_options.EffectiveOptions`
+            A snapshot mapping option names to values, with
+            :meth:`~libtmux._internal.effective_options.EffectiveOptions.source`
+            for each and a typed
+            :attr:`~libtmux._internal.effective_options.EffectiveOptions.typed`
+            view.
+
+        Examples
+        --------
+        >>> session.set_option("@where", "session")
+        Session($...)
+        >>> window.set_option("@where", "window")
+        Window(@... ...)
+        >>> options = pane.effective_options()
+        >>> options["@where"]
+        'window'
+        >>> options.source("@where")
+        OptionSource(scope=<OptionScope.Window: 'WINDOW'>, global_=False)
+        >>> options.source("status")
+        OptionSource(scope=<OptionScope.Session: 'SESSION'>, global_=True)
+        >>> options.typed.status
+        True
+
+        .. versionadded:: 0.63
+        """
+        return effective_options(self)
+
+    def export_history(
+        self,
+        path: StrPath,
+        *,
+        start: t.Literal["-"] | int = "-",
+        end: t.Literal["-"] | int = "-",
+        escape_sequences: bool = False,
+        join_wrapped: bool = False,
+    ) -> PaneHistory:
+        """Write the pane's history to *path* and map it for reading.
+
+        Runs ``capture-pane -b``, ``save-buffer`` and ``delete-buffer`` as
+        one tmux command: tmux writes the file itself, so a long history
+        never passes through a pipe or becomes a list of Python strings. The
+        file is then opened as a
+        :class:`~libtmux._internal.pane_history.PaneHistory`, which indexes
+        and searches it through :mod:`mmap`.
+
+        The file is written by the tmux server, so *path* must be reachable
+        from it. It is left in place when the history is closed.
+
+        Parameters
+        ----------
+        path : str or PathLike
+            File to write. Overwritten if it exists.
+        start : int or ``"-"``, optional
+            First line, as for :meth:`capture_pane`. Default ``"-"``, the
+            start of the history.
+        end : int or ``"-"``, optional
+            Last line, as for :meth:`capture_pane`. Default ``"-"``, the
+            end of the visible pane.
+        escape_sequences : bool, optional
+            Keep text and color attributes as escape sequences (``-e``).
+        join_wrapped : bool, optional
+            Join wrapped lines (``-J``).
+
+        Returns
+        -------
+        :class:`~libtmux._internal.pane_history.PaneHistory`
+            The exported lines; close it when done.
+
+        Raises
+        ------
+        :exc:`~libtmux.exc.LibTmuxException`
+            If tmux cannot capture the pane or write the file.
+
+        Examples
+        --------
+        >>> from libtmux.test.retry import retry_until
+        >>> tmp_path = request.getfixturevalue("tmp_path")
+        >>> pane.send_keys("seq 1000 1200", enter=True)
+        >>> retry_until(lambda: "1200" in pane.capture_pane())
+        True
+        >>> with pane.export_history(tmp_path / "history.txt") as history:
+        ...     [line for _, line in history.search("^11[05]0$")]
+        ['1100', '1150']
+
+        .. versionadded:: 0.63
+        """
+        target = pathlib.Path(path).expanduser().absolute()
+        buffer_name = f"libtmux_history_{uuid.uuid4().hex}"
+        capture_args = ["-b", buffer_name, "-S", str(start), "-E", str(end)]
+        if escape_sequences:
+            capture_args.append("-e")
+        if join_wrapped:
+            capture_args.append("-J")
+        proc = self.server.cmd(
+            "capture-pane",
+            "-t",
+            str(self.pane_id),
+            *capture_args,
+            ";",
+            "save-buffer",
+            "-b",
+            buffer_name,
+            str(target),
+            ";",
+            "delete-buffer",
+            "-b",
+            buffer_name,
+        )
+        if proc.stderr:
+            # tmux stops a command sequence at the first error, which may
+            # leave the buffer behind.
+            self.server.cmd("delete-buffer", "-b", buffer_name)
+        raise_if_stderr(proc, "capture-pane")
+        return PaneHistory(target)
+
     def send_keys(
         self,
         cmd: str | None = None,
@@ -805,7 +1019,7 @@ class Pane(
             tmux_args += ("-H",)
 
         if key_name:
-            if has_gte_version("3.4", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.4"):
                 tmux_args += ("-K",)
             else:
                 warnings.warn(
@@ -820,7 +1034,7 @@ class Pane(
             tmux_args += ("-N", str(repeat))
 
         if target_client is not None:
-            if has_gte_version("3.4", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.4"):
                 tmux_args += ("-c", target_client)
             else:
                 warnings.warn(
@@ -971,7 +1185,7 @@ class Pane(
             tmux_args += ("-v",)
 
         if no_expand:
-            if has_gte_version("3.4", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.4"):
                 tmux_args += ("-l",)
             else:
                 warnings.warn(
@@ -983,7 +1197,7 @@ class Pane(
             tmux_args += ("-N",)
 
         if update_pane:
-            if has_gte_version("3.6", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.6"):
                 tmux_args += ("-C",)
             else:
                 warnings.warn(
@@ -1365,7 +1579,7 @@ class Pane(
                 tmux_args += (f"-e{k}={v}",)
 
         if empty:
-            if has_gte_version("3.7", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.7"):
                 tmux_args += ("-E",)
             else:
                 warnings.warn(
@@ -1380,7 +1594,7 @@ class Pane(
             "-m": message,
         }
         if keep or any(v is not None for v in styling.values()):
-            if has_gte_version("3.7", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.7"):
                 for flag, value in styling.items():
                     if value is not None:
                         tmux_args += (flag, value)
@@ -1515,7 +1729,7 @@ class Pane(
         >>> is_floating
         '1'
         """
-        if not has_gte_version("3.7", tmux_bin=self.server.tmux_bin):
+        if not self.server.capabilities.has_gte_version("3.7"):
             msg = "new_pane (floating panes) requires tmux 3.7+"
             raise exc.LibTmuxException(msg)
 
@@ -1782,7 +1996,7 @@ class Pane(
             tmux_args += ("-d", str(start_path))
 
         if title is not None:
-            if has_gte_version("3.3", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.3"):
                 tmux_args += ("-T", title)
             else:
                 warnings.warn(
@@ -1791,7 +2005,7 @@ class Pane(
                 )
 
         if border_lines is not None:
-            if has_gte_version("3.3", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.3"):
                 tmux_args += ("-b", border_lines)
             else:
                 warnings.warn(
@@ -1800,7 +2014,7 @@ class Pane(
                 )
 
         if style is not None:
-            if has_gte_version("3.3", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.3"):
                 tmux_args += ("-s", style)
             else:
                 warnings.warn(
@@ -1809,7 +2023,7 @@ class Pane(
                 )
 
         if border_style is not None:
-            if has_gte_version("3.3", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.3"):
                 tmux_args += ("-S", border_style)
             else:
                 warnings.warn(
@@ -1818,7 +2032,7 @@ class Pane(
                 )
 
         if environment:
-            if has_gte_version("3.3", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.3"):
                 for k, v in environment.items():
                     tmux_args += (f"-e{k}={v}",)
             else:
@@ -1828,7 +2042,7 @@ class Pane(
                 )
 
         if no_border:
-            if has_gte_version("3.3", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.3"):
                 tmux_args += ("-B",)
             else:
                 warnings.warn(
@@ -1837,7 +2051,7 @@ class Pane(
                 )
 
         if close_on_any_key:
-            if has_gte_version("3.6", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.6"):
                 tmux_args += ("-k",)
             else:
                 warnings.warn(
@@ -1846,7 +2060,7 @@ class Pane(
                 )
 
         if no_keys:
-            if has_gte_version("3.6", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.6"):
                 tmux_args += ("-N",)
             else:
                 warnings.warn(
@@ -1916,7 +2130,7 @@ class Pane(
             tmux_args += ("-s", separator)
 
         if no_vis:
-            if has_gte_version("3.7", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.7"):
                 tmux_args += ("-S",)
             else:
                 warnings.warn(
@@ -1928,6 +2142,84 @@ class Pane(
 
         raise_if_stderr(proc, "paste-buffer")
 
+    def paste_text(
+        self,
+        data: str,
+        *,
+        bracket: bool = True,
+        linefeed_separator: bool = False,
+    ) -> None:
+        r"""Paste *data* into the pane through a temporary buffer.
+
+        Unlike :meth:`send_keys`, the text is not an argument: tmux reads it
+        from standard input with ``load-buffer -`` into a uniquely named
+        buffer, pastes it with ``paste-buffer -d`` (which deletes the
+        buffer) and does it all in one tmux invocation. Payloads of any size
+        arrive unchanged, with no ``ARG_MAX`` limit and no key-name or shell
+        escaping to worry about.
+
+        Parameters
+        ----------
+        data : str
+            Text to paste. Empty text pastes nothing and runs no tmux
+            command.
+        bracket : bool, optional
+            Wrap the paste in bracketed-paste sequences when the program in
+            the pane asked for them (``-p``), so shells and editors treat it
+            as pasted text rather than typed keys. Default True.
+        linefeed_separator : bool, optional
+            Keep line feeds instead of replacing them with carriage returns
+            (``-r``).
+
+        Raises
+        ------
+        :exc:`~libtmux.exc.LibTmuxException`
+            If tmux could not load or paste the text.
+
+        Examples
+        --------
+        A shell that enabled bracketed paste runs pasted lines only once
+        Enter is pressed:
+
+        >>> from libtmux.test.retry import retry_until
+        >>> script = "".join(f"echo {n}\n" for n in range(3))
+        >>> pane.paste_text(script + "echo $((6 * 7))")
+        >>> pane.enter()
+        Pane(%... Window(@... ...:..., Session($1 libtmux_...)))
+        >>> retry_until(lambda: "42" in pane.capture_pane())
+        True
+
+        .. versionadded:: 0.63
+        """
+        if not data:
+            # load-buffer creates no buffer from empty input, so the paste
+            # would fail to find it.
+            return
+        buffer_name = f"libtmux_paste_{uuid.uuid4().hex}"
+        paste_args = ["-b", buffer_name, "-d", "-t", str(self.pane_id)]
+        if bracket:
+            paste_args.append("-p")
+        if linefeed_separator:
+            paste_args.append("-r")
+        if self.server.capabilities.has_gte_version("3.7"):
+            # tmux 3.7 escapes pasted control characters unless asked not to.
+            paste_args.append("-S")
+        proc = self.server.cmd(
+            "load-buffer",
+            "-b",
+            buffer_name,
+            "-",
+            ";",
+            "paste-buffer",
+            *paste_args,
+            stdin=data,
+        )
+        if proc.stderr:
+            # tmux stops a command sequence at the first error, which may
+            # leave the buffer behind.
+            self.server.cmd("delete-buffer", "-b", buffer_name)
+        raise_if_stderr(proc, "paste-buffer")
+
     def pipe(
         self,
         command: str | None = None,
@@ -1975,6 +2267,209 @@ class Pane(
 
         raise_if_stderr(proc, "pipe-pane")
 
+    def stream(
+        self,
+        *,
+        lines: bool = False,
+        encoding: str = "utf-8",
+        errors: str = "replace",
+    ) -> PaneStream:
+        """Follow the pane's output as it is produced.
+
+        Starts ``pipe-pane -O`` into a FIFO owned by this process and returns
+        a :class:`~libtmux._internal.pane_stream.PaneStream` to read it: an
+        iterator, an async iterator and a context manager. Unlike polling
+        :meth:`capture_pane`, no line that scrolls past is missed and no
+        subprocess is spawned per read.
+
+        Closing the stream stops the pipe via :meth:`pipe`. tmux allows one
+        pipe per pane, so a stream replaces any pipe already set.
+
+        Parameters
+        ----------
+        lines : bool, optional
+            Yield complete lines (line endings removed) instead of raw
+            chunks.
+        encoding : str, optional
+            Encoding of the pane output. Default ``"utf-8"``.
+        errors : str, optional
+            Decoding error handler. Default ``"replace"``.
+
+        Returns
+        -------
+        :class:`~libtmux._internal.pane_stream.PaneStream`
+            An open stream; close it, or use it in a ``with`` block.
+
+        Examples
+        --------
+        Output is raw terminal text, escape sequences included, so match
+        substrings rather than whole lines. Read with a timeout so that
+        output which never arrives cannot block forever:
+
+        >>> with pane.stream(lines=True) as output:
+        ...     pane.send_keys("echo $((6 * 7))", enter=True)
+        ...     line = output.read(timeout=5)
+        ...     while line is not None and not line.endswith("42"):
+        ...         line = output.read(timeout=5)
+        >>> line
+        '42'
+
+        Without ``lines``, chunks arrive as tmux writes them:
+
+        >>> with pane.stream() as output:
+        ...     pane.send_keys("echo chunk", enter=True)
+        ...     isinstance(output.read(timeout=5), str)
+        True
+
+        In asyncio code, iterate with ``async for``, bounded by
+        :func:`asyncio.wait_for`:
+
+        >>> import asyncio
+        >>> async def first_line() -> str:
+        ...     async with pane.stream(lines=True) as output:
+        ...         pane.send_keys("echo $((6 * 9))", enter=True)
+        ...         async for line in output:
+        ...             if line.endswith("54"):
+        ...                 return line
+        ...     return ""
+        >>> asyncio.run(asyncio.wait_for(first_line(), timeout=5))
+        '54'
+
+        .. versionadded:: 0.63
+        """
+        return PaneStream(self, lines=lines, encoding=encoding, errors=errors).open()
+
+    def record(
+        self,
+        path: StrPath,
+        *,
+        title: str | None = None,
+    ) -> PaneRecording:
+        """Record the pane's output to an asciicast v2 file.
+
+        Starts a :class:`~libtmux._internal.pane_recording.PaneRecording`:
+        output is taken from ``pipe-pane -O`` as it is produced, stamped
+        with the time since the start, and written as asciicast v2 JSON
+        lines through a buffered file, ready for ``asciinema play``. Unlike
+        polling :meth:`capture_pane`, timing and every intermediate frame
+        are kept.
+
+        All recordings share one background thread, so recording many panes
+        costs little more than one. tmux allows one pipe per pane, so a
+        recording replaces any pipe or :meth:`stream` already set, and
+        :meth:`stream` or :meth:`expect` on a recorded pane end the
+        recording's pipe.
+
+        Parameters
+        ----------
+        path : str or PathLike
+            File to write; replaced if it exists.
+        title : str, optional
+            Title for the recording's header.
+
+        Returns
+        -------
+        :class:`~libtmux._internal.pane_recording.PaneRecording`
+            A started recording; :meth:`~.PaneRecording.stop` it, or use it
+            in a ``with`` block.
+
+        Examples
+        --------
+        >>> from libtmux.test.retry import retry_until
+        >>> tmp_path = request.getfixturevalue("tmp_path")
+        >>> recording = pane.record(tmp_path / "session.cast", title="demo")
+        >>> pane.send_keys("echo recorded", enter=True)
+        >>> retry_until(lambda: "recorded" in pane.capture_pane())
+        True
+        >>> recording.stop()
+        >>> import json
+        >>> header, *events = (tmp_path / "session.cast").read_text().splitlines()
+        >>> json.loads(header)["title"]
+        'demo'
+        >>> "".join(json.loads(event)[2] for event in events).count("recorded")
+        2
+
+        .. versionadded:: 0.63
+        """
+        return PaneRecording(self, path, title=title).start()
+
+    def expect(
+        self,
+        pattern: str | re.Pattern[str],
+        *,
+        timeout: float = 10,
+        on_screen: bool = False,
+    ) -> re.Match[str]:
+        r"""Wait for the pane to show text matching *pattern*.
+
+        Opens a :meth:`stream` and waits on it, so the call wakes the moment
+        matching output arrives instead of polling :meth:`capture_pane`: one
+        ``pipe-pane`` to start and one to stop, however long it waits.
+
+        Only output printed after the call matches, unless *on_screen* is
+        set: the visible screen is then searched first (after the stream
+        opened, so nothing printed in between is missed), and text already
+        displayed, such as a prompt, matches at once.
+
+        To match output caused by your own input without racing it, open
+        the stream first and call
+        :meth:`~libtmux._internal.pane_stream.PaneStream.expect` on it.
+
+        Parameters
+        ----------
+        pattern : str or :class:`re.Pattern`
+            Regular expression, searched with :meth:`re.Pattern.search`.
+            Streamed output is raw terminal text, escape sequences included.
+        timeout : float, optional
+            Seconds to wait. Default 10.
+        on_screen : bool, optional
+            Search the visible screen before waiting. Default False.
+
+        Returns
+        -------
+        :class:`re.Match`
+            The match. Its ``string`` is the text searched, so
+            ``match.string[:match.start()]`` is the output before it.
+
+        Raises
+        ------
+        :exc:`~libtmux.exc.WaitTimeout`
+            If nothing matched within *timeout*, or the pane went away.
+        :exc:`~libtmux.exc.PaneError`
+            If the pane is already piped -- by :meth:`pipe`, a
+            :meth:`stream` or a :meth:`record` -- since tmux allows one pipe
+            per pane. Call ``expect`` on that stream instead.
+
+        Examples
+        --------
+        >>> pane.send_keys("echo $((6 * 7))", enter=True)
+        >>> pane.expect(r"4\d", timeout=5, on_screen=True).group()
+        '42'
+
+        >>> with pane.stream() as stream:
+        ...     pane.expect("42")
+        Traceback (most recent call last):
+        ...
+        libtmux.exc.PaneError: pane %... is already piped...
+
+        .. versionadded:: 0.63
+        """
+        regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+        proc = self.cmd("display-message", "-p", "#{pane_pipe}")
+        raise_if_stderr(proc, "display-message")
+        if proc.stdout == ["1"]:
+            msg = (
+                f"pane {self.pane_id} is already piped; "
+                "call expect() on its stream instead"
+            )
+            raise exc.PaneError(msg)
+        with self.stream() as output:
+            if on_screen:
+                match = regex.search("\n".join(self.capture_pane()))
+                if match is not None:
+                    return match
+            return output.expect(regex, timeout=timeout)
+
     def copy_mode(
         self,
         *,
@@ -2022,7 +2517,7 @@ class Pane(
             tmux_args += ("-M",)
 
         if page_down:
-            if has_gte_version("3.5", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.5"):
                 tmux_args += ("-d",)
             else:
                 warnings.warn(
@@ -2469,7 +2964,7 @@ class Pane(
         # given (NULL-deref); 3.7a reverted it. When needed, pass a placeholder
         # -n then set the real name via rename-window below. Compare the raw
         # version string to gate the workaround on the literal 3.7 release only.
-        breaks_without_name = get_version_str(tmux_bin=self.server.tmux_bin) == "3.7"
+        breaks_without_name = self.server.capabilities.version_str == "3.7"
 
         tmux_args: tuple[str, ...] = ("-P", "-F#{window_id}")
 
@@ -2590,7 +3085,7 @@ class Pane(
         tmux_args: tuple[str, ...] = ()
 
         if reset_hyperlinks:
-            if has_gte_version("3.4", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.4"):
                 tmux_args += ("-H",)
             else:
                 warnings.warn(
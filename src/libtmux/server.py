@@ -7,6 +7,7 @@ libtmux.server
 
 from __future__ import annotations
 
+import concurrent.futures
 import logging
 import os
 import pathlib
@@ -14,40 +15,65 @@ import shutil
 import subprocess
 import typing as t
 import warnings
+from collections.abc import Mapping
 
 from libtmux import exc
+from libtmux._internal.command_chain import chain_arg, run_chain
 from libtmux._internal.env import socket_path_from_env
+from libtmux._internal.format_eval import evaluate_formats
+from libtmux._internal.hook_events import HookBus
+from libtmux._internal.key_table import KeyBinding, KeyTable
+from libtmux._internal.pane_grep import grep_panes
 from libtmux._internal.query_list import QueryList
 from libtmux.client import Client
-from libtmux.common import get_version, has_gte_version, raise_if_stderr, tmux_cmd
+from libtmux.common import (
+    TmuxCapabilities,
+    get_version_str,
+    raise_if_stderr,
+    tmux_cmd,
+)
 from libtmux.constants import OptionScope
 from libtmux.hooks import HooksMixin
-from libtmux.neo import fetch_objs, get_output_format, parse_output
+from libtmux.neo import (
+    _is_target_not_found_error,
+    fetch_objs,
+    get_output_format,
+    parse_output,
+)
 from libtmux.pane import Pane
 from libtmux.session import Session
 from libtmux.window import Window
 
 from .common import (
     EnvironmentMixin,
+    Environments,
     PaneDict,
     SessionDict,
     WindowDict,
+    parse_environment,
     session_check_name,
 )
 from .options import OptionsMixin
 
 if t.TYPE_CHECKING:
+    import re
     import types
+    from collections.abc import Iterable, Sequence
     from typing import TypeAlias
 
     from typing_extensions import Self
 
+    from libtmux._internal.hook_events import HookEvent, HookSubscription
+    from libtmux._internal.pane_grep import GrepHit
     from libtmux._internal.types import StrPath
 
     DashLiteral: TypeAlias = t.Literal["-"]
 
 logger = logging.getLogger(__name__)
 
+#: Commands that start a tmux server when none is running.
+_SERVER_STARTING_COMMANDS = frozenset({"new-session", "new", "start-server", "start"})
+
 
 def _is_daemon_not_up_error(stderr_text: str) -> bool:
     """Return True if the error indicates the tmux server is not running.
@@ -62,6 +88,26 @@ def _is_daemon_not_up_error(stderr_text: str) -> bool:
     )
 
 
+def _pane_ids(panes: Iterable[Pane | str]) -> list[str]:
+    """Return the pane IDs of *panes*, which may already be IDs."""
+    return [pane if isinstance(pane, str) else str(pane.pane_id) for pane in panes]
+
+
+def _target_ids(targets: Iterable[Session | Window | Pane | str]) -> list[str]:
+    """Return the IDs of sessions, windows and panes, which may already be IDs."""
+    ids: list[str] = []
+    for target in targets:
+        if isinstance(target, Pane):
+            ids.append(str(target.pane_id))
+        elif isinstance(target, Window):
+            ids.append(str(target.window_id))
+        elif isinstance(target, Session):
+            ids.append(str(target.session_id))
+        else:
+            ids.append(target)
+    return ids
+
+
 def _fetch_or_empty(
     server: Server,
     list_cmd: str,
@@ -108,6 +154,9 @@ class Server(
     on_init : callable, optional
     socket_name_factory : callable, optional
     tmux_bin : str or pathlib.Path, optional
+    coalesce_queries : bool, optional
+        Share one ``list-*`` call among threads listing the same objects at
+        once. See :attr:`coalesce_queries`.
 
     Examples
     --------
@@ -166,6 +215,23 @@ class Server(
     """For hook management."""
     tmux_bin: str | None = None
     """Custom path to tmux binary. Falls back to ``shutil.which("tmux")``."""
+    coalesce_queries: bool = False
+    """Coalesce concurrent identical listings into one tmux call.
+
+    When true, threads that read :attr:`sessions`, :attr:`panes`,
+    :attr:`Session.windows <libtmux.Session.windows>` (or anything else backed
+    by :func:`~libtmux.neo.fetch_objs`) while an identical listing is already
+    running wait for it instead of spawning their own. Nothing is cached once
+    the call returns.
+
+    A caller that joins a listing already in flight receives rows read when
+    that listing started, which can predate the caller's own writes: a thread
+    that creates a window and then lists windows may not see it. Leave this
+    off (or pass ``coalesce=False`` to :func:`~libtmux.neo.fetch_objs`) where
+    a read must observe the caller's preceding changes.
+
+    .. versionadded:: 0.63
+    """
 
     def __init__(
         self,
@@ -176,12 +242,17 @@ class Server(
         on_init: t.Callable[[Server], None] | None = None,
         socket_name_factory: t.Callable[[], str] | None = None,
         tmux_bin: str | pathlib.Path | None = None,
+        coalesce_queries: bool = False,
         **kwargs: t.Any,
     ) -> None:
         EnvironmentMixin.__init__(self, "-g")
         self.tmux_bin = str(tmux_bin) if tmux_bin is not None else None
+        self.coalesce_queries = coalesce_queries
         self._windows: list[WindowDict] = []
         self._panes: list[PaneDict] = []
+        self._capabilities: TmuxCapabilities | None = None
+        self._hook_bus: HookBus | None = None
+        self._key_table: KeyTable | None = None
 
         if socket_path is not None:
             self.socket_path = socket_path
@@ -334,6 +405,46 @@ class Server(
         except FileNotFoundError:
             raise exc.TmuxCommandNotFound from None
 
+    @property
+    def capabilities(self) -> TmuxCapabilities:
+        """Version gates for the tmux server behind this socket.
+
+        Read once from the server's own ``#{version}`` and reused by every
+        feature gate in libtmux, so gating costs no extra tmux calls and
+        follows the server even when the client binary (:attr:`tmux_bin`)
+        is a different release.
+
+        While no server is running there is nothing to probe: the client
+        binary's version stands in. That fallback is cached too, so gates
+        checked against a dead socket cost one failed ``display-message``
+        rather than one per check. The server is probed again after
+        libtmux runs a command that can start it (``new-session``,
+        ``start-server``); a server started outside libtmux is picked up
+        once :meth:`kill` or one of those commands forgets the cached value.
+
+        .. versionadded:: 0.63
+
+        Examples
+        --------
+        >>> server.capabilities
+        TmuxCapabilities(version_str='...', source='server')
+        >>> server.capabilities is server.capabilities
+        True
+        >>> Server(socket_name="no_exist").capabilities.source
+        'client'
+        """
+        if self._capabilities is not None:
+            return self._capabilities
+        proc = self.cmd("display-message", "-p", "#{version}")
+        if proc.returncode == 0 and proc.stdout and proc.stdout[0]:
+            self._capabilities = TmuxCapabilities(proc.stdout[0], source="server")
+            return self._capabilities
+        self._capabilities = TmuxCapabilities(
+            get_version_str(tmux_bin=self.tmux_bin),
+            source="client",
+        )
+        return self._capabilities
+
     #
     # Command
     #
@@ -342,6 +453,7 @@ class Server(
         cmd: str,
         *args: t.Any,
         target: str | int | None = None,
+        stdin: str | None = None,
     ) -> tmux_cmd:
         """Execute tmux command respective of socket name and file, return output.
 
@@ -379,6 +491,11 @@ class Server(
         ----------
         target : str, optional
             Optional custom target.
+        stdin : str, optional
+            Text written to the tmux client's standard input, for commands
+            that read a ``-`` file such as ``load-buffer -``.
+
+            .. versionadded:: 0.63
 
         Returns
         -------
@@ -408,7 +525,15 @@ class Server(
 
         cmd_args = ["-t", str(target), *args] if target is not None else [*args]
 
-        return tmux_cmd(*svr_args, *cmd_args, tmux_bin=self.tmux_bin)
+        proc = tmux_cmd(*svr_args, *cmd_args, tmux_bin=self.tmux_bin, stdin=stdin)
+        if (
+            cmd in _SERVER_STARTING_COMMANDS
+            and self._capabilities is not None
+            and self._capabilities.source == "client"
+        ):
+            # A server may be up now; probe its version on next use.
+            self._capabilities = None
+        return proc
 
     @property
     def attached_sessions(self) -> list[Session]:
@@ -472,6 +597,7 @@ class Server(
         >>> svr.is_alive()
         False
         """
+        self._capabilities = None
         proc = self.cmd("kill-server")
         if proc.stderr:
             stderr_text = " ".join(str(line) for line in proc.stderr)
@@ -581,7 +707,7 @@ class Server(
             tmux_args += ("-t", target_pane)
 
         if cwd is not None:
-            if has_gte_version("3.4", tmux_bin=self.tmux_bin):
+            if self.capabilities.has_gte_version("3.4"):
                 tmux_args += ("-c", str(cwd))
             else:
                 warnings.warn(
@@ -590,7 +716,7 @@ class Server(
                 )
 
         if show_stderr:
-            if has_gte_version("3.6", tmux_bin=self.tmux_bin):
+            if self.capabilities.has_gte_version("3.6"):
                 tmux_args += ("-E",)
             else:
                 warnings.warn(
@@ -601,7 +727,7 @@ class Server(
         tmux_args += (command,)
 
         if args:
-            if has_gte_version("3.7", tmux_bin=self.tmux_bin):
+            if self.capabilities.has_gte_version("3.7"):
                 tmux_args += tuple(args)
             else:
                 warnings.warn(
@@ -704,6 +830,7 @@ class Server(
         tmux_args += (key, command)
 
         proc = self.cmd("bind-key", *tmux_args)
+        self._key_table = None
 
         raise_if_stderr(proc, "bind-key")
 
@@ -748,9 +875,119 @@ class Server(
             tmux_args += (key,)
 
         proc = self.cmd("unbind-key", *tmux_args)
+        self._key_table = None
 
         raise_if_stderr(proc, "unbind-key")
 
+    def bind_keys(
+        self,
+        bindings: Mapping[str, str] | Iterable[KeyBinding],
+        *,
+        key_table: str = "prefix",
+        replace: bool = False,
+    ) -> None:
+        """Bind many keys in one tmux call.
+
+        Every ``bind-key`` is sent as one chained command sequence (see
+        :func:`~libtmux._internal.command_chain.run_chain`), where
+        :meth:`bind_key` costs a process per key.
+
+        Parameters
+        ----------
+        bindings : dict or iterable of :class:`~libtmux._internal.key_table.KeyBinding`
+            Key to command (tmux syntax) for *key_table*, or bindings
+            naming their own tables -- such as the values of another
+            server's :meth:`key_table`.
+        key_table : str, optional
+            Table for a dict of bindings. Default ``prefix``.
+        replace : bool, optional
+            First unbind every key of each table bound to, in the same
+            sequence, so the tables hold exactly *bindings*.
+
+        Raises
+        ------
+        :exc:`~libtmux.exc.BatchError`
+            Listing, by ``"<table>:<key>"``, the bindings tmux rejected. The
+            others are still bound.
+
+        Examples
+        --------
+        >>> server.bind_keys(
+        ...     {"F5": "display-message five", ";": "last-pane"},
+        ...     key_table="root",
+        ... )
+        >>> server.key_table()["root", ";"].command
+        'last-pane'
+
+        .. versionadded:: 0.63
+        """
+        if isinstance(bindings, Mapping):
+            bindings = [
+                KeyBinding(key_table, key, command) for key, command in bindings.items()
+            ]
+        else:
+            bindings = list(bindings)
+        names: list[str] = []
+        commands: list[list[str]] = []
+        if replace:
+            # Fails only for a table that does not exist, which is as good
+            # as emptied; the sequence goes on with the next command.
+            commands.extend(
+                ["unbind-key", "-a", "-T", table]
+                for table in dict.fromkeys(binding.table for binding in bindings)
+            )
+        unbinds = len(commands)
+        for binding in bindings:
+            names.append(f"{binding.table}:{binding.key}")
+            commands.append(
+                [
+                    "bind-key",
+                    *(["-r"] if binding.repeat else []),
+                    "-T",
+                    binding.table,
+                    chain_arg(binding.key),
+                    chain_arg(binding.command),
+                ],
+            )
+        results = run_chain(self, commands)
+        self._key_table = None
+        errors = {
+            name: "\n".join(result.stderr)
+            for name, result in zip(names, results[unbinds:], strict=True)
+            if not result.ok
+        }
+        if errors:
+            raise exc.BatchError(errors, subcommand="bind-key")
+
+    def key_table(self, *, refresh: bool = False) -> KeyTable:
+        """Return the server's key bindings, parsed and indexed.
+
+        Read with one ``list-keys`` and kept until libtmux binds or unbinds
+        a key (:meth:`bind_key`, :meth:`bind_keys`, :meth:`unbind_key`) or
+        sources a file; pass *refresh* to re-read after changes made
+        outside libtmux.
+
+        Returns
+        -------
+        :class:`~libtmux._internal.key_table.KeyTable`
+            Bindings by ``(table, key)``.
+
+        Examples
+        --------
+        >>> keys = server.key_table()
+        >>> keys["prefix", "c"].command
+        'new-window'
+        >>> server.key_table() is keys
+        True
+
+        .. versionadded:: 0.63
+        """
+        if self._key_table is None or refresh:
+            proc = self.cmd("list-keys")
+            raise_if_stderr(proc, "list-keys")
+            self._key_table = KeyTable.parse(proc.stdout)
+        return self._key_table
+
     def list_keys(
         self,
         *,
@@ -784,7 +1021,7 @@ class Server(
             tmux_args += ("-T", key_table)
 
         if format_ is not None:
-            if has_gte_version("3.7", tmux_bin=self.tmux_bin):
+            if self.capabilities.has_gte_version("3.7"):
                 tmux_args += ("-F", format_)
             else:
                 warnings.warn(
@@ -882,7 +1119,7 @@ class Server(
         ...     result = server.server_access(list_access=True)
         ...     assert isinstance(result, list)
         """
-        if not has_gte_version("3.3", tmux_bin=self.tmux_bin):
+        if not self.capabilities.has_gte_version("3.3"):
             msg = "server_access requires tmux 3.3+"
             raise exc.LibTmuxException(msg)
 
@@ -946,7 +1183,7 @@ class Server(
             tmux_args += ("-t", target_client)
 
         if request_clipboard:
-            if has_gte_version("3.7", tmux_bin=self.tmux_bin):
+            if self.capabilities.has_gte_version("3.7"):
                 tmux_args += ("-l",)
             else:
                 warnings.warn(
@@ -1152,7 +1389,7 @@ class Server(
         >>> result
         'yes'
         """
-        if not has_gte_version("3.3", tmux_bin=self.tmux_bin):
+        if not self.capabilities.has_gte_version("3.3"):
             msg = "confirm_before requires tmux 3.3+"
             raise exc.LibTmuxException(msg)
 
@@ -1162,7 +1399,7 @@ class Server(
             tmux_args += ("-p", prompt)
 
         if confirm_key is not None:
-            if has_gte_version("3.4", tmux_bin=self.tmux_bin):
+            if self.capabilities.has_gte_version("3.4"):
                 tmux_args += ("-c", confirm_key)
             else:
                 warnings.warn(
@@ -1171,7 +1408,7 @@ class Server(
                 )
 
         if default_yes:
-            if has_gte_version("3.4", tmux_bin=self.tmux_bin):
+            if self.capabilities.has_gte_version("3.4"):
                 tmux_args += ("-y",)
             else:
                 warnings.warn(
@@ -1268,7 +1505,7 @@ class Server(
         >>> result
         'hi'
         """
-        if not has_gte_version("3.3", tmux_bin=self.tmux_bin):
+        if not self.capabilities.has_gte_version("3.3"):
             msg = "command_prompt requires tmux 3.3+"
             raise exc.LibTmuxException(msg)
 
@@ -1290,7 +1527,7 @@ class Server(
             tmux_args += ("-F",)
 
         if literal:
-            if has_gte_version("3.6", tmux_bin=self.tmux_bin):
+            if self.capabilities.has_gte_version("3.6"):
                 tmux_args += ("-l",)
             else:
                 warnings.warn(
@@ -1299,7 +1536,7 @@ class Server(
                 )
 
         if bspace_exit:
-            if has_gte_version("3.7", tmux_bin=self.tmux_bin):
+            if self.capabilities.has_gte_version("3.7"):
                 tmux_args += ("-e",)
             else:
                 warnings.warn(
@@ -1308,7 +1545,7 @@ class Server(
                 )
 
         if no_freeze:
-            if has_gte_version("3.7", tmux_bin=self.tmux_bin):
+            if self.capabilities.has_gte_version("3.7"):
                 tmux_args += ("-C",)
             else:
                 warnings.warn(
@@ -1424,7 +1661,7 @@ class Server(
             tmux_args += ("-y", str(y))
 
         if starting_choice is not None:
-            if has_gte_version("3.4", tmux_bin=self.tmux_bin):
+            if self.capabilities.has_gte_version("3.4"):
                 tmux_args += ("-C", str(starting_choice))
             else:
                 warnings.warn(
@@ -1433,7 +1670,7 @@ class Server(
                 )
 
         if border_lines is not None:
-            if has_gte_version("3.4", tmux_bin=self.tmux_bin):
+            if self.capabilities.has_gte_version("3.4"):
                 tmux_args += ("-b", border_lines)
             else:
                 warnings.warn(
@@ -1442,7 +1679,7 @@ class Server(
                 )
 
         if style is not None:
-            if has_gte_version("3.4", tmux_bin=self.tmux_bin):
+            if self.capabilities.has_gte_version("3.4"):
                 tmux_args += ("-s", style)
             else:
                 warnings.warn(
@@ -1451,7 +1688,7 @@ class Server(
                 )
 
         if border_style is not None:
-            if has_gte_version("3.4", tmux_bin=self.tmux_bin):
+            if self.capabilities.has_gte_version("3.4"):
                 tmux_args += ("-S", border_style)
             else:
                 warnings.warn(
@@ -1460,7 +1697,7 @@ class Server(
                 )
 
         if selected_style is not None:
-            if has_gte_version("3.4", tmux_bin=self.tmux_bin):
+            if self.capabilities.has_gte_version("3.4"):
                 tmux_args += ("-H", selected_style)
             else:
                 warnings.warn(
@@ -1469,7 +1706,7 @@ class Server(
                 )
 
         if mouse:
-            if has_gte_version("3.5", tmux_bin=self.tmux_bin):
+            if self.capabilities.has_gte_version("3.5"):
                 tmux_args += ("-M",)
             else:
                 warnings.warn(
@@ -1695,7 +1932,7 @@ class Server(
             tmux_args += ("-v",)
 
         if no_expand:
-            if has_gte_version("3.4", tmux_bin=self.tmux_bin):
+            if self.capabilities.has_gte_version("3.4"):
                 tmux_args += ("-l",)
             else:
                 warnings.warn(
@@ -1758,7 +1995,7 @@ class Server(
         >>> isinstance(result, list)
         True
         """
-        if not has_gte_version("3.3", tmux_bin=self.tmux_bin):
+        if not self.capabilities.has_gte_version("3.3"):
             msg = "show_prompt_history requires tmux 3.3+"
             raise exc.LibTmuxException(msg)
 
@@ -1792,7 +2029,7 @@ class Server(
         >>> if has_gte_version("3.3"):
         ...     server.clear_prompt_history()
         """
-        if not has_gte_version("3.3", tmux_bin=self.tmux_bin):
+        if not self.capabilities.has_gte_version("3.3"):
             msg = "clear_prompt_history requires tmux 3.3+"
             raise exc.LibTmuxException(msg)
 
@@ -2140,6 +2377,9 @@ class Server(
         tmux_args += (str(pathlib.Path(path).expanduser()),)
 
         proc = self.cmd("source-file", *tmux_args)
+        # A config file can change any binding, option or hook.
+        self._key_table = None
+        self._note_option_write()
 
         raise_if_stderr(proc, "source-file")
 
@@ -2330,7 +2570,7 @@ class Server(
             del os.environ["TMUX"]
 
         try:
-            tmux_version = str(get_version(tmux_bin=self.tmux_bin))
+            tmux_version = str(self.capabilities.version)
             _fields, format_string = get_output_format("list-sessions", tmux_version)
 
             tmux_args: tuple[str | int, ...] = (
@@ -2396,6 +2636,451 @@ class Server(
 
         return session
 
+    #
+    # Batch
+    #
+    def send_keys_many(
+        self,
+        panes: Iterable[Pane | str],
+        keys: str,
+        *,
+        enter: bool = True,
+        literal: bool = False,
+        suppress_history: bool = False,
+    ) -> None:
+        """Send the same keys to many panes in as few tmux calls as possible.
+
+        Builds one ``send-keys`` per pane, with Enter in the same command,
+        and runs them as chained command sequences (see
+        :func:`~libtmux._internal.command_chain.run_chain`): a few hundred
+        panes take one or two tmux processes instead of two per pane. Panes
+        that fail do not stop the others.
+
+        To mirror typing into every pane of one window interactively, tmux's
+        ``synchronize-panes`` window option is the alternative.
+
+        Parameters
+        ----------
+        panes : iterable of :class:`~libtmux.Pane` or pane IDs
+            Panes to send to.
+        keys : str
+            Keys or text, as for :meth:`Pane.send_keys`.
+        enter : bool, optional
+            Press Enter afterwards. Default True.
+        literal : bool, optional
+            Send *keys* as literal text (``-l``), not key names.
+        suppress_history : bool, optional
+            Prepend a space so shells keep the command out of history.
+
+        Raises
+        ------
+        :exc:`~libtmux.exc.BatchError`
+            Listing, by pane ID, the panes tmux could not send to.
+
+        Examples
+        --------
+        >>> from libtmux.test.retry import retry_until
+        >>> panes = [window.split(shell="sh") for _ in range(3)]
+        >>> server.send_keys_many(panes, "echo $((6 * 7))")
+        >>> retry_until(
+        ...     lambda: all("42" in pane.capture_pane() for pane in panes)
+        ... )
+        True
+
+        .. versionadded:: 0.63
+        """
+        text = f" {keys}" if suppress_history else keys
+        pane_ids = [
+            pane if isinstance(pane, str) else str(pane.pane_id) for pane in panes
+        ]
+        commands: list[list[str]] = []
+        for pane_id in pane_ids:
+            if literal:
+                commands.append(["send-keys", "-t", pane_id, "-l", text])
+                if enter:
+                    commands.append(["send-keys", "-t", pane_id, "Enter"])
+            else:
+                commands.append(
+                    ["send-keys", "-t", pane_id, text, *(["Enter"] if enter else [])],
+                )
+        errors = {
+            result.args[2]: "\n".join(result.stderr)
+            for result in run_chain(self, commands)
+            if not result.ok
+        }
+        if errors:
+            raise exc.BatchError(errors, subcommand="send-keys")
+
+    def capture_many(
+        self,
+        panes: Iterable[Pane | str],
+        start: t.Literal["-"] | int | None = None,
+        end: t.Literal["-"] | int | None = None,
+        *,
+        escape_sequences: bool = False,
+        join_wrapped: bool = False,
+        max_workers: int | None = None,
+    ) -> dict[str, list[str]]:
+        """Capture many panes in one tmux invocation.
+
+        Runs ``capture-pane -p`` for every pane as a chained command sequence
+        and splits the output back by pane (see
+        :func:`~libtmux._internal.command_chain.run_chain`), where calling
+        :meth:`Pane.capture_pane` per pane costs a process each.
+
+        Parameters
+        ----------
+        panes : iterable of :class:`~libtmux.Pane` or pane IDs
+            Panes to capture.
+        start, end : int or ``"-"``, optional
+            Line range, as for :meth:`Pane.capture_pane`.
+        escape_sequences : bool, optional
+            Keep text attributes as escape sequences (``-e``).
+        join_wrapped : bool, optional
+            Join wrapped lines (``-J``).
+        max_workers : int, optional
+            Split the panes into this many groups and capture the groups on
+            a thread pool, one tmux invocation each. Worth it when captures
+            are large enough that tmux's time to render them dominates.
+
+        Returns
+        -------
+        dict
+            Lines per pane ID, in the order given, with trailing empty lines
+            removed as :meth:`Pane.capture_pane` does.
+
+        Raises
+        ------
+        :exc:`~libtmux.exc.BatchError`
+            Listing, by pane ID, the panes tmux could not capture. Its
+            ``results`` holds the captures of the others.
+
+        Examples
+        --------
+        >>> from libtmux.test.retry import retry_until
+        >>> panes = [window.split(shell="sh") for _ in range(2)]
+        >>> server.send_keys_many(panes, "echo $((6 * 7))")
+        >>> retry_until(lambda: all(
+        ...     "42" in lines for lines in server.capture_many(panes).values()
+        ... ))
+        True
+        >>> list(server.capture_many(panes)) == [pane.pane_id for pane in panes]
+        True
+
+        .. versionadded:: 0.63
+        """
+        capture_args = ["-p"]
+        if start is not None:
+            capture_args += ["-S", str(start)]
+        if end is not None:
+            capture_args += ["-E", str(end)]
+        if escape_sequences:
+            capture_args.append("-e")
+        if join_wrapped:
+            capture_args.append("-J")
+        commands = [
+            ["capture-pane", "-t", pane_id, *capture_args]
+            for pane_id in _pane_ids(panes)
+        ]
+
+        if max_workers is None or max_workers < 2 or len(commands) < 2:
+            results = run_chain(self, commands)
+        else:
+            groups = [commands[index::max_workers] for index in range(max_workers)]
+            with concurrent.futures.ThreadPoolExecutor(max_workers) as pool:
+                grouped = list(pool.map(lambda group: run_chain(self, group), groups))
+            # Undo the striping so results follow the order given.
+            results = [
+                grouped[index % max_workers][index // max_workers]
+                for index in range(len(commands))
+            ]
+
+        captures: dict[str, list[str]] = {}
+        errors: dict[str, str] = {}
+        for result in results:
+            pane_id = result.args[2]
+            if not result.ok:
+                errors[pane_id] = "\n".join(result.stderr)
+                continue
+            lines = result.stdout
+            while lines and lines[-1] == "":
+                lines.pop()
+            captures[pane_id] = lines
+        if errors:
+            raise exc.BatchError(errors, subcommand="capture-pane", results=captures)
+        return captures
+
+    def grep(
+        self,
+        pattern: str | re.Pattern[str],
+        scope: Session | Window | Iterable[Pane | str] | None = None,
+        *,
+        start: t.Literal["-"] | int | None = "-",
+        join_wrapped: bool = False,
+        first: bool = False,
+        prefilter: str | None = None,
+        max_workers: int = 4,
+    ) -> list[GrepHit]:
+        r"""Search the history of many panes for a regular expression.
+
+        Panes are captured with :meth:`capture_many` in batches, several
+        batches at a time on a thread pool, and each batch is searched as
+        it arrives -- rather than one ``capture-pane`` process per pane.
+
+        Parameters
+        ----------
+        pattern : str or :class:`re.Pattern`
+            Python regular expression, searched for in each line.
+        scope : :class:`Session`, :class:`Window` or iterable of panes, optional
+            Where to search: a session's or window's panes, given panes or
+            pane IDs. Default: every pane on the server.
+        start : int or ``"-"``, optional
+            First line to capture, as for :meth:`Pane.capture_pane`. Default
+            ``"-"``, the top of the history; ``None`` searches the visible
+            screen only.
+        join_wrapped : bool, optional
+            Join wrapped lines before searching (``-J``).
+        first : bool, optional
+            Return at the first hit, capturing no more panes than needed.
+        prefilter : str, optional
+            A tmux regular expression (POSIX, not Python syntax) checked by
+            tmux itself with ``#{C/r:...}``; panes that do not match are
+            never captured. tmux only looks at the visible screen, so this
+            suits searches of the screen or for text known to be on it.
+        max_workers : int, optional
+            Batches captured at once. Default 4.
+
+        Returns
+        -------
+        list of :class:`~libtmux._internal.pane_grep.GrepHit`
+            ``(pane_id, line_no, line)`` for each matching line, ordered by
+            pane, then line. ``line_no`` counts from the first captured line.
+
+        Raises
+        ------
+        :exc:`~libtmux.exc.BatchError`
+            If panes given in *scope* could not be captured, for instance
+            because they closed. The other panes are still searched, and
+            the error's ``results`` holds their hits. Panes listed from the
+            server, a session or a window that close during the search are
+            left out instead.
+
+        Examples
+        --------
+        >>> from libtmux.test.retry import retry_until
+        >>> pane = window.split(shell="sh")
+        >>> pane.send_keys("echo 'error: disk full'", enter=True)
+        >>> retry_until(lambda: "error: disk full" in pane.capture_pane())
+        True
+        >>> [(hit.pane_id == pane.pane_id, hit.line)
+        ...  for hit in server.grep(r"^error: ", scope=window)]
+        [(True, 'error: disk full')]
+
+        .. versionadded:: 0.63
+        """
+        listed = scope is None or isinstance(scope, (Session, Window))
+        if scope is None:
+            panes: Iterable[Pane | str] = self.panes
+        elif isinstance(scope, (Session, Window)):
+            panes = scope.panes
+        else:
+            panes = scope
+        return grep_panes(
+            self,
+            pattern,
+            _pane_ids(panes),
+            listed=listed,
+            start=start,
+            join_wrapped=join_wrapped,
+            first=first,
+            prefilter=prefilter,
+            max_workers=max_workers,
+        )
+
+    def environments(
+        self,
+        sessions: Iterable[Session | str] | None = None,
+    ) -> Environments:
+        """Read the global environment and many sessions' in one tmux call.
+
+        Runs ``show-environment`` for the global environment and every
+        session as one chained command sequence, where
+        :meth:`Session.show_environment` costs a process per session.
+
+        Parameters
+        ----------
+        sessions : iterable of :class:`Session` or session IDs, optional
+            Sessions to read. Default: every session on the server, listed
+            first with one ``list-sessions``; sessions that close in between
+            are left out.
+
+        Returns
+        -------
+        :class:`~libtmux.common.Environments`
+            ``global_`` and ``sessions``, the latter keyed by session ID in
+            the order given, each parsed as by
+            :meth:`~libtmux.common.EnvironmentMixin.show_environment`.
+
+        Raises
+        ------
+        :exc:`~libtmux.exc.BatchError`
+            Listing, by session ID (or ``"-g"``), what tmux could not read.
+
+        Examples
+        --------
+        >>> session.set_environment("AUDIT", "yes")
+        >>> environments = server.environments()
+        >>> environments.sessions[session.session_id]["AUDIT"]
+        'yes'
+        >>> "AUDIT" in environments.global_
+        False
+
+        .. versionadded:: 0.63
+        """
+        listed = sessions is None
+        if sessions is None:
+            proc = self.cmd("list-sessions", "-F", "#{session_id}")
+            raise_if_stderr(proc, "list-sessions")
+            session_ids = proc.stdout
+        else:
+            session_ids = [
+                session if isinstance(session, str) else str(session.session_id)
+                for session in sessions
+            ]
+        results = run_chain(
+            self,
+            [
+                ["show-environment", "-g"],
+                *(["show-environment", "-t", session_id] for session_id in session_ids),
+            ],
+        )
+
+        environments = Environments(parse_environment(results[0].stdout), {})
+        errors: dict[str, str] = {}
+        if not results[0].ok:
+            errors["-g"] = "\n".join(results[0].stderr)
+        for session_id, result in zip(session_ids, results[1:], strict=True):
+            if result.ok:
+                environments.sessions[session_id] = parse_environment(result.stdout)
+            elif not (listed and _is_target_not_found_error(result.stderr[0])):
+                errors[session_id] = "\n".join(result.stderr)
+        if errors:
+            raise exc.BatchError(errors, subcommand="show-environment")
+        return environments
+
+    def evaluate_formats(
+        self,
+        targets: Iterable[Session | Window | Pane | str] | None,
+        formats: Mapping[str, str],
+    ) -> dict[str, dict[str, str]]:
+        """Expand many format strings for many targets in one tmux call.
+
+        Lists each kind of target once -- ``list-panes -a``,
+        ``list-windows -a`` or ``list-sessions`` -- with every format in
+        one ``-F`` template, as a single chained sequence. Ten formats for
+        1,000 panes take one process, where :meth:`Pane.display_message`
+        costs one per pane and format.
+
+        Parameters
+        ----------
+        targets : iterable of :class:`Session`, :class:`Window`, :class:`Pane` or IDs
+            Objects to expand the formats for. ``None`` for every pane.
+        formats : dict
+            tmux format strings, e.g. ``"#{pane_current_command}"``, by the
+            name to return each under.
+
+        Returns
+        -------
+        dict
+            For each target ID, in the order given, the expanded formats by
+            name.
+
+        Raises
+        ------
+        :exc:`~libtmux.exc.BatchError`
+            Listing, by target ID, the targets tmux does not have.
+
+        Examples
+        --------
+        >>> values = server.evaluate_formats(
+        ...     [pane, session],
+        ...     {"where": "#{session_name}", "windows": "#{session_windows}"},
+        ... )
+        >>> values[session.session_id]["where"] == session.name
+        True
+        >>> list(values) == [pane.pane_id, session.session_id]
+        True
+
+        .. versionadded:: 0.63
+        """
+        return evaluate_formats(
+            self,
+            None if targets is None else _target_ids(targets),
+            formats,
+        )
+
+    def on(
+        self,
+        event: str,
+        callback: t.Callable[[HookEvent], object],
+        *,
+        formats: Sequence[str] = (),
+    ) -> HookSubscription:
+        """Call *callback* in Python each time the tmux hook *event* fires.
+
+        Appends a global hook (``set-hook -ga``), so hooks already set are
+        kept. When it fires, tmux writes the event into a FIFO read by one
+        background thread per server, which calls *callback*. Nothing is
+        polled and no process runs while waiting; each event runs one
+        ``run-shell`` in tmux.
+
+        Parameters
+        ----------
+        event : str
+            Hook name, e.g. ``"pane-exited"``, ``"after-new-window"``,
+            ``"session-closed"`` or ``"alert-bell"``.
+        callback : callable
+            Called with a :class:`~libtmux._internal.hook_events.HookEvent`
+            on the background thread. Keep it short, or hand work off to
+            another thread: events are dispatched one at a time.
+        formats : sequence of str, optional
+            Format variables to expand when the hook runs, e.g.
+            ``["pane_dead_status"]``, added to those every event carries:
+            ``hook``, ``hook_client``, ``hook_session``, ``hook_window``,
+            ``hook_pane`` and the target's ``session_id``, ``window_id``
+            and ``pane_id``.
+
+        Returns
+        -------
+        :class:`~libtmux._internal.hook_events.HookSubscription`
+            :meth:`~libtmux._internal.hook_events.HookSubscription.cancel`
+            it, or use it as a context manager, to remove the hook.
+
+        Raises
+        ------
+        :exc:`~libtmux.exc.OptionBatchError`
+            If tmux rejects the hook.
+
+        Examples
+        --------
+        >>> import queue
+        >>> events = queue.Queue()
+        >>> with server.on("after-new-window", events.put) as subscription:
+        ...     new_window = session.new_window()
+        ...     event = events.get(timeout=5)
+        >>> event.name
+        'after-new-window'
+        >>> event.context["window_id"] == new_window.window_id
+        True
+        >>> subscription.active
+        False
+
+        .. versionadded:: 0.63
+        """
+        if self._hook_bus is None:
+            self._hook_bus = HookBus(self)
+        return self._hook_bus.subscribe(event, callback, formats)
+
     #
     # Relations
     #
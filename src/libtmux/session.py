@@ -14,7 +14,7 @@ import typing as t
 import warnings
 
 from libtmux._internal.query_list import QueryList
-from libtmux.common import has_gte_version, raise_if_stderr, tmux_cmd
+from libtmux.common import raise_if_stderr, tmux_cmd
 from libtmux.constants import WINDOW_DIRECTION_FLAG_MAP, OptionScope, WindowDirection
 from libtmux.formats import FORMAT_SEPARATOR
 from libtmux.hooks import HooksMixin
@@ -723,7 +723,7 @@ class Session(
             flags += ("-C",)
 
         if group:  # Kill all sessions in this session's group (tmux 3.7+)
-            if has_gte_version("3.7", tmux_bin=self.server.tmux_bin):
+            if self.server.capabilities.has_gte_version("3.7"):
                 flags += ("-g",)
             else:
                 warnings.warn(
@@ -0,0 +1,113 @@
+"""Tests for libtmux's chained tmux command runner."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from libtmux._internal.command_chain import command_size, run_chain
+
+if t.TYPE_CHECKING:
+    from libtmux.common import tmux_cmd
+    from libtmux.server import Server
+
+
+def count_invocations(
+    server: Server,
+    monkeypatch: pytest.MonkeyPatch,
+) -> list[tuple[t.Any, ...]]:
+    """Record every argv *server* sends to tmux from now on."""
+    calls: list[tuple[t.Any, ...]] = []
+    original_cmd = server.cmd
+
+    def recording_cmd(*args: t.Any, **kwargs: t.Any) -> tmux_cmd:
+        calls.append(args)
+        return original_cmd(*args, **kwargs)
+
+    monkeypatch.setattr(server, "cmd", recording_cmd)
+    return calls
+
+
+def test_one_invocation_splits_output(
+    server: Server,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Each command gets its own output lines, blank lines included."""
+    server.new_session()
+    calls = count_invocations(server, monkeypatch)
+
+    results = run_chain(
+        server,
+        [
+            ["display-message", "-p", "a"],
+            ["display-message", "-p", ""],
+            ["set-option", "-g", "@chained", "yes"],
+            ["show-options", "-gv", "@chained"],
+        ],
+    )
+
+    assert len(calls) == 1
+    assert [result.stdout for result in results] == [["a"], [""], [], ["yes"]]
+    assert all(result.ok for result in results)
+
+
+def test_failure_does_not_stop_later_commands(server: Server) -> None:
+    """Commands after a failing one still run, once each."""
+    server.new_session()
+
+    results = run_chain(
+        server,
+        [
+            ["set-option", "-g", "@count", "1"],
+            ["send-keys", "-t", "%999999", "x"],
+            ["set-option", "-ga", "@count", "2"],
+        ],
+    )
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[1].stderr == ["can't find pane: %999999"]
+    assert server.cmd("show-options", "-gv", "@count").stdout == ["12"]
+
+
+def test_parse_error_blames_its_command(server: Server) -> None:
+    """A sequence tmux rejects up front is retried to find the culprit."""
+    server.new_session()
+
+    results = run_chain(
+        server,
+        [
+            ["set-option", "-g", "@before", "1"],
+            ["no-such-command"],
+            ["set-option", "-g", "@after", "1"],
+        ],
+    )
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert "unknown command" in results[1].stderr[0]
+    assert server.cmd("show-options", "-gv", "@after").stdout == ["1"]
+
+
+def test_chunks_respect_max_bytes(
+    server: Server,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Commands are split across invocations to stay under the byte budget."""
+    server.new_session()
+    commands = [["set-option", "-g", f"@chunk{n}", "x" * 100] for n in range(40)]
+    calls = count_invocations(server, monkeypatch)
+
+    results = run_chain(server, commands, max_bytes=1000)
+
+    assert all(result.ok for result in results)
+    assert len(calls) > 1
+    assert all(command_size(call) <= 1000 for call in calls)
+    assert server.cmd("show-options", "-gv", "@chunk39").stdout == ["x" * 100]
+
+
+def test_nothing_to_run(server: Server, monkeypatch: pytest.MonkeyPatch) -> None:
+    """An empty batch spawns no tmux process."""
+    calls = count_invocations(server, monkeypatch)
+
+    assert run_chain(server, []) == []
+    assert calls == []
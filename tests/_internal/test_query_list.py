@@ -135,6 +135,41 @@ class Obj:
             {"fruit__endswith": "z"},
             [],
         ),
+        (
+            [{"index": 9}, {"index": 10}],
+            {"index__gt": 9},
+            [{"index": 10}],
+        ),
+        (
+            [{"index": 9}, {"index": 10}],
+            {"index__gte": 9},
+            [{"index": 9}, {"index": 10}],
+        ),
+        (
+            [{"index": 9}, {"index": 10}],
+            {"index__lt": 10},
+            [{"index": 9}],
+        ),
+        (
+            [{"index": 9}, {"index": 10}],
+            {"index__lte": 8},
+            [],
+        ),
+        (
+            [{"index": "9"}, {"index": "10"}],
+            {"index__gt": "9"},
+            [{"index": "10"}],
+        ),
+        (
+            [{"index": "9"}, {"index": "10"}],
+            {"index__lt": 10},
+            [{"index": "9"}],
+        ),
+        (
+            [{"name": "main"}, {"name": "10"}],
+            {"name__gte": 5},
+            [{"name": "10"}],
+        ),
         (
             [
                 {"fruit": "apple"},
@@ -343,3 +378,41 @@ def test_object_does_not_exist_exposes_query() -> None:
     query: dict[str, t.Any] = {"pane_id": "%9"}
     assert ObjectDoesNotExist(query=query).query == query
     assert ObjectDoesNotExist().query is None
+
+
+class OrderingLookupFixture(t.NamedTuple):
+    """Test fixture for ordering lookups against tmux's string fields."""
+
+    test_id: str
+    lookup: str
+    rhs: t.Any
+    expected: list[str]
+
+
+ORDERING_LOOKUP_FIXTURES: list[OrderingLookupFixture] = [
+    OrderingLookupFixture("gt_int", "gt", 5, ["9", "10"]),
+    OrderingLookupFixture("gt_numeric_str", "gt", "9", ["10"]),
+    OrderingLookupFixture("gte_int", "gte", 10, ["10"]),
+    OrderingLookupFixture("lt_int", "lt", 10, ["9"]),
+    OrderingLookupFixture("lte_numeric_str", "lte", "9", ["9"]),
+    OrderingLookupFixture("gt_unorderable", "gt", None, []),
+]
+
+
+@pytest.mark.parametrize(
+    list(OrderingLookupFixture._fields),
+    ORDERING_LOOKUP_FIXTURES,
+    ids=[test.test_id for test in ORDERING_LOOKUP_FIXTURES],
+)
+def test_ordering_lookups_compare_numeric_strings(
+    test_id: str,
+    lookup: str,
+    rhs: t.Any,
+    expected: list[str],
+) -> None:
+    """Numeric str fields order as numbers; unorderable values match nothing."""
+    qs: QueryList[dict[str, t.Any]] = QueryList(
+        [{"window_index": "9"}, {"window_index": "10"}]
+    )
+    matched = qs.filter(None, **{f"window_index__{lookup}": rhs})
+    assert [row["window_index"] for row in matched] == expected
@@ -0,0 +1,146 @@
+"""Tests for libtmux's screen grid and SGR parser."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from libtmux._internal.screen import DEFAULT_COLOR, Attr, Cell, Screen, rgb
+from libtmux.test.retry import retry_until
+
+if t.TYPE_CHECKING:
+    from libtmux.session import Session
+
+
+class ScreenParseFixture(t.NamedTuple):
+    """A styled line and the cell expected at one position."""
+
+    test_id: str
+    line: str
+    col: int
+    expected: Cell
+
+
+SCREEN_PARSE_FIXTURES: list[ScreenParseFixture] = [
+    ScreenParseFixture(
+        test_id="plain",
+        line="abc",
+        col=1,
+        expected=Cell("b", DEFAULT_COLOR, DEFAULT_COLOR, Attr.NONE),
+    ),
+    ScreenParseFixture(
+        test_id="palette_16",
+        line="\x1b[93;104mx",
+        col=0,
+        expected=Cell("x", 11, 12, Attr.NONE),
+    ),
+    ScreenParseFixture(
+        test_id="palette_256",
+        line="\x1b[38;5;208mx",
+        col=0,
+        expected=Cell("x", 208, DEFAULT_COLOR, Attr.NONE),
+    ),
+    ScreenParseFixture(
+        test_id="truecolor_colon",
+        line="\x1b[48:2::10:20:30mx",
+        col=0,
+        expected=Cell("x", DEFAULT_COLOR, rgb(10, 20, 30), Attr.NONE),
+    ),
+    ScreenParseFixture(
+        test_id="attributes_stack_and_clear",
+        line="\x1b[1;3;4mab\x1b[22;24mc",
+        col=2,
+        expected=Cell("c", DEFAULT_COLOR, DEFAULT_COLOR, Attr.ITALIC),
+    ),
+    ScreenParseFixture(
+        test_id="reset",
+        line="\x1b[7;31ma\x1b[mb",
+        col=1,
+        expected=Cell("b", DEFAULT_COLOR, DEFAULT_COLOR, Attr.NONE),
+    ),
+    ScreenParseFixture(
+        test_id="non_sgr_skipped",
+        line="\x1b]8;;https://example.com\x1b\\a\x1b[2Kb",
+        col=1,
+        expected=Cell("b", DEFAULT_COLOR, DEFAULT_COLOR, Attr.NONE),
+    ),
+    ScreenParseFixture(
+        test_id="wide_character",
+        line="\x1b[32m漢x",
+        col=2,
+        expected=Cell("x", 2, DEFAULT_COLOR, Attr.NONE),
+    ),
+    ScreenParseFixture(
+        test_id="wide_character_right_half",
+        line="漢",
+        col=1,
+        expected=Cell("", DEFAULT_COLOR, DEFAULT_COLOR, Attr.NONE),
+    ),
+    ScreenParseFixture(
+        test_id="past_text_is_blank",
+        line="\x1b[41mab",
+        col=5,
+        expected=Cell(" ", DEFAULT_COLOR, DEFAULT_COLOR, Attr.NONE),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(ScreenParseFixture._fields),
+    SCREEN_PARSE_FIXTURES,
+    ids=[test.test_id for test in SCREEN_PARSE_FIXTURES],
+)
+def test_screen_parse(test_id: str, line: str, col: int, expected: Cell) -> None:
+    """SGR sequences set the style of the cells written after them."""
+    screen = Screen.parse([line], width=8)
+    assert screen[0, col] == expected
+
+
+def test_style_carries_across_lines() -> None:
+    """A style is not reset at the end of a line."""
+    screen = Screen.parse(["\x1b[31ma", "b\x1b[0m"], width=4, height=3)
+    assert screen[1, 0].fg == 1
+    assert screen.lines == ["a", "b"]
+    assert screen.height == 3
+
+
+def test_text_past_width_is_cut() -> None:
+    """Text beyond the screen's width is dropped, not wrapped."""
+    screen = Screen.parse(["abcdef", "漢漢漢"], width=4)
+    assert screen.lines == ["abcd", "漢漢"]
+    with pytest.raises(IndexError):
+        screen[0, 4]
+
+
+def test_diff() -> None:
+    """Only changed rows are reported, with old and new cells."""
+    before = Screen.parse(["same", "old"], width=4)
+    after = Screen.parse(["same", "o\x1b[1mld"], width=4)
+
+    assert before != after
+    assert before == Screen.parse(["same", "old"], width=4)
+    assert before.changed_rows(after) == [1]
+    assert [(change.row, change.col) for change in before.diff(after)] == [
+        (1, 1),
+        (1, 2),
+    ]
+    with pytest.raises(ValueError, match="cannot compare"):
+        before.diff(Screen.parse(["same"], width=4))
+
+
+def test_pane_screen(session: Session) -> None:
+    """Pane.screen() is sized to the pane and reads tmux's styles."""
+    pane = session.active_window.split(shell="sh")
+    pane.send_keys(r"printf '\033[4;44mblue\033[0m\n'", enter=True)
+    retry_until(lambda: "blue" in pane.capture_pane()[1:])
+
+    screen = pane.screen()
+    row = screen.lines.index("blue")
+
+    assert (screen.width, screen.height) == (
+        int(pane.pane_width or 0),
+        int(pane.pane_height or 0),
+    )
+    assert screen[row, 0] == Cell("b", DEFAULT_COLOR, 4, Attr.UNDERLINE)
+    assert screen.lines == pane.capture_pane()
@@ -0,0 +1,191 @@
+"""Tests for libtmux's single-flight call coalescing."""
+
+from __future__ import annotations
+
+import threading
+import time
+import typing as t
+
+import pytest
+
+from libtmux import neo
+from libtmux._internal.single_flight import SingleFlight
+from libtmux.common import tmux_cmd
+
+if t.TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from libtmux.server import Server
+    from libtmux.session import Session
+
+
+def wait_for_waiters(
+    flight: SingleFlight[t.Any],
+    key: Hashable,
+    count: int,
+    timeout: float = 5.0,
+) -> bool:
+    """Return True once *count* callers wait on *key*'s call in *flight*."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with flight._lock:
+            call = flight._calls.get(key)
+            if call is not None and call.waiters >= count:
+                return True
+        time.sleep(0.005)
+    return False
+
+
+def run_herd(
+    flight: SingleFlight[t.Any],
+    key: str,
+    fn: t.Callable[[], t.Any],
+    release: threading.Event,
+    size: int = 4,
+) -> list[t.Any]:
+    """Start *size* callers on *key*, release the leader, return outcomes."""
+    outcomes: list[t.Any] = []
+    lock = threading.Lock()
+
+    def call() -> None:
+        try:
+            outcome = flight.do(key, fn)
+        except RuntimeError as error:
+            outcome = error
+        with lock:
+            outcomes.append(outcome)
+
+    threads = [threading.Thread(target=call) for _ in range(size)]
+    for thread in threads:
+        thread.start()
+    assert wait_for_waiters(flight, key, size - 1)
+    release.set()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_herd_shares_one_run() -> None:
+    """Overlapping callers receive the leader's result; fn runs once."""
+    flight: SingleFlight[list[str]] = SingleFlight()
+    release = threading.Event()
+    runs: list[int] = []
+
+    def fetch() -> list[str]:
+        runs.append(1)
+        release.wait()
+        return ["%1"]
+
+    outcomes = run_herd(flight, "list-panes", fetch, release)
+
+    assert len(runs) == 1
+    assert outcomes == [["%1"]] * 4
+    assert all(outcome is outcomes[0] for outcome in outcomes)
+
+
+def test_herd_shares_the_error() -> None:
+    """Every caller sees the exception the shared run raised."""
+    flight: SingleFlight[None] = SingleFlight()
+    release = threading.Event()
+
+    def fail() -> None:
+        release.wait()
+        msg = "no server running"
+        raise RuntimeError(msg)
+
+    outcomes = run_herd(flight, "list-panes", fail, release)
+
+    assert len(outcomes) == 4
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+
+
+def test_results_are_not_cached() -> None:
+    """Once a call returns, the next caller with the same key runs again."""
+    flight: SingleFlight[int] = SingleFlight()
+    runs = iter(range(10))
+
+    assert flight.do("k", lambda: next(runs)) == 0
+    assert flight.do("k", lambda: next(runs)) == 1
+
+
+def test_keys_do_not_wait_on_each_other() -> None:
+    """A call in flight for one key does not block another key."""
+    flight: SingleFlight[str] = SingleFlight()
+    release = threading.Event()
+    thread = threading.Thread(
+        target=flight.do,
+        args=("slow", lambda: str(release.wait())),
+    )
+    thread.start()
+    try:
+        assert flight.do("fast", lambda: "done") == "done"
+    finally:
+        release.set()
+        thread.join()
+
+
+def test_fetch_objs_coalesces_identical_listings(
+    server: Server,
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A herd reading ``Server.panes`` at once costs one ``list-panes``."""
+    session.active_window.split()
+    expected = [pane.pane_id for pane in server.panes]
+    release = threading.Event()
+    spawned: list[tuple[t.Any, ...]] = []
+
+    def gated_tmux_cmd(*args: t.Any, **kwargs: t.Any) -> tmux_cmd:
+        spawned.append(args)
+        release.wait()
+        return tmux_cmd(*args, **kwargs)
+
+    monkeypatch.setattr(neo, "tmux_cmd", gated_tmux_cmd)
+    monkeypatch.setattr(server, "coalesce_queries", True)
+
+    pane_ids: list[list[str | None]] = []
+
+    def list_panes() -> None:
+        pane_ids.append([pane.pane_id for pane in server.panes])
+
+    threads = [threading.Thread(target=list_panes) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    key = (server.tmux_bin, False, *map(str, _wait_for_first(spawned)))
+    assert wait_for_waiters(neo._in_flight_lists, key, 3)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(spawned) == 1
+    assert len(pane_ids) == 4
+    assert pane_ids == [expected] * 4
+
+
+def test_fetch_objs_without_coalescing(
+    server: Server,
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Coalescing is opt-in: by default every caller runs its own listing."""
+    spawned: list[tuple[t.Any, ...]] = []
+
+    def counting_tmux_cmd(*args: t.Any, **kwargs: t.Any) -> tmux_cmd:
+        spawned.append(args)
+        return tmux_cmd(*args, **kwargs)
+
+    monkeypatch.setattr(neo, "tmux_cmd", counting_tmux_cmd)
+    assert server.coalesce_queries is False
+
+    neo.fetch_objs(server=server, list_cmd="list-sessions")
+    neo.fetch_objs(server=server, list_cmd="list-sessions")
+
+    assert len(spawned) == 2
+
+
+def _wait_for_first(spawned: list[tuple[t.Any, ...]]) -> tuple[t.Any, ...]:
+    """Return the first argv the leader spawned, once it has spawned one."""
+    event = threading.Event()
+    while not spawned:
+        event.wait(0.005)
+    return spawned[0]
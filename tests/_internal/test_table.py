@@ -0,0 +1,169 @@
+"""Tests for libtmux's column-oriented listing table."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from libtmux._internal import table as table_module
+from libtmux._internal.table import Table
+from libtmux.formats import FORMAT_SEPARATOR
+from libtmux.neo import fetch_objs, fetch_table
+
+if t.TYPE_CHECKING:
+    from libtmux.server import Server
+    from libtmux.session import Session
+
+
+def make_table() -> Table:
+    """Return a small pane listing with a gap in its numeric column."""
+    return Table(
+        {
+            "pane_id": ["%1", "%2", "%3", "%4"],
+            "window_index": [10, 9, None, 2],
+            "window_id": ["@1", "@1", "@2", None],
+        },
+        numeric=["window_index"],
+    )
+
+
+def test_columns_must_share_length() -> None:
+    """A ragged column is refused up front rather than misaligning rows."""
+    with pytest.raises(ValueError, match="differ in length"):
+        Table({"pane_id": ["%1"], "pane_width": []})
+
+
+def test_from_lines_rejects_misaligned_line() -> None:
+    """A line with the wrong value count fails like :func:`parse_output`."""
+    with pytest.raises(ValueError, match="Expected 2 values"):
+        Table.from_lines(["%1|80|9|"], fields=("a", "b"), separator="|")
+
+
+def test_numeric_fields_ignore_missing_columns() -> None:
+    """Only columns the table holds are reported numeric."""
+    table = Table({"pane_width": [1]}, numeric=["pane_width", "pane_height"])
+    assert table.numeric_fields == frozenset({"pane_width"})
+
+
+class SortFixture(t.NamedTuple):
+    """A sort request and the pane order it yields."""
+
+    test_id: str
+    by: str
+    reverse: bool
+    expected: list[str]
+
+
+SORT_FIXTURES: list[SortFixture] = [
+    SortFixture(
+        test_id="numeric_ascending",
+        by="window_index",
+        reverse=False,
+        expected=["%4", "%2", "%1", "%3"],
+    ),
+    SortFixture(
+        test_id="numeric_descending_keeps_empty_last",
+        by="window_index",
+        reverse=True,
+        expected=["%1", "%2", "%4", "%3"],
+    ),
+    SortFixture(
+        test_id="string_stable",
+        by="window_id",
+        reverse=False,
+        expected=["%1", "%2", "%3", "%4"],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(SortFixture._fields),
+    SORT_FIXTURES,
+    ids=[test.test_id for test in SORT_FIXTURES],
+)
+def test_sort(test_id: str, by: str, reverse: bool, expected: list[str]) -> None:
+    """Numeric columns sort as numbers, and empty cells always trail."""
+    assert make_table().sort(by, reverse=reverse).column("pane_id") == expected
+
+
+def test_group_by_keeps_first_seen_order() -> None:
+    """Groups follow first appearance; empty cells group under ``None``."""
+    groups = make_table().group_by("window_id")
+    assert list(groups) == ["@1", "@2", None]
+    assert groups["@1"].column("pane_id") == ["%1", "%2"]
+    assert groups["@1"].numeric_fields == frozenset({"window_index"})
+
+
+def test_where_rejects_short_mask() -> None:
+    """A mask that does not cover every row is an error, not a silent trim."""
+    with pytest.raises(ValueError, match="Mask has 1 entries for 4 rows"):
+        make_table().where([True])
+
+
+def test_array_requires_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without NumPy, :meth:`Table.array` says what to use instead."""
+    monkeypatch.setattr(table_module, "_numpy", lambda: None)
+    with pytest.raises(ImportError, match=r"Table\.column\(\)"):
+        make_table().array("window_index")
+
+
+def test_array_with_numpy() -> None:
+    """Numeric arrays mask empty cells and drive :meth:`Table.where` directly."""
+    np = pytest.importorskip("numpy")
+    table = make_table()
+
+    indexes = table.array("window_index")
+    assert isinstance(indexes, np.ma.MaskedArray)
+    assert indexes.mask.tolist() == [False, False, True, False]
+    assert int(indexes.sum()) == 21
+
+    assert table.where(indexes > 5).column("pane_id") == ["%1", "%2"]
+    assert table.array("pane_id").dtype == object
+
+
+def test_fetch_table_matches_fetch_objs(server: Server, session: Session) -> None:
+    """A table holds the same rows as the dict listing, numeric cells decoded."""
+    window = session.new_window(window_name="table")
+    window.split()
+
+    rows = fetch_objs(server=server, list_cmd="list-panes", list_extra_args=("-a",))
+    table = fetch_table(
+        server=server,
+        list_cmd="list-panes",
+        list_extra_args=("-a",),
+    )
+
+    assert len(table) == len(rows)
+    assert table.column("pane_id") == [row["pane_id"] for row in rows]
+    assert table.column("pane_width") == [int(row["pane_width"]) for row in rows]
+
+    decoded = [{key: str(value) for key, value in row.items()} for row in table.rows()]
+    assert decoded == rows
+
+
+def test_fetch_table_filter(server: Server, session: Session) -> None:
+    """A tmux-side filter narrows the table before it is built."""
+    window = session.new_window(window_name="table-filter")
+    assert window.window_id is not None
+
+    table = fetch_table(
+        server=server,
+        list_cmd="list-windows",
+        list_extra_args=("-a",),
+        filter=f"#{{==:#{{window_id}},{window.window_id}}}",
+    )
+
+    assert table.column("window_id") == [window.window_id]
+
+
+def test_from_lines_uses_tmux_separator() -> None:
+    """Lines built with the library separator round-trip."""
+    line = FORMAT_SEPARATOR.join(["%1", "80"]) + FORMAT_SEPARATOR
+    table = Table.from_lines(
+        [line],
+        fields=("pane_id", "pane_width"),
+        separator=FORMAT_SEPARATOR,
+        numeric=("pane_width",),
+    )
+    assert list(table.rows()) == [{"pane_id": "%1", "pane_width": 80}]
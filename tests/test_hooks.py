@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import queue
 import typing as t
 
 import pytest
 
+from libtmux import exc
 from libtmux._internal.constants import Hooks
 from libtmux._internal.sparse_array import SparseArray
 from libtmux.common import has_gte_version
 
 if t.TYPE_CHECKING:
+    from libtmux._internal.hook_events import HookEvent
     from libtmux.server import Server
 
 
@@ -1117,3 +1120,91 @@ def test_show_hooks_empty_result(server: Server) -> None:
 
     # Should be a dict (possibly empty)
     assert isinstance(hooks, dict)
+
+
+def test_set_hooks_one_invocation(
+    server: Server,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """All indices, and clearing the old ones, take one tmux process."""
+    session = server.new_session(session_name="test_set_hooks_batched")
+    session.set_hooks("session-renamed", {7: "display-message old"})
+    calls: list[tuple[t.Any, ...]] = []
+    original_cmd = server.cmd
+
+    def recording_cmd(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        calls.append(args)
+        return original_cmd(*args, **kwargs)
+
+    monkeypatch.setattr(server, "cmd", recording_cmd)
+    session.set_hooks(
+        "session-renamed",
+        [f"display-message 'hook {index}'" for index in range(10)],
+        clear_existing=True,
+    )
+    monkeypatch.undo()
+
+    assert len(calls) == 1
+    hooks = session.show_hook("session-renamed")
+    assert isinstance(hooks, SparseArray)
+    assert sorted(hooks.keys()) == list(range(10))
+
+    session.unset_hook("session-renamed")
+
+
+def test_set_hooks_reports_failed_index(server: Server) -> None:
+    """A rejected hook is reported by name and index."""
+    session = server.new_session(session_name="test_set_hooks_error")
+
+    with pytest.raises(exc.OptionBatchError) as excinfo:
+        session.set_hooks("no-such-hook", ["display-message x"])
+
+    assert list(excinfo.value.option_errors) == ["no-such-hook[0]"]
+
+
+def test_on_dispatches_to_python(server: Server) -> None:
+    """Hook events reach Python callbacks; cancelling removes only our hook."""
+    session = server.new_session(session_name="test_on")
+    server.set_hook("pane-exited[0]", "display-message kept")
+    events: queue.Queue[HookEvent] = queue.Queue()
+
+    def failing(event: HookEvent) -> None:
+        msg = "callback failure"
+        raise RuntimeError(msg)
+
+    broken = server.on("pane-exited", failing)
+    subscription = server.on("pane-exited", events.put, formats=["pane_dead"])
+    pane = session.active_window.split(shell="sh")
+    pane.send_keys("exit", enter=True)
+
+    event = events.get(timeout=5)
+    assert event.name == "pane-exited"
+    assert event.context["hook_pane"] == pane.pane_id
+    assert "pane_dead" in event.context
+
+    broken.cancel()
+    subscription.cancel()
+    subscription.cancel()
+    assert not subscription.active
+    assert server.show_hook("pane-exited") == {0: "display-message kept"}
+
+
+def test_on_invalidates_option_cache(server: Server) -> None:
+    """Subscribing and cancelling show up in cached hook reads."""
+    server.new_session(session_name="test_on_cache")
+    server.cache_options()
+    assert not server.show_hook("pane-exited")
+
+    subscription = server.on("pane-exited", print)
+    assert subscription.token in str(server.show_hook("pane-exited"))
+
+    subscription.cancel()
+    assert not server.show_hook("pane-exited")
+
+
+def test_on_unknown_hook(server: Server) -> None:
+    """A hook name tmux rejects raises."""
+    server.new_session(session_name="test_on_unknown")
+
+    with pytest.raises(exc.OptionBatchError):
+        server.on("no-such-hook", print)
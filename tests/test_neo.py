@@ -15,14 +15,21 @@ import pytest
 
 from libtmux.neo import (
     _CONTEXT_ONLY_TOKENS,
+    FIELD_TYPES,
     FIELD_VERSION,
+    NUMERIC_FIELDS,
     SCOPES_BY_LIST_CMD,
     Obj,
     _is_target_not_found_error,
     _token_scope,
+    decode_field,
+    fetch_objs,
     get_output_format,
 )
 
+if t.TYPE_CHECKING:
+    from libtmux.session import Session
+
 
 class TargetNotFoundFixture(t.NamedTuple):
     """One line of tmux stderr, and whether it means "that object is gone"."""
@@ -258,3 +265,71 @@ def test_every_obj_field_classifies_to_known_scope() -> None:
         "(add them to _SCOPE_OVERRIDES, _SCOPE_PREFIXES, "
         f"_UNIVERSAL_TOKENS, or _CONTEXT_ONLY_TOKENS): {unclassified}"
     )
+
+
+def test_field_types_keys_are_obj_fields() -> None:
+    """Every typed field name must exist on :class:`libtmux.neo.Obj`."""
+    obj_fields = set(Obj.__dataclass_fields__)
+    for token in FIELD_TYPES:
+        assert token in obj_fields, f"{token!r} in FIELD_TYPES but not on Obj"
+
+
+def test_string_flag_fields_stay_text() -> None:
+    """``*_flags`` tokens are flag strings like ``"*Z"``, not booleans."""
+    for token in ("window_flags", "window_raw_flags", "pane_flags"):
+        assert token not in FIELD_TYPES
+        assert decode_field(token, "*Z") == "*Z"
+
+
+def test_numeric_fields_hold_integers(session: Session) -> None:
+    """Every :data:`NUMERIC_FIELDS` value a live server reports is an integer."""
+    session.active_window.split()
+    for list_cmd in ("list-sessions", "list-windows", "list-panes"):
+        for row in fetch_objs(
+            server=session.server,
+            list_cmd=list_cmd,
+            list_extra_args=("-a",) if list_cmd != "list-sessions" else None,
+        ):
+            for name in NUMERIC_FIELDS.intersection(row):
+                assert row[name].lstrip("-").isdigit(), (list_cmd, name, row[name])
+
+
+def test_session_name_lists_stay_text(session: Session) -> None:
+    """Lists of session names are not split: names may contain commas."""
+    server = session.server
+    grouped = server.new_session(session_name="a,b}#x", attach=False)
+    assert grouped.session_name == "a,b}#x"
+    window = grouped.active_window
+
+    row = fetch_objs(
+        server=server,
+        list_cmd="list-windows",
+        list_extra_args=("-t", str(grouped.session_id)),
+        typed=True,
+    )[0]
+
+    assert row["window_id"] == window.window_id
+    assert row["window_linked_sessions_list"] == "a,b}#x"
+    assert decode_field("session_group_list", "a,b") == "a,b"
+
+
+def test_decode_field_flag_false() -> None:
+    """A ``"0"`` flag decodes to ``False`` rather than a truthy string."""
+    assert decode_field("window_zoomed_flag", "0") is False
+
+
+def test_typed_rows_sort_numerically(session: Session) -> None:
+    """Typed listings order window index 10 after 9, not after 1."""
+    for index in (9, 10):
+        session.new_window(window_name=f"typed-{index}", window_index=str(index))
+
+    rows = fetch_objs(
+        server=session.server,
+        list_cmd="list-windows",
+        list_extra_args=("-t", str(session.session_id)),
+        typed=True,
+    )
+    indexes = sorted(row["window_index"] for row in rows)
+
+    assert indexes[-2:] == [9, 10]
+    assert all(isinstance(row["window_active"], bool) for row in rows)
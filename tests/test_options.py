@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import dataclasses
+import shlex
 import textwrap
+import timeit
 import typing as t
 
 import pytest
@@ -16,13 +18,24 @@ from libtmux._internal.constants import (
     SessionOptions,
     WindowOptions,
 )
+from libtmux._internal.effective_options import OptionSource
 from libtmux._internal.sparse_array import SparseArray
 from libtmux.common import has_gte_version
 from libtmux.constants import OptionScope
-from libtmux.options import TerminalOverrides, convert_values, explode_arrays
+from libtmux.options import (
+    OptionChange,
+    TerminalOverrides,
+    _plan_option,
+    convert_values,
+    explode_arrays,
+    parse_options,
+    parse_options_to_dict,
+)
 from libtmux.pane import Pane
 
 if t.TYPE_CHECKING:
+    import pathlib
+
     from typing_extensions import LiteralString
 
     from libtmux.server import Server
@@ -1696,3 +1709,435 @@ def test_set_environment_expand_format(session: Session) -> None:
     # The value should have been expanded (not the raw format string)
     assert "FORMAT_TEST_VAR" in env
     assert env["FORMAT_TEST_VAR"] != "#{session_name}"
+
+
+def test_set_options_one_invocation(
+    server: Server,
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A whole option dict is applied with one tmux process."""
+    profile = {f"@profile-{number}": f"value {number}" for number in range(40)}
+    calls: list[tuple[t.Any, ...]] = []
+    original_cmd = server.cmd
+
+    def recording_cmd(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        calls.append(args)
+        return original_cmd(*args, **kwargs)
+
+    monkeypatch.setattr(server, "cmd", recording_cmd)
+    session.set_options({**profile, "status": False})
+
+    assert len(calls) == 1
+    monkeypatch.undo()
+    assert session.show_option("@profile-39") == "value 39"
+    assert session.show_option("status") is False
+
+
+def test_set_options_targets_each_command(session: Session) -> None:
+    """Every chained command targets the object, not only the first one."""
+    window = session.active_window
+    pane = window.split()
+    other = window.active_pane
+    assert other is not None and other.pane_id != pane.pane_id
+
+    pane.set_options({"@first": "a", "@second": "b"}, scope=OptionScope.Pane)
+
+    assert pane.show_option("@second", scope=OptionScope.Pane) == "b"
+    assert "@second" not in other.show_options(scope=OptionScope.Pane)
+
+
+def test_set_options_maps_errors(session: Session) -> None:
+    """Failures are classified per option; the other options are still set."""
+    with pytest.raises(exc.OptionError) as excinfo:
+        session.set_options(
+            {"@before": "yes", "no-such-option": "x", "@after": "yes"},
+        )
+
+    error = excinfo.value
+    assert isinstance(error, exc.OptionBatchError)
+    assert isinstance(error, exc.BatchError)
+    assert list(error.option_errors) == ["no-such-option"]
+    assert isinstance(error.option_errors["no-such-option"], exc.InvalidOption)
+    assert session.show_option("@after") == "yes"
+
+
+class PlanOptionFixture(t.NamedTuple):
+    """Desired and current (raw) option values, and the changes planned."""
+
+    test_id: str
+    name: str
+    value: t.Any
+    current: t.Any
+    expected: list[OptionChange]
+
+
+PLAN_OPTION_FIXTURES: list[PlanOptionFixture] = [
+    PlanOptionFixture(
+        test_id="scalar_unchanged",
+        name="escape-time",
+        value=500,
+        current="500",
+        expected=[],
+    ),
+    PlanOptionFixture(
+        test_id="bool_changed",
+        name="status",
+        value=False,
+        current="on",
+        expected=[OptionChange("set", "status", "off")],
+    ),
+    PlanOptionFixture(
+        test_id="none_unsets",
+        name="@team",
+        value=None,
+        current="infra",
+        expected=[OptionChange("unset", "@team")],
+    ),
+    PlanOptionFixture(
+        test_id="array_by_index",
+        name="update-environment",
+        value=["DISPLAY", "TERM"],
+        current={0: "DISPLAY", 1: "SSH_AUTH_SOCK", 4: "WINDOWID"},
+        expected=[
+            OptionChange("set", "update-environment[1]", "TERM"),
+            OptionChange("unset", "update-environment[4]"),
+        ],
+    ),
+    PlanOptionFixture(
+        test_id="sparse_array",
+        name="status-format",
+        value=SparseArray({1: "#[align=centre]"}),
+        current=None,
+        expected=[OptionChange("set", "status-format[1]", "#[align=centre]")],
+    ),
+    PlanOptionFixture(
+        test_id="command_alias_by_key",
+        name="command-alias",
+        value={"info": "show-messages -JT", "ll": "list-windows", "sp": "split-w"},
+        current={0: "sp=split-window", 3: "info=show-messages -JT", 5: "old=x"},
+        expected=[
+            OptionChange("append", "command-alias", "ll=list-windows"),
+            OptionChange("set", "command-alias[0]", "sp=split-w"),
+            OptionChange("unset", "command-alias[5]"),
+        ],
+    ),
+    PlanOptionFixture(
+        test_id="terminal_features",
+        name="terminal-features",
+        value={"xterm*": ["clipboard", "focus"]},
+        current={0: "xterm*:clipboard", 1: "screen*:title"},
+        expected=[
+            OptionChange("set", "terminal-features[0]", "xterm*:clipboard:focus"),
+            OptionChange("unset", "terminal-features[1]"),
+        ],
+    ),
+    PlanOptionFixture(
+        test_id="terminal_overrides",
+        name="terminal-overrides",
+        value={"xterm*": {"Tc": None, "Ms": "\\E]52"}},
+        current=None,
+        expected=[
+            OptionChange("append", "terminal-overrides", "xterm*:Tc:Ms=\\E]52"),
+        ],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(PlanOptionFixture._fields),
+    PLAN_OPTION_FIXTURES,
+    ids=[test.test_id for test in PLAN_OPTION_FIXTURES],
+)
+def test_plan_option(
+    test_id: str,
+    name: str,
+    value: t.Any,
+    current: t.Any,
+    expected: list[OptionChange],
+) -> None:
+    """Only the differences between desired and current are planned."""
+    assert sorted(_plan_option(name, value, current)) == sorted(expected)
+
+
+def test_apply_options_reconciles(
+    server: Server,
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A baseline is applied in one call, then holds with no changes."""
+    aliases = server.show_option("command-alias", global_=True)
+    assert isinstance(aliases, dict)
+    baseline: dict[str, t.Any] = {
+        "command-alias": {**aliases, "ll": "list-windows -a"},
+    }
+    calls: list[tuple[t.Any, ...]] = []
+    original_cmd = server.cmd
+
+    def recording_cmd(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        calls.append(args)
+        return original_cmd(*args, **kwargs)
+
+    monkeypatch.setattr(server, "cmd", recording_cmd)
+    plan = server.apply_options(baseline, global_=True)
+    assert plan == [OptionChange("append", "command-alias", "ll=list-windows -a")]
+    assert len(calls) == 2  # Read the options, then change them.
+    assert server.apply_options(baseline, global_=True) == []
+    assert len(calls) == 3
+    monkeypatch.undo()
+
+    aliases = server.show_option("command-alias", global_=True)
+    assert isinstance(aliases, dict)
+    assert aliases["ll"] == "list-windows -a"
+
+
+def test_apply_options_prune_and_dry_run(session: Session) -> None:
+    """Pruning unsets local options not in the baseline; dry runs change nothing."""
+    session.set_options({"@keep": "yes", "@drop": "yes"})
+
+    plan = session.apply_options({"@keep": "yes"}, prune=True, dry_run=True)
+    assert plan == [OptionChange("unset", "@drop")]
+    assert "@drop" in session.show_options()
+
+    session.apply_options({"@keep": "yes"}, prune=True)
+    assert "@drop" not in session.show_options()
+    assert session.show_option("@keep") == "yes"
+
+
+def shlex_parse_options(lines: list[str]) -> dict[str, str | None]:
+    """Parse option output the way libtmux did before its tokenizer."""
+    output: dict[str, str | None] = {}
+    for item in lines:
+        val: str | None = None
+        if " " in item:
+            try:
+                key, val = shlex.split(item)
+            except ValueError:
+                key, val = item.split(" ", maxsplit=1)
+        else:
+            key = item
+        key = key.strip()
+        if key:
+            output[key] = val.rstrip("\n") if val is not None else None
+    return output
+
+
+class ParseOptionsFixture(t.NamedTuple):
+    """A line of option output whose value exercises tmux's quoting."""
+
+    test_id: str
+    line: str
+
+
+PARSE_OPTIONS_FIXTURES: list[ParseOptionsFixture] = [
+    ParseOptionsFixture("plain", "status-keys vi"),
+    ParseOptionsFixture("no_value", "user-keys"),
+    ParseOptionsFixture("empty_value", "@empty "),
+    ParseOptionsFixture("double_quoted", 'command-alias[0] "info=show-messages -JT"'),
+    ParseOptionsFixture("double_quoted_escapes", r'@esc "a \"b\" \\ \$c"'),
+    ParseOptionsFixture("single_quoted", "@single 'a \"b\" \\c'"),
+    ParseOptionsFixture("joined_quotes", "@joined 'it'\\''s'\" ok\""),
+    ParseOptionsFixture("bare_escape", r"@bare a\ b\#c"),
+    ParseOptionsFixture("empty_quotes", "@quotes ''"),
+    ParseOptionsFixture("many_words", "session-closed[0] display-message 'gone'"),
+    ParseOptionsFixture("unclosed_quote", '@open "abc'),
+    ParseOptionsFixture("trailing_backslash", "@slash abc\\"),
+    ParseOptionsFixture("extra_blanks", "@blanks   spaced  "),
+    ParseOptionsFixture("inherited_array", "status-format[1]* right"),
+]
+
+
+@pytest.mark.parametrize(
+    list(ParseOptionsFixture._fields),
+    PARSE_OPTIONS_FIXTURES,
+    ids=[test.test_id for test in PARSE_OPTIONS_FIXTURES],
+)
+def test_parse_options_matches_shlex(test_id: str, line: str) -> None:
+    """The tokenizer reads each value as shlex did."""
+    assert parse_options_to_dict([line]) == shlex_parse_options([line])
+    assert parse_options([line]) == explode_arrays(shlex_parse_options([line]))
+
+
+def test_parse_options_live_dumps(server: Server) -> None:
+    """Option and hook dumps from tmux parse as they did with shlex."""
+    session = server.new_session()
+    session.set_option("@quoted", 'it\'s "quoted" \\ here')
+    session.set_hook("session-renamed[3]", "display-message 'renamed'")
+    assert session.id is not None
+
+    for args, force_array in [
+        (("show-options", "-gA"), False),
+        (("show-options", "-gwA"), False),
+        (("show-options", "-s"), False),
+        (("show-options", "-A", "-t", session.id), False),
+        (("show-hooks", "-g"), True),
+        (("show-hooks", "-t", session.id), True),
+    ]:
+        lines = server.cmd(*args).stdout
+        assert parse_options(lines, force_array=force_array) == explode_arrays(
+            shlex_parse_options(lines),
+            force_array=force_array,
+        )
+    assert session.show_option("@quoted") == 'it\'s "quoted" \\ here'
+
+
+def test_parse_options_benchmark(record_property: t.Callable[..., None]) -> None:
+    """Benchmark: the tokenizer against shlex on a large option dump.
+
+    Both must agree. Timings are recorded as test properties
+    (``--junitxml``) for comparison between runs, not asserted on, since
+    wall-clock time varies with the machine's load.
+    """
+    lines = [
+        line
+        for n in range(2000)
+        for line in (
+            f"@plain-{n} value-{n}",
+            f'command-alias[{n}] "alias-{n}=split-window -h"',
+            f"status-format[{n}]* #[align=left]#{{session_name}}",
+            f"@quoted-{n} 'it'\\''s {n}'",
+            f"@words-{n} display-message 'word {n}'",
+        )
+    ]
+
+    def tokenizer() -> object:
+        return parse_options(lines)
+
+    def reference() -> object:
+        return explode_arrays(shlex_parse_options(lines))
+
+    assert tokenizer() == reference()
+    fast = min(timeit.repeat(tokenizer, number=1, repeat=3))
+    slow = min(timeit.repeat(reference, number=1, repeat=3))
+    record_property("parse_options_seconds", fast)
+    record_property("shlex_seconds", slow)
+
+
+def test_effective_options_one_invocation(
+    server: Server,
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Every scope is read with one tmux process, into a snapshot."""
+    pane = session.active_window.active_pane
+    assert pane is not None
+    calls: list[tuple[t.Any, ...]] = []
+    original_cmd = server.cmd
+
+    def recording_cmd(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        calls.append(args)
+        return original_cmd(*args, **kwargs)
+
+    monkeypatch.setattr(server, "cmd", recording_cmd)
+    options = pane.effective_options()
+
+    assert len(calls) == 1
+    assert options["buffer-limit"] == server.show_option("buffer-limit")
+    assert options.source("buffer-limit") == OptionSource(OptionScope.Server, False)
+    assert options.typed is options.typed
+    session.set_option("@later", "yes")
+    assert "@later" not in options
+
+
+def test_effective_options_resolution(session: Session) -> None:
+    """The nearest scope setting an option wins, arrays included."""
+    window = session.active_window
+    pane = window.active_pane
+    assert pane is not None
+    session.set_option("@layer", "session")
+    session.set_option("@session-only", "here")
+    window.set_option("@layer", "window")
+    pane.set_option("@layer", "pane")
+    window.set_option("pane-border-style", "fg=red")
+    session.set_option("status-format[1]", "mine")
+
+    options = pane.effective_options()
+
+    assert options["@layer"] == "pane"
+    assert options.source("@layer") == OptionSource(OptionScope.Pane, False)
+    assert options.source("@session-only") == OptionSource(
+        OptionScope.Session,
+        False,
+    )
+    assert options["pane-border-style"] == "fg=red"
+    assert options.source("pane-border-style") == OptionSource(
+        OptionScope.Window,
+        False,
+    )
+    assert options.source("mode-keys") == OptionSource(OptionScope.Window, True)
+    assert options["status-format"] == {1: "mine"}
+    assert options.typed.pane_border_style == "fg=red"
+    with pytest.raises(KeyError):
+        options.source("@unset")
+
+
+def test_option_cache(
+    server: Server,
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Cached reads spawn no tmux process until something writes."""
+    pane = session.active_window.active_pane
+    assert pane is not None
+    session.set_option("@theme", "dark")
+    session.set_hook("session-renamed[0]", "display-message renamed")
+    session.cache_options()
+    assert session.show_option("@theme") == "dark"
+    assert session.show_hook("session-renamed") == {0: "display-message renamed"}
+
+    calls: list[tuple[t.Any, ...]] = []
+    original_cmd = server.cmd
+
+    def recording_cmd(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        calls.append(args)
+        return original_cmd(*args, **kwargs)
+
+    monkeypatch.setattr(server, "cmd", recording_cmd)
+    for _ in range(3):
+        assert session.show_option("@theme") == "dark"
+        assert session.show_hook("session-renamed") == {
+            0: "display-message renamed",
+        }
+    assert calls == []
+    monkeypatch.undo()
+
+    # A write through another object of the server invalidates.
+    pane.set_option("@theme", "pane", scope=OptionScope.Session)
+    assert session.show_option("@theme") == "pane"
+
+    # Changes made outside libtmux wait for a notification.
+    server.cmd("set-option", "-t", str(session.id), "@theme", "outside")
+    assert session.show_option("@theme") == "pane"
+    assert not session.invalidate_option_cache("%output %1 text")
+    assert session.show_option("@theme") == "pane"
+    assert session.invalidate_option_cache(
+        "%subscription-changed theme $1 - - - : outside",
+    )
+    assert session.show_option("@theme") == "outside"
+
+    session.cache_options(False)
+    server.cmd("set-option", "-t", str(session.id), "@theme", "plain")
+    assert session.show_option("@theme") == "plain"
+
+
+def test_option_cache_source_file(
+    server: Server,
+    session: Session,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Sourcing a config file through libtmux invalidates cached reads."""
+    session.set_option("@theme", "dark")
+    session.set_hook("session-renamed[0]", "display-message old")
+    session.cache_options()
+    assert session.show_option("@theme") == "dark"
+    assert session.show_hook("session-renamed") == {0: "display-message old"}
+
+    config = tmp_path / "reload.conf"
+    config.write_text(
+        f"set-option -t {session.id} @theme light\n"
+        f"set-hook -t {session.id} session-renamed[0] 'display-message new'\n",
+    )
+    server.source_file(config)
+
+    assert session.show_option("@theme") == "light"
+    assert session.show_hook("session-renamed") == {0: "display-message new"}
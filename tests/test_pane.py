@@ -1878,3 +1878,53 @@ def test_new_pane_error_tags_subcommand(session: Session) -> None:
     else:
         with pytest.raises(exc.LibTmuxException, match=r"requires tmux 3.7"):
             pane.new_pane(target="%99999")
+
+
+def test_paste_text_large_payload(
+    session: Session,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Pane.paste_text() delivers text far beyond one argv element's limit."""
+    out = tmp_path / "pasted.txt"
+    pane = session.active_window.split(shell=f"cat > {out}")
+    data = "".join(f"line {n}\n" for n in range(30_000))
+    assert len(data) > 128 * 1024
+
+    pane.paste_text(data, linefeed_separator=True)
+
+    retry_until(lambda: out.exists() and out.stat().st_size == len(data), 10)
+    assert out.read_text() == data
+    names = session.server.list_buffers(format_string="#{buffer_name}")
+    assert not [name for name in names if name.startswith("libtmux_paste_")]
+
+
+def test_paste_text_empty(
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Pane.paste_text("") pastes nothing without calling tmux."""
+    pane = session.active_window.split()
+    calls: list[tuple[t.Any, ...]] = []
+    original_cmd = session.server.cmd
+
+    def recording_cmd(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        calls.append(args)
+        return original_cmd(*args, **kwargs)
+
+    monkeypatch.setattr(session.server, "cmd", recording_cmd)
+    pane.paste_text("")
+
+    assert calls == []
+
+
+def test_paste_text_error_removes_buffer(session: Session) -> None:
+    """A failed paste raises and leaves no temporary buffer behind."""
+    pane = session.active_window.split()
+    pane.kill()
+
+    with pytest.raises(exc.LibTmuxException) as excinfo:
+        pane.paste_text("lost")
+
+    assert excinfo.value.subcommand == "paste-buffer"
+    names = session.server.list_buffers(format_string="#{buffer_name}")
+    assert not [name for name in names if name.startswith("libtmux_paste_")]
@@ -450,12 +450,10 @@ def test_capture_pane_trim_trailing_warning(
     """Test that trim_trailing issues a warning on tmux < 3.4."""
     import warnings
 
-    from libtmux import pane as pane_module
+    from libtmux.common import TmuxCapabilities
 
-    # has_gte_version is imported into libtmux.pane at module import time;
-    # monkeypatching the libtmux.common attribute would not propagate, so
-    # patch the pane module's binding directly.
-    monkeypatch.setattr(pane_module, "has_gte_version", lambda v, **kw: v != "3.4")
+    # Gates read the server's probed version; pin it below 3.4.
+    monkeypatch.setattr(session.server, "_capabilities", TmuxCapabilities("3.3a"))
 
     pane = session.active_window.split(shell="sh")
 
@@ -0,0 +1,110 @@
+"""Tests for Pane.capture_since() incremental capture."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from libtmux._internal.pane_capture import CaptureCursor, PaneCapture
+from libtmux.test.retry import retry_until
+
+if t.TYPE_CHECKING:
+    from libtmux.pane import Pane
+    from libtmux.session import Session
+
+
+def run(pane: Pane, command: str, last_line: str) -> None:
+    """Run *command* in *pane* and wait until it printed *last_line*."""
+    pane.send_keys(command, enter=True)
+    retry_until(lambda: last_line in pane.capture_pane(start="-"))
+
+
+def numbers(capture: PaneCapture) -> list[int]:
+    """Return the lines of *capture* that are plain numbers, as ints."""
+    return [int(line) for line in capture.lines if line.isdigit()]
+
+
+def test_returns_only_new_lines(session: Session) -> None:
+    """Each call returns what was printed since the previous one, once."""
+    pane = session.active_window.split(shell="sh")
+    first = pane.capture_since()
+
+    run(pane, "seq 1 5", "5")
+    second = pane.capture_since(first.cursor)
+    assert numbers(second) == [1, 2, 3, 4, 5]
+    assert not second.skipped
+
+    run(pane, "seq 6 8", "8")
+    third = pane.capture_since(second.cursor)
+    assert numbers(third) == [6, 7, 8]
+    assert "seq 1 5" not in "".join(third.lines)
+
+    assert pane.capture_since(third.cursor).lines == []
+
+
+def test_blank_lines_kept(session: Session) -> None:
+    """Empty output lines are returned, not dropped."""
+    pane = session.active_window.split(shell="sh")
+    first = pane.capture_since()
+
+    run(pane, "printf 'x\\n\\n\\ny\\n'", "y")
+    capture = pane.capture_since(first.cursor)
+
+    assert capture.lines[-4:] == ["x", "", "", "y"]
+
+
+def test_follows_output_past_the_screen(session: Session) -> None:
+    """Lines that scrolled into history are returned in order."""
+    pane = session.active_window.split(shell="sh")
+    first = pane.capture_since()
+
+    run(pane, "seq 1 300", "300")
+    capture = pane.capture_since(first.cursor)
+
+    assert numbers(capture) == list(range(1, 301))
+
+
+def test_history_limit_eviction(session: Session) -> None:
+    """Old lines dropped at ``history-limit`` don't duplicate or lose new ones."""
+    session.server.cmd("set-option", "-g", "history-limit", "100")
+    pane = session.active_window.split(shell="sh")
+    run(pane, "seq 1 3", "3")
+    first = pane.capture_since()
+
+    run(pane, "seq 4 400", "400")
+    flooded = pane.capture_since(first.cursor)
+    assert flooded.skipped
+    assert numbers(flooded)[-1] == 400
+
+    for batch_start in (401, 431, 461):
+        batch_end = batch_start + 29
+        run(pane, f"seq {batch_start} {batch_end}", str(batch_end))
+        capture = pane.capture_since(flooded.cursor)
+        assert not capture.skipped
+        assert numbers(capture) == list(range(batch_start, batch_end + 1))
+        flooded = capture
+
+
+def test_clear_history(session: Session) -> None:
+    """Output after ``clear-history`` is returned without earlier lines."""
+    pane = session.active_window.split(shell="sh")
+    run(pane, "seq 1 300", "300")
+    before = pane.capture_since()
+
+    pane.clear_history()
+    run(pane, "seq 301 303", "303")
+    capture = pane.capture_since(before.cursor)
+
+    assert numbers(capture)[-3:] == [301, 302, 303]
+    assert not set(numbers(capture)) & set(range(1, 300))
+
+
+def test_cursor_from_another_pane(session: Session) -> None:
+    """A cursor only applies to the pane it came from."""
+    window = session.active_window
+    cursor = window.split().capture_since().cursor
+    assert isinstance(cursor, CaptureCursor)
+
+    with pytest.raises(ValueError, match="belongs to pane"):
+        window.split().capture_since(cursor)
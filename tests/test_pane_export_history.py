@@ -0,0 +1,129 @@
+"""Tests for Pane.export_history() and the mmap-backed PaneHistory."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from libtmux import exc
+from libtmux._internal.pane_history import PaneHistory
+from libtmux.test.retry import retry_until
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    from libtmux.session import Session
+
+
+def history_buffers(session: Session) -> list[str]:
+    """Return the names of buffers export_history may have left behind."""
+    names = session.server.list_buffers(format_string="#{buffer_name}")
+    return [name for name in names if name.startswith("libtmux_history_")]
+
+
+def test_export_matches_capture(session: Session, tmp_path: pathlib.Path) -> None:
+    """The exported file holds what capture_pane returns, and no buffer stays."""
+    pane = session.active_window.split()
+    pane.send_keys("seq 1 500", enter=True)
+    retry_until(lambda: "500" in pane.capture_pane())
+
+    captured = pane.capture_pane(start="-", end="-")
+    with pane.export_history(tmp_path / "history.txt") as history:
+        assert history[: len(captured)] == captured
+        assert [line for _, line in history.search("^(1|250|500)$")] == [
+            "1",
+            "250",
+            "500",
+        ]
+
+    assert history.closed
+    assert (tmp_path / "history.txt").exists()
+    assert history_buffers(session) == []
+
+
+def test_export_failure_cleans_buffer(
+    session: Session,
+    tmp_path: pathlib.Path,
+) -> None:
+    """A file tmux cannot write raises, and the capture buffer is removed."""
+    pane = session.active_pane
+    assert pane is not None
+
+    with pytest.raises(exc.LibTmuxException):
+        pane.export_history(tmp_path / "missing" / "history.txt")
+
+    assert history_buffers(session) == []
+
+
+class HistoryFileFixture(t.NamedTuple):
+    """File content and the lines PaneHistory reads from it."""
+
+    test_id: str
+    content: bytes
+    expected: list[str]
+
+
+HISTORY_FILE_FIXTURES: list[HistoryFileFixture] = [
+    HistoryFileFixture(
+        test_id="empty",
+        content=b"",
+        expected=[],
+    ),
+    HistoryFileFixture(
+        test_id="trailing_newline",
+        content=b"a\nb\n",
+        expected=["a", "b"],
+    ),
+    HistoryFileFixture(
+        test_id="no_trailing_newline",
+        content=b"a\nb",
+        expected=["a", "b"],
+    ),
+    HistoryFileFixture(
+        test_id="blank_lines",
+        content=b"\n\nc\n\n",
+        expected=["", "", "c", ""],
+    ),
+    HistoryFileFixture(
+        test_id="utf8",
+        content="café\n".encode(),
+        expected=["café"],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(HistoryFileFixture._fields),
+    HISTORY_FILE_FIXTURES,
+    ids=[test.test_id for test in HISTORY_FILE_FIXTURES],
+)
+def test_history_lines(
+    test_id: str,
+    content: bytes,
+    expected: list[str],
+    tmp_path: pathlib.Path,
+) -> None:
+    """Lines are split on newlines, with the final newline optional."""
+    path = tmp_path / "history.txt"
+    path.write_bytes(content)
+    with PaneHistory(path) as history:
+        assert len(history) == len(expected)
+        assert list(history) == expected
+        assert history[:] == expected
+        if expected:
+            assert history[-1] == expected[-1]
+
+
+def test_history_search(tmp_path: pathlib.Path) -> None:
+    """Each matching line is reported once, by the line the match starts on."""
+    path = tmp_path / "history.txt"
+    path.write_text("ok\nerror error\nok\nfatal: error\n")
+    with PaneHistory(path) as history:
+        assert list(history.search("error")) == [
+            (1, "error error"),
+            (3, "fatal: error"),
+        ]
+        assert list(history.search(b"^ok$")) == [(0, "ok"), (2, "ok")]
+        with pytest.raises(IndexError):
+            history[4]
@@ -0,0 +1,76 @@
+"""Tests for Pane.record() and asciicast v2 PaneRecording."""
+
+from __future__ import annotations
+
+import json
+import threading
+import typing as t
+
+from libtmux.test.retry import retry_until
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    from libtmux.session import Session
+
+
+def read_cast(path: pathlib.Path) -> tuple[dict[str, t.Any], list[list[t.Any]]]:
+    """Return the header and events of an asciicast v2 file."""
+    header, *events = path.read_text().splitlines()
+    return json.loads(header), [json.loads(event) for event in events]
+
+
+def test_record_many_panes(session: Session, tmp_path: pathlib.Path) -> None:
+    """Concurrent recordings share one thread and write valid asciicast v2."""
+    window = session.active_window
+    panes = [window.split(shell="sh") for _ in range(3)]
+    window.select_layout("tiled")
+    recordings = [
+        pane.record(tmp_path / f"{number}.cast") for number, pane in enumerate(panes)
+    ]
+    for number, pane in enumerate(panes):
+        pane.send_keys(f"echo out$((40 + {number}))", enter=True)
+    retry_until(
+        lambda: all(
+            f"out{40 + n}" in pane.capture_pane() for n, pane in enumerate(panes)
+        ),
+    )
+
+    recorder_threads = [
+        thread for thread in threading.enumerate() if thread.name == "libtmux-recorder"
+    ]
+    for recording in recordings:
+        recording.stop()
+
+    assert len(recorder_threads) == 1
+    for number, pane in enumerate(panes):
+        header, events = read_cast(tmp_path / f"{number}.cast")
+        pane.refresh()
+        assert header["version"] == 2
+        assert (header["width"], header["height"]) == (
+            int(pane.pane_width or 0),
+            int(pane.pane_height or 0),
+        )
+        times = [event[0] for event in events]
+        assert times == sorted(times)
+        assert {event[1] for event in events} == {"o"}
+        assert f"out{40 + number}\r\n" in "".join(event[2] for event in events)
+        assert pane.display_message("#{pane_pipe}", get_text=True) == ["0"]
+
+
+def test_record_stops_when_pane_closes(
+    session: Session,
+    tmp_path: pathlib.Path,
+) -> None:
+    """A recording ends by itself with its pane; stop() is then a no-op."""
+    pane = session.active_window.split(shell="sh")
+    recording = pane.record(tmp_path / "closed.cast")
+    pane.send_keys("echo last words", enter=True)
+    retry_until(lambda: "last words" in pane.capture_pane())
+
+    pane.kill()
+    retry_until(lambda: not recording.recording)
+    recording.stop()
+
+    _, events = read_cast(tmp_path / "closed.cast")
+    assert "last words\r\n" in "".join(event[2] for event in events)
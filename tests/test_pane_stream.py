@@ -0,0 +1,316 @@
+"""Tests for Pane.stream() and the pipe-pane backed PaneStream."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import typing as t
+
+import pytest
+
+from libtmux import exc
+from libtmux._internal.pane_stream import PaneStream
+from libtmux.test.retry import retry_until
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    from libtmux.session import Session
+
+
+def feed(stream: PaneStream, chunks: list[bytes]) -> list[str]:
+    """Push *chunks* through a plain pipe into *stream*; return what it yields."""
+    read_fd, write_fd = os.pipe()
+    stream._read_fd = read_fd
+    try:
+        items: list[str] = []
+        for chunk in chunks:
+            os.write(write_fd, chunk)
+            item = stream.read(timeout=1)
+            while item is not None:
+                items.append(item)
+                item = stream.read(timeout=0)
+        os.close(write_fd)
+        items.extend(iter(stream))
+        return items
+    finally:
+        os.close(read_fd)
+
+
+class LineSplitFixture(t.NamedTuple):
+    """Bytes as the FIFO delivers them, and the lines a stream yields."""
+
+    test_id: str
+    chunks: list[bytes]
+    expected: list[str]
+
+
+LINE_SPLIT_FIXTURES: list[LineSplitFixture] = [
+    LineSplitFixture(
+        test_id="crlf",
+        chunks=[b"one\r\ntwo\r\n"],
+        expected=["one", "two"],
+    ),
+    LineSplitFixture(
+        test_id="crlf_split_across_reads",
+        chunks=[b"one\r", b"\ntwo\r\n"],
+        expected=["one", "two"],
+    ),
+    LineSplitFixture(
+        test_id="bare_cr_redraws_line",
+        chunks=[b"\x1b[?2004l\rstreamed\r\n"],
+        expected=["\x1b[?2004l", "streamed"],
+    ),
+    LineSplitFixture(
+        test_id="empty_line_kept",
+        chunks=[b"a\n\nb\n"],
+        expected=["a", "", "b"],
+    ),
+    LineSplitFixture(
+        test_id="unterminated_tail_at_end",
+        chunks=[b"done\r\npartial"],
+        expected=["done", "partial"],
+    ),
+    LineSplitFixture(
+        test_id="multibyte_split_across_reads",
+        chunks=["café\n".encode()[:4], "café\n".encode()[4:]],
+        expected=["café"],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(LineSplitFixture._fields),
+    LINE_SPLIT_FIXTURES,
+    ids=[test.test_id for test in LINE_SPLIT_FIXTURES],
+)
+def test_line_splitting(
+    test_id: str,
+    chunks: list[bytes],
+    expected: list[str],
+    session: Session,
+) -> None:
+    """Line mode breaks on CRLF, LF and a lone CR, across read boundaries."""
+    stream = PaneStream(session.active_pane, lines=True)  # type: ignore[arg-type]
+    assert feed(stream, chunks) == expected
+
+
+@contextlib.contextmanager
+def piped(stream: PaneStream) -> t.Iterator[int]:
+    """Feed *stream* from a plain pipe; yield the pipe's write end."""
+    read_fd, write_fd = os.pipe()
+    stream._read_fd = read_fd
+    try:
+        yield write_fd
+    finally:
+        with contextlib.suppress(OSError):
+            os.close(write_fd)
+        os.close(read_fd)
+
+
+def test_expect_spans_reads(session: Session) -> None:
+    """A match may straddle chunks; what follows it stays readable."""
+    stream = PaneStream(session.active_pane)  # type: ignore[arg-type]
+    with piped(stream) as write_fd:
+        os.write(write_fd, b"build: ok")
+        assert stream.read(timeout=1) == "build: ok"
+        os.write(write_fd, b"tests: pa")
+        os.write(write_fd, b"ssed\r\n$ ")
+
+        match = stream.expect(r"tests: (\w+)", timeout=1)
+
+        assert match.group(1) == "passed"
+        assert match.string[: match.start()] == ""
+        assert stream.read(timeout=1) == "\r\n$ "
+
+
+def test_expect_lines_consumes_matching_line(session: Session) -> None:
+    """In line mode the matching line is consumed, later lines are not."""
+    stream = PaneStream(session.active_pane, lines=True)  # type: ignore[arg-type]
+    with piped(stream) as write_fd:
+        os.write(write_fd, b"one\ntwo\nthree\n")
+
+        match = stream.expect("(?m)^two$", timeout=1)
+
+        assert match.string == "one\ntwo\n"
+        assert stream.read(timeout=1) == "three"
+
+
+def test_expect_timeout(session: Session) -> None:
+    """No match within the timeout raises WaitTimeout."""
+    stream = PaneStream(session.active_pane)  # type: ignore[arg-type]
+    with piped(stream) as write_fd:
+        os.write(write_fd, b"nothing to see")
+        with pytest.raises(exc.WaitTimeout, match=r"in 0\.1s"):
+            stream.expect("needle", timeout=0.1)
+
+
+def test_expect_after_output_ended(session: Session) -> None:
+    """Output ending before a match raises instead of waiting forever."""
+    stream = PaneStream(session.active_pane)  # type: ignore[arg-type]
+    with piped(stream) as write_fd:
+        os.write(write_fd, b"bye")
+        os.close(write_fd)
+        with pytest.raises(exc.WaitTimeout, match="ended"):
+            stream.expect("needle")
+
+
+def test_pane_expect_waits_for_output(session: Session) -> None:
+    """Pane.expect wakes on output printed after the call began."""
+    pane = session.active_window.split()
+    pane.send_keys("sleep 0.3; echo $((100 + 23))", enter=True)
+
+    match = pane.expect(r"12(\d)", timeout=5, on_screen=False)
+
+    assert match.group(1) == "3"
+    pane.refresh()
+    assert pane.pane_pipe == "0"
+
+
+def test_pane_expect_matches_screen(session: Session) -> None:
+    """With on_screen, text already displayed matches without waiting."""
+    pane = session.active_window.split()
+    pane.send_keys("echo $((300 + 21))", enter=True)
+    pane.expect("321", timeout=5, on_screen=True)
+
+    assert pane.expect("321", timeout=0, on_screen=True).group() == "321"
+    with pytest.raises(exc.WaitTimeout):
+        pane.expect("321", timeout=0.2)
+
+
+def test_pane_expect_keeps_existing_pipe(
+    session: Session,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Pane.expect refuses to take over a recording's pipe."""
+    pane = session.active_window.split(shell="sh")
+
+    with pane.record(tmp_path / "kept.cast") as recording:
+        with pytest.raises(exc.PaneError):
+            pane.expect("anything", timeout=0.2)
+        assert recording.recording
+        pane.send_keys("echo $((400 + 56))", enter=True)
+        retry_until(lambda: "456" in pane.capture_pane())
+
+    assert "456" in (tmp_path / "kept.cast").read_text()
+
+
+def test_pane_expect_timeout(session: Session) -> None:
+    """Pane.expect raises WaitTimeout when nothing matches."""
+    pane = session.active_window.split()
+
+    with pytest.raises(exc.WaitTimeout):
+        pane.expect("never printed", timeout=0.2)
+
+
+def wait_for_line(stream: PaneStream, suffix: str) -> str | None:
+    """Return the first line ending in *suffix*, or None after 5s of silence."""
+    line = stream.read(timeout=5)
+    while line is not None and not line.endswith(suffix):
+        line = stream.read(timeout=5)
+    return line
+
+
+def test_stream_follows_output(session: Session) -> None:
+    """Output printed after the stream opens arrives, in order."""
+    pane = session.active_window.split()
+    with pane.stream(lines=True) as stream:
+        pane.send_keys("seq 100 103", enter=True)
+        assert wait_for_line(stream, "100") == "100"
+        assert [stream.read(timeout=5) for _ in range(3)] == ["101", "102", "103"]
+        path = stream.path
+        assert path is not None
+        assert path.exists()
+
+    assert stream.closed
+    assert not path.parent.exists()
+    pane.refresh()
+    assert pane.pane_pipe == "0"
+
+
+def test_stream_ends_when_pane_exits(session: Session) -> None:
+    """The pane going away ends iteration, and closing afterwards is quiet."""
+    pane = session.active_window.split()
+    stream = pane.stream()
+    try:
+        pane.send_keys("exit", enter=True)
+        while stream.read(timeout=5) is not None:
+            pass
+        assert stream.ended
+    finally:
+        stream.close()
+    stream.close()
+    assert stream.closed
+
+
+def test_close_after_server_exit(session: Session) -> None:
+    """Closing a stream whose server is gone removes the FIFO, no error."""
+    pane = session.active_pane
+    assert pane is not None
+    stream = pane.stream()
+    path = stream.path
+    assert path is not None
+    session.server.kill()
+
+    stream.close()
+
+    assert not path.parent.exists()
+
+
+def test_close_reraises_other_errors(
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A pipe-pane failure on a live pane still surfaces."""
+    pane = session.active_window.split()
+    stream = pane.stream()
+    path = stream.path
+    assert path is not None
+
+    def refuse(*args: t.Any, **kwargs: t.Any) -> None:
+        msg = "pipe-pane: permission denied"
+        raise exc.LibTmuxException(msg)
+
+    monkeypatch.setattr(pane, "pipe", refuse)
+    with pytest.raises(exc.LibTmuxException, match="permission denied"):
+        stream.close()
+    assert not path.parent.exists()
+
+
+def test_async_iteration(session: Session) -> None:
+    """``async for`` yields lines without blocking the event loop."""
+    pane = session.active_window.split()
+
+    async def collect() -> list[str]:
+        lines: list[str] = []
+        async with pane.stream(lines=True) as stream:
+            pane.send_keys("seq 200 202", enter=True)
+            async for line in stream:
+                if line in {"200", "201", "202"}:
+                    lines.append(line)
+                if len(lines) == 3:
+                    break
+        return lines
+
+    assert asyncio.run(asyncio.wait_for(collect(), timeout=10)) == [
+        "200",
+        "201",
+        "202",
+    ]
+
+
+def test_end_pipe_keeps_output_in_flight(session: Session) -> None:
+    """After end_pipe(), output already piped is still read, then the end."""
+    pane = session.active_window.split(shell="sh")
+    stream = pane.stream(lines=True)
+    try:
+        pane.send_keys("echo in-flight", enter=True)
+        retry_until(lambda: "in-flight" in pane.capture_pane()[1:])
+        stream.end_pipe()
+        lines = list(stream)
+    finally:
+        stream.close()
+
+    assert "in-flight" in lines
+    assert stream.ended
@@ -562,3 +562,66 @@ def test_linked_sessions_uses_two_list_calls(
 
     assert [item.session_id for item in window.linked_sessions] == expected_session_ids
     assert list_calls == ["list-windows", "list-sessions"]
+
+
+class PointLookupFixture(t.NamedTuple):
+    """A point lookup, and the listing it runs under the hood."""
+
+    test_id: str
+    kind: str
+    list_cmd: str
+
+
+POINT_LOOKUP_FIXTURES: list[PointLookupFixture] = [
+    PointLookupFixture(test_id="pane", kind="pane", list_cmd="list-panes"),
+    PointLookupFixture(test_id="window", kind="window", list_cmd="list-windows"),
+    PointLookupFixture(test_id="session", kind="session", list_cmd="list-sessions"),
+]
+
+
+@pytest.mark.parametrize(
+    list(PointLookupFixture._fields),
+    POINT_LOOKUP_FIXTURES,
+    ids=[test.test_id for test in POINT_LOOKUP_FIXTURES],
+)
+def test_point_lookup_lists_only_the_target_row(
+    server: Server,
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+    test_id: str,
+    kind: str,
+    list_cmd: str,
+) -> None:
+    """A point lookup parses one row, however many siblings exist.
+
+    ``fetch_objs`` is wrapped only to count the rows tmux sent back; the real
+    function and tmux server still answer the lookup.
+    """
+    window = session.new_window(window_name="crowded")
+    window.split()
+    window.split()
+    session.new_window(window_name="sibling")
+    server.new_session(session_name="neighbour")
+
+    pane = window.active_pane
+    assert pane is not None
+
+    real_fetch_objs = neo.fetch_objs
+    rows_seen: list[int] = []
+
+    def counting_fetch_objs(**kwargs: t.Any) -> list[dict[str, str]]:
+        rows = real_fetch_objs(**kwargs)
+        if kwargs["list_cmd"] == list_cmd:
+            rows_seen.append(len(rows))
+        return rows
+
+    monkeypatch.setattr(neo, "fetch_objs", counting_fetch_objs)
+
+    if kind == "pane":
+        pane.refresh()
+    elif kind == "window":
+        window.refresh()
+    else:
+        session.refresh()
+
+    assert rows_seen == [1]
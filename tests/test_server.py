@@ -13,12 +13,16 @@ import typing as t
 
 import pytest
 
+import libtmux.server
 from libtmux import exc
 from libtmux._internal.control_mode import ControlMode
+from libtmux.common import TmuxCapabilities, tmux_cmd
 from libtmux.server import Server
+from libtmux.test.retry import retry_until
 
 if t.TYPE_CHECKING:
     from libtmux._internal.types import StrPath
+    from libtmux.pane import Pane
     from libtmux.session import Session
 
 logger = logging.getLogger(__name__)
@@ -114,6 +118,89 @@ def test_show_environment_not_set(server: Server) -> None:
     assert server.getenv("BAR") is None
 
 
+def test_getenv_removed(session: Session) -> None:
+    """getenv() distinguishes empty and removed variables."""
+    session.set_environment("EMPTY", "")
+    session.remove_environment("GONE")
+
+    assert session.getenv("EMPTY") == ""
+    assert session.getenv("GONE") is None
+    assert session.show_environment()["-GONE"] is True
+
+
+def test_environments(
+    server: Server,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Every session's environment and the global one come from one chain."""
+    sessions = [server.new_session() for _ in range(3)]
+    for number, session in enumerate(sessions):
+        session.set_environment("AUDIT", str(number))
+    server.set_environment("AUDIT_GLOBAL", "yes")
+    calls: list[tuple[t.Any, ...]] = []
+    original_cmd = server.cmd
+
+    def recording_cmd(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        calls.append(args)
+        return original_cmd(*args, **kwargs)
+
+    monkeypatch.setattr(server, "cmd", recording_cmd)
+    environments = server.environments(sessions)
+    monkeypatch.undo()
+
+    assert len(calls) == 1
+    assert environments.global_["AUDIT_GLOBAL"] == "yes"
+    assert [env["AUDIT"] for env in environments.sessions.values()] == [
+        "0",
+        "1",
+        "2",
+    ]
+    assert environments.sessions == {
+        session.session_id: session.show_environment() for session in sessions
+    }
+    assert set(server.environments().sessions) == {
+        session.session_id for session in sessions
+    }
+
+    with pytest.raises(exc.BatchError) as excinfo:
+        server.environments([sessions[0], "$999999"])
+    assert list(excinfo.value.errors) == ["$999999"]
+
+
+def test_set_environment_many(server: Server) -> None:
+    """Variables are set and unset across sessions, chunked as needed."""
+    sessions = [server.new_session() for _ in range(3)]
+    sessions[0].set_environment("OLD", "x")
+    rotated = {f"ROTATED_{number}": "v" * 500 for number in range(40)}
+
+    server.set_environment_many(rotated, unset=["OLD"], sessions=sessions)
+
+    for session in sessions:
+        environment = session.show_environment()
+        assert {name: environment[name] for name in rotated} == rotated
+        assert "OLD" not in environment
+
+    sessions[1].set_environment_many({"OWN": "1"})
+    server.set_environment_many({"GLOBAL": "1"})
+    assert sessions[1].getenv("OWN") == "1"
+    assert sessions[2].getenv("OWN") is None
+    assert server.getenv("GLOBAL") == "1"
+
+
+def test_set_environment_many_errors(server: Server) -> None:
+    """Failures are reported per variable; the rest are applied."""
+    session = server.new_session()
+
+    with pytest.raises(exc.BatchError) as excinfo:
+        server.set_environment_many(
+            {"A": "1", "B": "2"},
+            sessions=[session, "$999999"],
+        )
+
+    assert list(excinfo.value.errors) == ["$999999:A", "$999999:B"]
+    assert session.getenv("B") == "2"
+
+
 def test_new_session(server: Server) -> None:
     """Server.new_session creates and returns valid session."""
     mysession = server.new_session("test_new_session")
@@ -498,6 +585,82 @@ def test_tmux_bin_custom_path(caplog: pytest.LogCaptureFixture) -> None:
             s.kill()
 
 
+def test_capabilities_probed_once(
+    server: Server,
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Feature gates share one ``#{version}`` probe per server."""
+    subcommands: list[str] = []
+    original_cmd = server.cmd
+
+    def recording_cmd(cmd: str, *args: t.Any, **kwargs: t.Any) -> tmux_cmd:
+        subcommands.append(cmd)
+        return original_cmd(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(server, "_capabilities", None)
+    monkeypatch.setattr(server, "cmd", recording_cmd)
+
+    pane = session.active_window.split()
+    pane.send_keys("echo probe", enter=True)
+    pane.split()
+    server.run_shell("true")
+
+    assert subcommands.count("display-message") == 1
+    assert server.capabilities.source == "server"
+
+
+def test_capabilities_follow_server_not_client(
+    server: Server,
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Gates use the server's version when the client binary is newer."""
+    import libtmux.server
+
+    original_cmd = server.cmd
+
+    def old_server_cmd(cmd: str, *args: t.Any, **kwargs: t.Any) -> tmux_cmd:
+        proc = original_cmd(cmd, *args, **kwargs)
+        if cmd == "display-message" and args == ("-p", "#{version}"):
+            proc.stdout = ["3.3a"]
+        return proc
+
+    monkeypatch.setattr(
+        libtmux.server,
+        "get_version_str",
+        lambda *a, **kw: "3.7",
+    )
+    monkeypatch.setattr(server, "_capabilities", None)
+    monkeypatch.setattr(server, "cmd", old_server_cmd)
+
+    assert server.capabilities.version_str == "3.3a"
+    with pytest.warns(UserWarning, match="cwd requires tmux 3.4+"):
+        server.run_shell("true", cwd=tmp_path)
+
+
+def test_capabilities_without_server() -> None:
+    """With no server to probe, the client binary stands in until one starts."""
+    s = Server(socket_name="test_capabilities_no_server")
+    assert not s.is_alive()
+
+    fallback = s.capabilities
+    assert fallback.source == "client"
+    assert s.capabilities is fallback
+
+    try:
+        s.new_session()
+        probed = s.capabilities
+        assert probed.source == "server"
+        assert s.capabilities is probed
+        s.kill()
+        assert s.capabilities is not probed
+    finally:
+        if s.is_alive():
+            s.kill()
+
+
 def test_tmux_bin_invalid_path() -> None:
     """Invalid tmux_bin raises TmuxCommandNotFound."""
     from libtmux import exc
@@ -1178,13 +1341,9 @@ def test_run_shell_cwd_warns_on_old_tmux(
 ) -> None:
     """``cwd=`` emits a warning and skips ``-c`` on tmux <3.4.
 
-    Simulates older tmux by patching ``has_gte_version`` in the
-    :mod:`libtmux.server` module namespace (where it's bound at
-    import time).
+    Simulates an older server by pinning :attr:`Server.capabilities`.
     """
-    import libtmux.server
-
-    monkeypatch.setattr(libtmux.server, "has_gte_version", lambda *a, **kw: False)
+    monkeypatch.setattr(server, "_capabilities", TmuxCapabilities("3.3a"))
     server.new_session(session_name="run_shell_cwd_warn_test")
     with pytest.warns(UserWarning, match="cwd requires tmux 3.4+"):
         server.run_shell("true", cwd=tmp_path)
@@ -1196,12 +1355,9 @@ def test_run_shell_show_stderr_warns_on_old_tmux(
 ) -> None:
     """``show_stderr=True`` emits a warning and skips ``-E`` on tmux <3.6.
 
-    Simulates older tmux by patching ``has_gte_version`` in the
-    :mod:`libtmux.server` module namespace.
+    Simulates an older server by pinning :attr:`Server.capabilities`.
     """
-    import libtmux.server
-
-    monkeypatch.setattr(libtmux.server, "has_gte_version", lambda *a, **kw: False)
+    monkeypatch.setattr(server, "_capabilities", TmuxCapabilities("3.3a"))
     server.new_session(session_name="run_shell_stderr_warn_test")
     with pytest.warns(UserWarning, match="show_stderr requires tmux 3.6+"):
         server.run_shell("true", show_stderr=True)
@@ -1765,3 +1921,327 @@ def test_server_display_message_warns_on_tmux_error(
     """
     with pytest.warns(UserWarning, match="only one of -F or argument"):
         server.display_message("x", get_text=True, format_string="#{version}")
+
+
+def test_send_keys_many_one_invocation(
+    server: Server,
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Keys for every pane, Enter included, go out in one tmux call."""
+    window = session.active_window
+    panes = [window.split(shell="sh") for _ in range(4)]
+    window.select_layout("tiled")
+    subcommands: list[str] = []
+    original_cmd = server.cmd
+
+    def recording_cmd(cmd: str, *args: t.Any, **kwargs: t.Any) -> tmux_cmd:
+        subcommands.append(cmd)
+        return original_cmd(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(server, "cmd", recording_cmd)
+    server.send_keys_many(panes, "echo $((6 * 7))")
+
+    assert len(subcommands) == 1
+    monkeypatch.undo()
+    retry_until(lambda: all("42" in pane.capture_pane() for pane in panes))
+
+
+def test_send_keys_many_literal(session: Session) -> None:
+    """``literal=True`` sends key names as text."""
+    window = session.active_window
+    panes = [window.split(shell="cat") for _ in range(2)]
+
+    session.server.send_keys_many(panes, "Escape", literal=True)
+
+    retry_until(lambda: all("Escape" in pane.capture_pane() for pane in panes))
+
+
+def test_send_keys_many_reports_failed_panes(session: Session) -> None:
+    """A missing pane is reported; the other panes still receive the keys."""
+    pane = session.active_window.split(shell="cat")
+
+    with pytest.raises(exc.BatchError) as excinfo:
+        session.server.send_keys_many(["%999999", pane], "still sent")
+
+    assert list(excinfo.value.errors) == ["%999999"]
+    assert excinfo.value.subcommand == "send-keys"
+    retry_until(lambda: "still sent" in pane.capture_pane())
+
+
+class CaptureManyFixture(t.NamedTuple):
+    """Keyword arguments for Server.capture_many and tmux calls expected."""
+
+    test_id: str
+    max_workers: int | None
+    invocations: int
+
+
+CAPTURE_MANY_FIXTURES: list[CaptureManyFixture] = [
+    CaptureManyFixture(test_id="single_invocation", max_workers=None, invocations=1),
+    CaptureManyFixture(test_id="thread_pool", max_workers=2, invocations=2),
+]
+
+
+@pytest.mark.parametrize(
+    list(CaptureManyFixture._fields),
+    CAPTURE_MANY_FIXTURES,
+    ids=[test.test_id for test in CAPTURE_MANY_FIXTURES],
+)
+def test_capture_many_matches_capture_pane(
+    test_id: str,
+    max_workers: int | None,
+    invocations: int,
+    server: Server,
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """capture_many returns what capture_pane does, keyed by pane, in order."""
+    window = session.active_window
+    panes = [window.split(shell="sh") for _ in range(4)]
+    window.select_layout("tiled")
+    for number, pane in enumerate(panes):
+        pane.send_keys(f"echo pane{number}; echo; echo end{number}", enter=True)
+    retry_until(
+        lambda: all(f"end{n}" in pane.capture_pane() for n, pane in enumerate(panes)),
+    )
+    expected = {pane.pane_id: pane.capture_pane() for pane in panes}
+    subcommands: list[str] = []
+    original_cmd = server.cmd
+
+    def recording_cmd(cmd: str, *args: t.Any, **kwargs: t.Any) -> tmux_cmd:
+        subcommands.append(cmd)
+        return original_cmd(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(server, "cmd", recording_cmd)
+    captures = server.capture_many(panes, max_workers=max_workers)
+
+    assert len(subcommands) == invocations
+    assert list(captures) == [pane.pane_id for pane in panes]
+    assert captures == expected
+
+
+def test_capture_many_reports_missing_panes(session: Session) -> None:
+    """A pane that is gone is reported by ID; the others are kept."""
+    pane = session.active_window.split()
+
+    with pytest.raises(exc.BatchError) as excinfo:
+        session.server.capture_many([pane, "%999999"])
+
+    assert list(excinfo.value.errors) == ["%999999"]
+    assert list(excinfo.value.results) == [pane.pane_id]
+
+
+@pytest.fixture
+def hit_panes(session: Session) -> list[Pane]:
+    """Three panes that printed ``hitN`` lines, pane 1 twice."""
+    window = session.active_window
+    panes = [window.split(shell="sh") for _ in range(3)]
+    window.select_layout("tiled")
+    for number, pane in enumerate(panes):
+        pane.send_keys(f"echo hit{number}; echo ok; echo hit{number}", enter=True)
+    retry_until(
+        lambda: all(
+            pane.capture_pane().count(f"hit{n}") == 2 for n, pane in enumerate(panes)
+        ),
+    )
+    return panes
+
+
+def test_grep_orders_hits_by_pane(
+    server: Server,
+    hit_panes: list[Pane],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Hits come back per pane in the order given, then by line."""
+    monkeypatch.setattr("libtmux._internal.pane_grep.GREP_BATCH", 1)
+    panes = list(reversed(hit_panes))
+
+    hits = server.grep(r"^hit\d$", scope=panes, max_workers=3)
+
+    assert [(hit.pane_id, hit.line) for hit in hits] == [
+        (pane.pane_id, f"hit{2 - n}") for n, pane in enumerate(panes) for _ in "ab"
+    ]
+    assert all(
+        panes[0].capture_pane(start="-")[hit.line_no] == hit.line
+        for hit in hits
+        if hit.pane_id == panes[0].pane_id
+    )
+
+
+def test_grep_first_stops_capturing(
+    server: Server,
+    hit_panes: list[Pane],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """First-match mode returns one hit without capturing later panes."""
+    monkeypatch.setattr("libtmux._internal.pane_grep.GREP_BATCH", 1)
+    captured: list[str] = []
+    original_capture_many = server.capture_many
+
+    def recording_capture_many(
+        panes: list[str],
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> dict[str, list[str]]:
+        captured.extend(panes)
+        return original_capture_many(panes, *args, **kwargs)
+
+    monkeypatch.setattr(server, "capture_many", recording_capture_many)
+    hits = server.grep("^hit1$", scope=hit_panes, first=True, max_workers=1)
+
+    assert [hit.line for hit in hits] == ["hit1"]
+    assert captured == [pane.pane_id for pane in hit_panes[:2]]
+
+
+def test_grep_skips_panes_closed_since_listing(
+    server: Server,
+    hit_panes: list[Pane],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A listed pane that closes before its capture is left out."""
+    monkeypatch.setattr("libtmux._internal.pane_grep.GREP_BATCH", 1)
+    original_pane_ids = libtmux.server._pane_ids
+    monkeypatch.setattr(
+        "libtmux.server._pane_ids",
+        lambda panes: [*original_pane_ids(panes), "%999999"],
+    )
+
+    hits = server.grep(r"^hit\d$", max_workers=2)
+
+    assert {hit.pane_id for hit in hits} == {pane.pane_id for pane in hit_panes}
+
+
+def test_grep_reports_missing_panes_with_hits(
+    server: Server,
+    hit_panes: list[Pane],
+) -> None:
+    """A pane given by the caller that is gone fails after the search."""
+    with pytest.raises(exc.BatchError) as excinfo:
+        server.grep(r"^hit0$", scope=["%999999", *hit_panes])
+
+    assert list(excinfo.value.errors) == ["%999999"]
+    assert [hit.pane_id for hit in excinfo.value.results] == [
+        hit_panes[0].pane_id,
+        hit_panes[0].pane_id,
+    ]
+
+
+def test_grep_prefilter_skips_panes(server: Server, hit_panes: list[Pane]) -> None:
+    """Panes failing tmux's own content search are not searched."""
+    hits = server.grep("hit", scope=hit_panes, prefilter="hit[02]")
+
+    assert {hit.pane_id for hit in hits} == {
+        hit_panes[0].pane_id,
+        hit_panes[2].pane_id,
+    }
+
+
+def test_bind_keys_round_trip(
+    server: Server,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Every default binding survives unbinding and one bind_keys() call."""
+    server.new_session()
+    original = server.key_table()
+    assert len(original) > 100
+
+    server.unbind_key(all_keys=True)
+    assert ("prefix", "c") not in server.key_table()
+
+    calls: list[tuple[t.Any, ...]] = []
+    original_cmd = server.cmd
+
+    def recording_cmd(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        calls.append(args)
+        return original_cmd(*args, **kwargs)
+
+    monkeypatch.setattr(server, "cmd", recording_cmd)
+    server.bind_keys(original.values(), replace=True)
+    monkeypatch.undo()
+
+    assert len(calls) < len(original) / 20
+    assert dict(server.key_table()) == dict(original)
+
+
+def test_bind_keys_replace_and_errors(server: Server) -> None:
+    """Replacing empties the table first; rejected bindings are reported."""
+    server.new_session()
+    server.bind_key("F1", "display-message old", key_table="custom")
+
+    with pytest.raises(exc.BatchError) as excinfo:
+        server.bind_keys(
+            {"F2": "display-message new", "F3": "no-such-command"},
+            key_table="custom",
+            replace=True,
+        )
+
+    assert list(excinfo.value.errors) == ["custom:F3"]
+    assert list(server.key_table().table("custom")) == ["F2"]
+    server.cmd("bind-key", "-T", "custom", "F4", "display-message outside")
+    assert list(server.key_table().table("custom")) == ["F2"]
+    assert list(server.key_table(refresh=True).table("custom")) == ["F2", "F4"]
+
+
+def test_evaluate_formats_one_invocation(
+    server: Server,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Formats for every pane, window and session come from one tmux call."""
+    session = server.new_session()
+    window = session.active_window
+    panes = [window.split() for _ in range(3)]
+    for pane in panes:
+        pane.refresh()
+    panes[-1].select()
+    formats = {f"f{index}": f"#{{pane_index}}-{index}" for index in range(10)}
+    formats["session"] = "#{session_name}"
+
+    calls: list[tuple[t.Any, ...]] = []
+    original_cmd = server.cmd
+
+    def recording_cmd(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        calls.append(args)
+        return original_cmd(*args, **kwargs)
+
+    monkeypatch.setattr(server, "cmd", recording_cmd)
+    values = server.evaluate_formats([*panes, window, session], formats)
+    monkeypatch.undo()
+
+    assert len(calls) == 1
+    assert list(values) == [
+        *(pane.pane_id for pane in panes),
+        window.window_id,
+        session.session_id,
+    ]
+    for pane in panes:
+        pane_values = values[str(pane.pane_id)]
+        assert pane_values["f9"] == f"{pane.pane_index}-9"
+        assert pane_values["session"] == session.name
+    assert values[str(window.window_id)]["f0"] == f"{panes[-1].pane_index}-0"
+    assert set(server.evaluate_formats(None, {"id": "#{pane_id}"})) == {
+        pane.pane_id for pane in server.panes
+    }
+
+
+def test_evaluate_formats_values_and_errors(server: Server) -> None:
+    """Values keep newlines and separators; unknown targets are reported."""
+    session = server.new_session()
+    session.set_option("@note", "one\ntwo␞three")
+    assert session.session_id is not None
+
+    values = server.evaluate_formats(
+        [session.session_id],
+        {"note": "#{@note}", "empty": "#{@unset}"},
+    )
+    assert values == {session.session_id: {"note": "one\ntwo␞three", "empty": ""}}
+
+    with pytest.raises(exc.BatchError) as excinfo:
+        server.evaluate_formats(
+            [session.session_id, "%999999", "main"],
+            {"name": "#{session_name}"},
+        )
+    assert excinfo.value.errors == {
+        "%999999": "can't find pane: %999999",
+        "main": "not a session, window or pane ID",
+    }